@@ -12,7 +12,7 @@ import pickle
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from tennis_api.cache.cache_manager import CacheManager, MemoryCache
+from tennis_api.cache.cache_manager import CacheManager, MemoryCache, _CODEC_RAW, _entry_tag
 
 
 def test_ttl_expiry_boundary():
@@ -125,12 +125,13 @@ def test_cache_integrity_validation():
         corrupted_entry = {
             'data': 'test_data',
             'timestamp': datetime.now(),
-            'data_type': 'test_type',
-            'key': 'different_key'  # Wrong key!
+            'key': 'different_key'
         }
         
         cache_path.parent.mkdir(parents=True, exist_ok=True)
         with open(cache_path, 'wb') as f:
+            f.write(_entry_tag('different_key', 'test_type'))  # Wrong key!
+            f.write(_CODEC_RAW)
             pickle.dump(corrupted_entry, f)
         
         # Should detect corruption and return None
@@ -162,11 +163,12 @@ def test_warmup_force_behavior():
         expired_entry = {
             'data': 'expired_data',
             'timestamp': datetime.now() - timedelta(seconds=2),
-            'data_type': 'test_type',
             'key': 'expired_key'
         }
         
         with open(expired_path, 'wb') as f:
+            f.write(_entry_tag('expired_key', 'test_type'))
+            f.write(_CODEC_RAW)
             pickle.dump(expired_entry, f)
         
         # Run warmup with force=True
@@ -16,6 +16,7 @@ from .http_adapter import (
     get_async,
     post,
     post_async,
+    close_shared_async_client,
 )
 
 __all__ = [
@@ -29,4 +30,5 @@ __all__ = [
     'get_async',
     'post', 
     'post_async',
+    'close_shared_async_client',
 ]
\ No newline at end of file
@@ -10,13 +10,26 @@ This module documents why both HTTP libraries are required:
 - aiohttp: For asynchronous operations providing better performance and concurrent request handling
 """
 
+import asyncio
+import atexit
 import json
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, AsyncGenerator, Tuple
 
 import aiohttp
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Connections kept per host by the requests session, and connection-level
+# retries before a request fails
+_POOL_SIZE = 50
+_MAX_RETRIES = 3
+
 
 class HTTPResponse:
     """Unified response object for both sync and async HTTP operations"""
@@ -31,7 +44,11 @@ class HTTPResponse:
     def json(self) -> Dict[str, Any]:
         """Parse response as JSON"""
         if self._json_data is None:
-            self._json_data = json.loads(self.text)
+            # orjson parses the raw bytes directly, skipping the text decode
+            if orjson is not None:
+                self._json_data = orjson.loads(self.content or self.text)
+            else:
+                self._json_data = json.loads(self.text)
         return self._json_data
     
     @property
@@ -74,6 +91,11 @@ class RequestsAdapter(HTTPAdapter):
     def __init__(self, timeout: int = 30, headers: Optional[Dict[str, str]] = None):
         self.session: Optional[requests.Session] = requests.Session()
         self.timeout = timeout
+        pool = requests.adapters.HTTPAdapter(
+            pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=_MAX_RETRIES
+        )
+        self.session.mount('http://', pool)
+        self.session.mount('https://', pool)
         if headers and self.session:
             self.session.headers.update(headers)
     
@@ -105,15 +127,23 @@ class RequestsAdapter(HTTPAdapter):
 class AiohttpAdapter(AsyncHTTPAdapter):
     """Asynchronous HTTP adapter using aiohttp library"""
     
-    def __init__(self, timeout: int = 30, headers: Optional[Dict[str, str]] = None):
+    def __init__(self, timeout: int = 30, headers: Optional[Dict[str, str]] = None,
+                 limit: int = 10, limit_per_host: int = 5, keepalive_timeout: float = 15.0):
         self._session = None
         self.timeout = timeout
         self.headers = headers or {}
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self._session is None or self._session.closed:
-            connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
             timeout_obj = aiohttp.ClientTimeout(total=self.timeout)  # type: ignore
             self._session = aiohttp.ClientSession(
                 connector=connector,
@@ -169,9 +199,10 @@ class UnifiedHTTPClient:
     - Async methods use aiohttp for better performance in concurrent scenarios
     """
     
-    def __init__(self, timeout: int = 30, headers: Optional[Dict[str, str]] = None):
+    def __init__(self, timeout: int = 30, headers: Optional[Dict[str, str]] = None,
+                 async_adapter: Optional[AiohttpAdapter] = None):
         self.sync_adapter = RequestsAdapter(timeout, headers)
-        self.async_adapter = AiohttpAdapter(timeout, headers)
+        self.async_adapter = async_adapter or AiohttpAdapter(timeout, headers)
     
     def get(self, url: str, **kwargs) -> HTTPResponse:
         """Synchronous GET request"""
@@ -222,26 +253,84 @@ class UnifiedHTTPClient:
         await self.close_async()
 
 
+# Client behind the synchronous convenience functions, created on first use
+# so repeated calls reuse its pooled connections
+_default_client: Optional[UnifiedHTTPClient] = None
+_default_client_lock = threading.Lock()
+
+
+def _get_default_client() -> UnifiedHTTPClient:
+    """Return the shared client, creating it on first use"""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = UnifiedHTTPClient()
+                atexit.register(_default_client.close)
+    return _default_client
+
+
+# Clients behind the async convenience functions, one per event loop since an
+# aiohttp session only works on the loop that created it. Each entry also holds
+# the loop's closer generator (see _close_on_loop_shutdown); the session refers
+# to the loop, so entries are removed explicitly rather than by weak reference
+_shared_async_clients: Dict[asyncio.AbstractEventLoop, Tuple[UnifiedHTTPClient, AsyncGenerator[None, None]]] = {}
+
+
+async def _close_on_loop_shutdown(loop: asyncio.AbstractEventLoop, client: UnifiedHTTPClient):
+    """
+    Close a loop's shared client when the loop shuts down
+    
+    Once started, the loop tracks this generator like any other async
+    generator, and asyncio.run() (or loop.shutdown_asyncgens()) closes it
+    before closing the loop, which runs the cleanup below on the loop.
+    """
+    try:
+        yield
+    finally:
+        _shared_async_clients.pop(loop, None)
+        await client.close_async()
+        client.close()
+
+
+async def _get_shared_async_client() -> UnifiedHTTPClient:
+    """Return the running loop's shared client, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    entry = _shared_async_clients.get(loop)
+    if entry is None:
+        async_adapter = AiohttpAdapter(limit=100, limit_per_host=30, keepalive_timeout=75)
+        client = UnifiedHTTPClient(async_adapter=async_adapter)
+        closer = _close_on_loop_shutdown(loop, client)
+        await closer.asend(None)
+        entry = _shared_async_clients[loop] = (client, closer)
+    return entry[0]
+
+
+async def close_shared_async_client():
+    """Close the running loop's shared async client now instead of at loop shutdown"""
+    entry = _shared_async_clients.get(asyncio.get_running_loop())
+    if entry is not None:
+        await entry[1].aclose()
+
+
 # Convenience functions for quick usage
 def get(url: str, **kwargs) -> HTTPResponse:
     """Quick synchronous GET request"""
-    with UnifiedHTTPClient() as client:
-        return client.get(url, **kwargs)
+    return _get_default_client().get(url, **kwargs)
 
 
 async def get_async(url: str, **kwargs) -> HTTPResponse:
     """Quick asynchronous GET request"""
-    async with UnifiedHTTPClient() as client:
-        return await client.get_async(url, **kwargs)
+    client = await _get_shared_async_client()
+    return await client.get_async(url, **kwargs)
 
 
 def post(url: str, **kwargs) -> HTTPResponse:
     """Quick synchronous POST request"""
-    with UnifiedHTTPClient() as client:
-        return client.post(url, **kwargs)
+    return _get_default_client().post(url, **kwargs)
 
 
 async def post_async(url: str, **kwargs) -> HTTPResponse:
     """Quick asynchronous POST request"""
-    async with UnifiedHTTPClient() as client:
-        return await client.post_async(url, **kwargs)
\ No newline at end of file
+    client = await _get_shared_async_client()
+    return await client.post_async(url, **kwargs)
\ No newline at end of file
@@ -5,18 +5,142 @@ Intelligent caching system with TTL (Time To Live) based on data type.
 Different types of tennis data have different update frequencies and cache durations.
 """
 
+import contextlib
+import gc
+import hmac
 import logging
+import mmap
 import os
 import pickle
+import shutil
+import struct
 import tempfile
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, TypedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypedDict
 import hashlib
 
+try:
+    from xxhash import xxh3_128_hexdigest as _entry_hexdigest
+except ImportError:
+    def _entry_hexdigest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+try:
+    import lz4.frame as _lz4_frame
+except ImportError:
+    _lz4_frame = None
+
 logger = logging.getLogger(__name__)
 
+# Binary framed protocol: smallest files and fastest load for cache entries.
+# Framing needs protocol 4 or later; pickle.dump/load already dispatch to the
+# _pickle C accelerator where the interpreter provides one
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# File buffer size for reading cache entries; large enough that a typical
+# entry is read with a single system call
+_IO_BUFFER_SIZE = 1 << 16
+
+# Each cache file starts with a short digest of its (data_type, key) so a
+# mismatched file is rejected before any of it is unpickled
+_ENTRY_TAG_SIZE = 8
+
+
+def _entry_tag(key: str, data_type: str) -> bytes:
+    """Integrity tag identifying the entry a cache file belongs to"""
+    return hashlib.blake2b(f"{data_type}\x00{key}".encode(), digest_size=_ENTRY_TAG_SIZE).digest()
+
+
+# One byte after the tag says how the entry is stored. Pickles above the
+# threshold are lz4-compressed when lz4 is installed; tiny entries aren't
+# worth the frame overhead. Types with a registered schema skip pickle
+_CODEC_RAW = b'\x00'
+_CODEC_LZ4 = b'\x01'
+_CODEC_SCHEMA = b'\x02'
+_COMPRESS_THRESHOLD = 1024
+_PAYLOAD_OFFSET = _ENTRY_TAG_SIZE + 1
+
+# Schema entries: timestamp in microseconds since the epoch and key length,
+# then the UTF-8 key and the schema's packed data
+_SCHEMA_HEADER = struct.Struct('<qI')
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# (pack, unpack) pair registered for a data type
+Schema = Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]
+
+# Entries above this size are unpickled straight from a memory map of the
+# file instead of being copied through the read buffer
+_MMAP_THRESHOLD = 1 << 14
+
+
+def _encode_body(raw: bytes) -> bytes:
+    """Codec byte followed by the pickled entry, compressed when worthwhile"""
+    if _lz4_frame is not None and len(raw) > _COMPRESS_THRESHOLD:
+        return _CODEC_LZ4 + _lz4_frame.compress(raw, compression_level=0)
+    return _CODEC_RAW + raw
+
+
+def _encode_schema_body(key: str, data: Any, timestamp: datetime, pack: Callable[[Any], bytes]) -> bytes:
+    """Codec byte followed by a schema-packed entry"""
+    key_bytes = key.encode()
+    try:
+        packed = pack(data)
+    except (struct.error, ValueError) as e:
+        raise pickle.PicklingError(f"schema could not pack data: {e}") from e
+    micros = (timestamp - _EPOCH) // _MICROSECOND
+    return _CODEC_SCHEMA + _SCHEMA_HEADER.pack(micros, len(key_bytes)) + key_bytes + packed
+
+
+def _decode_body(codec: bytes, body, schema: Optional[Schema] = None) -> Dict[str, Any]:
+    """Rebuild the entry dict from a body stored with the given codec"""
+    if codec == _CODEC_RAW:
+        return pickle.loads(body)
+    if codec == _CODEC_LZ4 and _lz4_frame is not None:
+        return pickle.loads(_lz4_frame.decompress(body))
+    if codec == _CODEC_SCHEMA and schema is not None:
+        try:
+            micros, key_len = _SCHEMA_HEADER.unpack_from(body)
+            start = _SCHEMA_HEADER.size
+            return {
+                'data': schema[1](bytes(body[start + key_len:])),
+                'timestamp': _EPOCH + micros * _MICROSECOND,
+                'key': bytes(body[start:start + key_len]).decode(),
+            }
+        except (struct.error, ValueError, IndexError) as e:
+            raise pickle.UnpicklingError(f"corrupt schema entry: {e}") from e
+    raise pickle.UnpicklingError(f"unsupported cache codec {codec!r}")
+
+
+def _load_entry(f, schema: Optional[Schema] = None) -> Dict[str, Any]:
+    """Decode the cache entry that follows the tag in an open cache file"""
+    if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+        f.seek(_ENTRY_TAG_SIZE)
+        codec = f.read(1)
+        if codec == _CODEC_RAW:
+            return pickle.load(f)
+        return _decode_body(codec, f.read(), schema)
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # The view must be released before the map can close
+        with memoryview(mm) as view:
+            return _decode_body(view[_ENTRY_TAG_SIZE:_PAYLOAD_OFFSET].tobytes(), view[_PAYLOAD_OFFSET:], schema)
+
+
+@contextlib.contextmanager
+def _no_gc():
+    """Pause the cyclic garbage collector for a batch of unpickling"""
+    # Unpickling allocates many container objects at once, which would
+    # otherwise trigger repeated gen-0 collections mid-batch
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
 
 class CacheSizeInfo(TypedDict):
     """Type definition for cache size information"""
@@ -30,16 +154,51 @@ class CacheSizeInfo(TypedDict):
     writes: int
 
 
+class CacheStats:
+    """Cache hit/miss counters as plain attributes; readable by name like a dict"""
+    
+    __slots__ = ('hits', 'misses', 'expired', 'writes', 'pickle_errors')
+    
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.writes = 0
+        self.pickle_errors = 0
+    
+    def __getitem__(self, name: str) -> int:
+        if name not in self.__slots__:
+            raise KeyError(name)
+        return getattr(self, name)
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Counters keyed by name"""
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __repr__(self) -> str:
+        return f"CacheStats({self.to_dict()})"
+
+
 class CacheManager:
     """Intelligent caching with TTL based on data type"""
     
-    def __init__(self, cache_dir: Optional[str] = None):
+    def __init__(self, cache_dir: Optional[str] = None,
+                 time_fn: Callable[[], datetime] = datetime.now,
+                 memory_cache_size: int = 1000):
         """
         Initialize cache manager
         
         Args:
             cache_dir: Directory to store cache files. Defaults to './cache'
+            time_fn: Clock used for timestamps and TTL checks
+            memory_cache_size: Entries kept in memory in front of the disk cache
         """
+        self._now = time_fn
+        
+        # Write-through layer checked before disk; values are (data, timestamp)
+        # so the disk TTL still applies to entries served from memory
+        self.memory_cache = MemoryCache(max_size=memory_cache_size, time_fn=time_fn)
+        
         if cache_dir is None:
             cache_dir = os.path.join(os.getcwd(), 'cache')
         
@@ -67,30 +226,93 @@ class CacheManager:
         }
         
         # Cache statistics
-        self.stats = {
-            'hits': 0,
-            'misses': 0,
-            'expired': 0,
-            'writes': 0
-        }
+        self.stats = CacheStats()
+        
+        # Compact codecs registered per data type, used instead of pickle
+        self._schemas: Dict[str, Schema] = {}
+        
+        # Size index: file name -> (type, bytes) plus running totals, built by
+        # the first get_cache_size() and kept current by this manager's writes
+        # and removals; None until then
+        self._index: Optional[Dict[str, Tuple[str, int]]] = None
+        self._type_counts: Counter = Counter()
+        self._total_bytes = 0
         
         self._cleanup_old_cache()
     
-    def _get_cache_path(self, key: str, data_type: str) -> Path:
-        """Generate cache file path for a key"""
-        # Create hash of key to handle long keys and special characters
-        key_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()
-        # Sanitize type for filenames
-        safe_type = "".join(
+    @staticmethod
+    def _safe_type(data_type: str) -> str:
+        """Data type with anything but alphanumerics, '-' and '_' replaced for filenames"""
+        return "".join(
             c if (c.isalnum() or c in ("-", "_")) else "_" 
             for c in data_type
         )
-        filename = f"{safe_type}_{key_hash}.cache"
+    
+    def _get_cache_path(self, key: str, data_type: str) -> Path:
+        """Generate cache file path for a key"""
+        # Hash type and key together so types that sanitize to the same
+        # name, or keys with special characters, never share a file
+        # (xxh3 when xxhash is installed, blake2b otherwise; both 128-bit hex)
+        entry_hash = _entry_hexdigest(f"{data_type}\x00{key}".encode("utf-8"))
+        filename = f"{self._safe_type(data_type)}_{entry_hash}.cache"
         return self.cache_dir / filename
+    
+    @staticmethod
+    def _file_data_type(cache_file: Path) -> str:
+        """Data type encoded in a cache file name"""
+        return cache_file.stem.rsplit('_', 1)[0]
+    
+    def _type_entries(self, data_type: str) -> List[os.DirEntry]:
+        """Directory entries of the cache files holding exactly this data type"""
+        # The hash suffix never contains '_', so the type is everything before
+        # the last one; a prefix match would also catch e.g. 'player_stats'
+        # when asked for 'player'. scandir hands back cached stat results, so
+        # callers needing mtimes don't pay a syscall per file
+        safe_type = self._safe_type(data_type)
+        with os.scandir(self.cache_dir) as it:
+            return [
+                entry for entry in it
+                if entry.name.endswith(".cache")
+                and entry.name[:-len(".cache")].rsplit('_', 1)[0] == safe_type
+            ]
+    
+    def _index_add(self, cache_file: Path, size: int):
+        """Record a written cache file in the size index"""
+        if self._index is None:
+            return
+        self._index_remove(cache_file)
+        data_type = self._file_data_type(cache_file)
+        self._index[cache_file.name] = (data_type, size)
+        self._type_counts[data_type] += 1
+        self._total_bytes += size
+    
+    def _index_remove(self, cache_file: Path):
+        """Drop a removed cache file from the size index"""
+        if self._index is None:
+            return
+        entry = self._index.pop(cache_file.name, None)
+        if entry is not None:
+            data_type, size = entry
+            self._type_counts[data_type] -= 1
+            if not self._type_counts[data_type]:
+                del self._type_counts[data_type]
+            self._total_bytes -= size
+    
+    def _rebuild_index(self):
+        """Rebuild the size index from the cache directory"""
+        self._index = {}
+        self._type_counts = Counter()
+        self._total_bytes = 0
         
+        for cache_file in self.cache_dir.glob("*.cache"):
+            try:
+                self._index_add(cache_file, cache_file.stat().st_size)
+            except (OSError, FileNotFoundError):
+                pass
+    
     def _cleanup_old_cache(self):
         """Remove expired cache files on startup based on TTL configuration"""
-        current_time = datetime.now()
+        current_time = self._now()
         grace_period = timedelta(hours=1)  # Grace period for cleanup
         
         for cache_file in self.cache_dir.glob("*.cache"):
@@ -135,50 +357,117 @@ class CacheManager:
         Returns:
             Cached data if valid, None if expired or not found
         """
+        ttl = self.cache_config.get(data_type, self.cache_config['default'])
+        
+        remembered = self.memory_cache.get(key, data_type)
+        if remembered is not None:
+            data, timestamp = remembered
+            if self._now() - timestamp <= ttl:
+                self.stats.hits += 1
+                return data
+            # Expired: drop it and let the disk path count and remove the file
+            self.memory_cache.delete(key, data_type)
+        
         cache_path = self._get_cache_path(key, data_type)
         
-        if not cache_path.exists():
-            self.stats['misses'] += 1
+        try:
+            file_mtime = cache_path.stat().st_mtime
+        except OSError:
+            self.stats.misses += 1
+            return None
+        
+        # set() stamps each file's mtime with the entry timestamp, so an
+        # expired entry can be discarded without reading it
+        if self._now() - datetime.fromtimestamp(file_mtime) > ttl:
+            self.stats.expired += 1
+            try:
+                cache_path.unlink()
+            except FileNotFoundError:
+                pass
+            self._index_remove(cache_path)
             return None
         
         try:
-            with open(cache_path, 'rb') as f:
-                cache_entry = pickle.load(f)
+            with open(cache_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                # Defensive validation: verify the tag before unpickling anything
+                tag_matches = hmac.compare_digest(f.read(_ENTRY_TAG_SIZE), _entry_tag(key, data_type))
+                cache_entry = _load_entry(f, self._schemas.get(data_type)) if tag_matches else None
             
-            # Defensive validation: verify cache entry integrity
-            if (cache_entry.get('key') != key or 
-                cache_entry.get('data_type') != data_type):
+            if not tag_matches:
                 # Cache file is corrupted or has wrong content
-                self.stats['misses'] += 1
+                self.stats.misses += 1
                 try:
                     cache_path.unlink()
+                    self._index_remove(cache_path)
                     logger.warning("Removed corrupted cache file with mismatched metadata: %s", cache_path.name)
                 except (OSError, FileNotFoundError):
                     pass
                 return None
             
             # Check if cache entry is still valid
-            ttl = self.cache_config.get(data_type, self.cache_config['default'])
-            if datetime.now() - cache_entry['timestamp'] > ttl:
+            if self._now() - cache_entry['timestamp'] > ttl:
                 # Cache expired
-                self.stats['expired'] += 1
+                self.stats.expired += 1
                 cache_path.unlink()  # Remove expired cache
+                self._index_remove(cache_path)
                 return None
             
-            self.stats['hits'] += 1
+            self.stats.hits += 1
+            self.memory_cache.set(key, (cache_entry['data'], cache_entry['timestamp']), data_type)
             return cache_entry['data']
             
         except (FileNotFoundError, pickle.PickleError, EOFError, AttributeError, TypeError, KeyError, OSError):
-            self.stats['misses'] += 1
+            self.stats.misses += 1
             # Try to clean up corrupted file
             try:
                 if cache_path.exists():
                     cache_path.unlink()
+                    self._index_remove(cache_path)
                     logger.debug("Removed corrupted cache file: %s", cache_path.name)
             except (OSError, FileNotFoundError):
                 pass
             return None
     
+    def _encode_entry(self, key: str, data: Any, data_type: str, timestamp: datetime) -> memoryview:
+        """Serialize one cache file: integrity tag, codec byte, then the entry"""
+        schema = self._schemas.get(data_type)
+        if schema is not None:
+            return memoryview(_entry_tag(key, data_type) + _encode_schema_body(key, data, timestamp, schema[0]))
+        
+        # The tag records the data type, so only the key is kept for warmup
+        cache_entry = {
+            'data': data,
+            'timestamp': timestamp,
+            'key': key
+        }
+        raw = pickle.dumps(cache_entry, protocol=_PICKLE_PROTOCOL)
+        return memoryview(_entry_tag(key, data_type) + _encode_body(raw))
+    
+    @staticmethod
+    def _write_fd(fd: int, payload: memoryview):
+        """Write a whole payload to an open file and flush it to disk"""
+        while payload:
+            payload = payload[os.write(fd, payload):]
+        try:
+            os.fsync(fd)
+        except OSError:
+            # If fsync fails, continue without it (not critical for cache)
+            pass
+    
+    def _publish(self, cache_path: Path, key: str, data: Any, data_type: str,
+                 timestamp: datetime, size: int):
+        """Record a cache file that has just been moved into place"""
+        # Stamp the entry time on the file for get()'s expiry fast path;
+        # without it get() still checks the timestamp after loading
+        entry_time = timestamp.timestamp()
+        try:
+            os.utime(cache_path, (entry_time, entry_time))
+        except OSError:
+            pass
+        self.stats.writes += 1
+        self._index_add(cache_path, size)
+        self.memory_cache.set(key, (data, timestamp), data_type)
+    
     def set(self, key: str, data: Any, data_type: str) -> None:
         """
         Cache data with appropriate TTL using atomic file writing
@@ -189,33 +478,29 @@ class CacheManager:
             data_type: Type of data for TTL lookup
         """
         cache_path = self._get_cache_path(key, data_type)
+        timestamp = self._now()
         
-        cache_entry = {
-            'data': data,
-            'timestamp': datetime.now(),
-            'data_type': data_type,
-            'key': key
-        }
+        # Serialize up front so unpicklable data fails before any file is created
+        try:
+            payload = self._encode_entry(key, data, data_type, timestamp)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            self.stats.pickle_errors += 1
+            logger.warning("Failed to cache data for key %s: %s", key, e)
+            return
+        size = len(payload)
         
         tmp_name = None
         try:
-            # Atomic write via temp file
-            with tempfile.NamedTemporaryFile(dir=self.cache_dir, delete=False) as tmp:
-                pickle.dump(cache_entry, tmp, protocol=pickle.HIGHEST_PROTOCOL)
-                tmp.flush()
-                # Handle potential file descriptor issues (e.g., in testing)
-                try:
-                    fileno = tmp.fileno()
-                    if isinstance(fileno, int):
-                        os.fsync(fileno)
-                except (TypeError, OSError, AttributeError):
-                    # If fsync fails, continue without it (not critical for cache)
-                    pass
-                tmp_name = tmp.name
+            # Atomic write via temp file: one write call for the whole entry
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir)
+            try:
+                self._write_fd(fd, payload)
+            finally:
+                os.close(fd)
             os.replace(tmp_name, cache_path)
-            self.stats['writes'] += 1
+            self._publish(cache_path, key, data, data_type, timestamp, size)
             
-        except (OSError, pickle.PickleError, AttributeError) as e:
+        except OSError as e:
             logger.warning("Failed to cache data for key %s: %s", key, e)
             # Best-effort cleanup of temp file
             try:
@@ -224,6 +509,62 @@ class CacheManager:
             except (OSError, NameError):
                 pass
     
+    def commit(self, entries: Dict[Tuple[str, str], Any]) -> int:
+        """
+        Cache a batch of entries so that either all of them or none become visible
+        
+        Every entry is serialized and written to a staging directory first;
+        only once all writes have succeeded are the files renamed into place.
+        A failure while staging leaves the cache untouched.
+        
+        Args:
+            entries: Data to cache keyed by (key, data_type)
+            
+        Returns:
+            Number of entries written
+        """
+        timestamp = self._now()
+        
+        try:
+            staged = [
+                (key, data_type, data, self._encode_entry(key, data, data_type, timestamp))
+                for (key, data_type), data in entries.items()
+            ]
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            self.stats.pickle_errors += 1
+            logger.warning("Failed to commit %d cache entries: %s", len(entries), e)
+            return 0
+        if not staged:
+            return 0
+        
+        written = 0
+        staging_dir = None
+        try:
+            # Same filesystem as the cache files, so each publish is a rename
+            staging_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix='.staging-')
+            staged_names = []
+            for _, _, _, payload in staged:
+                fd, tmp_name = tempfile.mkstemp(dir=staging_dir)
+                try:
+                    self._write_fd(fd, payload)
+                finally:
+                    os.close(fd)
+                staged_names.append(tmp_name)
+            
+            for tmp_name, (key, data_type, data, payload) in zip(staged_names, staged):
+                cache_path = self._get_cache_path(key, data_type)
+                os.replace(tmp_name, cache_path)
+                self._publish(cache_path, key, data, data_type, timestamp, len(payload))
+                written += 1
+                
+        except OSError as e:
+            logger.warning("Failed to commit %d cache entries: %s", len(staged), e)
+        finally:
+            if staging_dir is not None:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+        
+        return written
+    
     def invalidate(self, key: str, data_type: str) -> bool:
         """
         Manually invalidate cache entry
@@ -236,9 +577,11 @@ class CacheManager:
             True if cache was invalidated, False if not found
         """
         cache_path = self._get_cache_path(key, data_type)
+        self.memory_cache.delete(key, data_type)
         
         try:
             cache_path.unlink()
+            self._index_remove(cache_path)
             return True
         except FileNotFoundError:
             return False
@@ -253,24 +596,20 @@ class CacheManager:
         Returns:
             Number of entries invalidated
         """
+        safe_type = self._safe_type(data_type)
+        for memory_type, memory_key in list(self.memory_cache.cache):
+            if self._safe_type(memory_type) == safe_type:
+                self.memory_cache.delete(memory_key, memory_type)
+        
         count = 0
-
-        # Sanitize data_type to prevent glob metacharacter injection
-        safe_type = "".join(
-            c if (c.isalnum() or c in ("-", "_")) else "_" 
-            for c in data_type
-        )
-        prefix = f"{safe_type}_"
-
-        # Match only .cache files, then filter by the sanitized prefix
-        for cache_file in self.cache_dir.glob("*.cache"):
-            if not cache_file.name.startswith(prefix):
-                continue
+        for entry in self._type_entries(data_type):
+            cache_file = Path(entry.path)
             try:
                 cache_file.unlink()
                 count += 1
             except FileNotFoundError:
                 pass
+            self._index_remove(cache_file)
         
         return count
     
@@ -281,6 +620,8 @@ class CacheManager:
         Returns:
             Number of entries cleared
         """
+        self.memory_cache.clear()
+        
         count = 0
         for cache_file in self.cache_dir.glob("*.cache"):
             try:
@@ -289,42 +630,38 @@ class CacheManager:
             except FileNotFoundError:
                 pass
         
+        if self._index is not None:
+            self._index.clear()
+            self._type_counts.clear()
+            self._total_bytes = 0
+        
         return count
     
-    def get_cache_size(self) -> CacheSizeInfo:
+    def get_cache_size(self, cached: bool = True) -> CacheSizeInfo:
         """
         Get cache size information
         
+        Args:
+            cached: Answer from the in-memory size index, which tracks every
+                write and removal made through this manager; False rescans
+                the directory to pick up changes made by other processes
+        
         Returns:
             Dictionary with cache statistics
         """
-        total_files = 0
-        total_size = 0
-        type_counts = {}
-        
-        for cache_file in self.cache_dir.glob("*.cache"):
-            try:
-                total_files += 1
-                total_size += cache_file.stat().st_size
-                
-                # Extract data type from filename
-                parts = cache_file.stem.rsplit('_', 1)
-                if len(parts) >= 1:
-                    data_type = parts[0]
-                    type_counts[data_type] = type_counts.get(data_type, 0) + 1
-                    
-            except (OSError, FileNotFoundError):
-                pass
+        if not cached or self._index is None:
+            self._rebuild_index()
         
+        total_size = self._total_bytes
         result: CacheSizeInfo = {
-            'total_files': total_files,
+            'total_files': len(self._index),
             'total_size_bytes': total_size,
             'total_size_mb': round(total_size / (1024 * 1024), 2),
-            'type_counts': type_counts,
-            'hits': self.stats['hits'],
-            'misses': self.stats['misses'],
-            'expired': self.stats['expired'],
-            'writes': self.stats['writes']
+            'type_counts': dict(self._type_counts),
+            'hits': self.stats.hits,
+            'misses': self.stats.misses,
+            'expired': self.stats.expired,
+            'writes': self.stats.writes
         }
         return result
     
@@ -345,21 +682,19 @@ class CacheManager:
             return None
         
         try:
-            with open(cache_path, 'rb') as f:
-                cache_entry = pickle.load(f)
-            
-            # Validate cache entry integrity
-            if (cache_entry.get('key') != key or 
-                cache_entry.get('data_type') != data_type):
-                return None
+            with open(cache_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                # Validate cache entry integrity
+                if not hmac.compare_digest(f.read(_ENTRY_TAG_SIZE), _entry_tag(key, data_type)):
+                    return None
+                cache_entry = _load_entry(f, self._schemas.get(data_type))
             
             ttl = self.cache_config.get(data_type, self.cache_config['default'])
             expires_at = cache_entry['timestamp'] + ttl
-            is_expired = datetime.now() > expires_at
+            is_expired = self._now() > expires_at
             
             return {
-                'key': cache_entry['key'],
-                'data_type': cache_entry['data_type'],
+                'key': key,
+                'data_type': data_type,
                 'cached_at': cache_entry['timestamp'].isoformat(),
                 'expires_at': expires_at.isoformat(),
                 'is_expired': is_expired,
@@ -370,6 +705,21 @@ class CacheManager:
         except (FileNotFoundError, pickle.PickleError, EOFError, AttributeError, TypeError, KeyError, OSError):
             return None
     
+    def register_schema(self, data_type: str, pack_fn: Callable[[Any], bytes],
+                        unpack_fn: Callable[[bytes], Any]):
+        """
+        Store a data type with a compact codec instead of pickle
+        
+        Entries written before registration stay readable; entries written
+        with a schema are treated as corrupt by managers without it.
+        
+        Args:
+            data_type: Type of data
+            pack_fn: Turns cached data into bytes
+            unpack_fn: Rebuilds cached data from those bytes
+        """
+        self._schemas[data_type] = (pack_fn, unpack_fn)
+    
     def update_ttl_config(self, data_type: str, ttl: timedelta):
         """
         Update TTL configuration for a data type
@@ -393,28 +743,39 @@ class CacheManager:
         Returns:
             Summary of warmup operation
         """
-        pattern = f"{data_type}_*.cache"
         checked = 0
         expired = 0
         valid = 0
+        ttl = self.cache_config.get(data_type, self.cache_config['default'])
         
-        for cache_file in self.cache_dir.glob(pattern):
-            try:
-                with open(cache_file, 'rb') as f:
-                    cache_entry = pickle.load(f)
+        with _no_gc():
+            for entry in self._type_entries(data_type):
+                cache_file = Path(entry.path)
+                try:
+                    now = self._now()
+                    entry_key = None
                 
-                checked += 1
-                ttl = self.cache_config.get(data_type, self.cache_config['default'])
+                    # Files stamped past their TTL are expired without unpickling
+                    is_expired = now - datetime.fromtimestamp(entry.stat().st_mtime) > ttl
+                    if not is_expired:
+                        with open(cache_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                            cache_entry = _load_entry(f, self._schemas.get(data_type))
+                        entry_key = cache_entry.get('key')
+                        is_expired = now - cache_entry['timestamp'] > ttl
                 
-                if datetime.now() - cache_entry['timestamp'] > ttl:
-                    expired += 1
-                    if force:
-                        cache_file.unlink()
-                else:
-                    valid += 1
+                    checked += 1
+                    if is_expired:
+                        expired += 1
+                        if force:
+                            cache_file.unlink()
+                            self._index_remove(cache_file)
+                            if entry_key is not None:
+                                self.memory_cache.delete(entry_key, data_type)
+                    else:
+                        valid += 1
                     
-            except (FileNotFoundError, pickle.PickleError, KeyError, OSError):
-                pass
+                except (FileNotFoundError, pickle.PickleError, KeyError, OSError):
+                    pass
         
         return {
             'data_type': data_type,
@@ -428,14 +789,17 @@ class CacheManager:
 class MemoryCache:
     """Simple in-memory cache for frequently accessed data with true LRU eviction"""
     
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, time_fn: Callable[[], datetime] = datetime.now):
         """
         Initialize memory cache
         
         Args:
             max_size: Maximum number of entries to keep in memory
+            time_fn: Clock used for timestamps and TTL checks
         """
-        self.cache = OrderedDict()  # LRU ordering: least recent first
+        self._now = time_fn
+        # (data_type, key) -> (data, timestamp); LRU ordering: least recent first
+        self.cache: OrderedDict = OrderedDict()
         self.max_size = max_size
         
         # TTL for memory cache (shorter than disk cache)
@@ -449,57 +813,49 @@ class MemoryCache:
     def get(self, key: str, data_type: str) -> Optional[Any]:
         """Get data from memory cache"""
         ckey = (data_type, key)
-        if ckey not in self.cache:
+        entry = self.cache.get(ckey)
+        if entry is None:
             return None
         
-        entry = self.cache[ckey]
+        data, timestamp = entry
         ttl = self.memory_ttl.get(data_type, self.memory_ttl['default'])
         
-        if datetime.now() - entry['timestamp'] > ttl:
+        if self._now() - timestamp > ttl:
             # Expired - remove from cache
             del self.cache[ckey]
             return None
         
         # Move to end (most recently used) and return data
         self.cache.move_to_end(ckey)
-        return entry['data']
+        return data
         
     def set(self, key: str, data: Any, data_type: str):
         """Set data in memory cache"""
         ckey = (data_type, key)
         
-        # If key already exists, update it
-        if ckey in self.cache:
-            self.cache[ckey] = {
-                'data': data,
-                'timestamp': datetime.now(),
-                'data_type': data_type
-            }
-            self.cache.move_to_end(ckey)  # Move to end (most recently used)
-            return
+        # Insert or overwrite as the most recently used entry
+        self.cache[ckey] = (data, self._now())
+        self.cache.move_to_end(ckey)
         
-        # Remove oldest entries if at capacity
-        if len(self.cache) >= self.max_size:
-            self._evict_oldest()
-
-        # Add new entry at end (most recently used)
-        self.cache[ckey] = {
-            'data': data,
-            'timestamp': datetime.now(),
-            'data_type': data_type
-        }
+        # Evict least recently used entries beyond capacity
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
     
-    def _evict_oldest(self):
-        """Remove oldest entries to make room using true LRU"""
-        if not self.cache:
-            return
-        
-        # Remove the 10% oldest entries (or at least 1)
-        num_to_remove = max(1, len(self.cache) // 10)
-        
-        for _ in range(num_to_remove):
-            if self.cache:
-                self.cache.popitem(last=False)  # Remove least recently used
+    def set_many(self, items: Iterable[Tuple[str, Any, str]]):
+        """Set several (key, data, data_type) entries, trimming to capacity once"""
+        cache = self.cache
+        now = self._now()
+        for key, data, data_type in items:
+            ckey = (data_type, key)
+            cache[ckey] = (data, now)
+            cache.move_to_end(ckey)
+        
+        while len(cache) > self.max_size:
+            cache.popitem(last=False)
+    
+    def delete(self, key: str, data_type: str) -> bool:
+        """Remove one entry, returning whether it was present"""
+        return self.cache.pop((data_type, key), None) is not None
     
     def clear(self):
         """Clear memory cache"""
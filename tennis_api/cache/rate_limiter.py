@@ -19,6 +19,14 @@ from collections import defaultdict, deque
 UsageDict = Dict[str, Any]  # Contains both int counters and datetime last_reset dict
 HistoryDict = Dict[str, Deque[datetime]]
 
+# Length of each tracked usage window
+_PERIOD_DURATIONS = (
+    ('minute', timedelta(minutes=1)),
+    ('hour', timedelta(hours=1)),
+    ('day', timedelta(days=1)),
+    ('month', timedelta(days=30)),
+)
+
 
 class RateLimiter:
     """Intelligent rate limiting across multiple APIs"""
@@ -104,6 +112,11 @@ class RateLimiter:
         # Global lock for shared data structures (limits, priority_weights)
         self._global_lock = threading.RLock()
         
+        # Serializes state file writes so they happen outside the per-API locks;
+        # _save_pending marks a save that was skipped while another was running
+        self._save_lock = threading.Lock()
+        self._save_pending = False
+        
         # Priority queue for different request types
         self.priority_weights = {
             'critical': 1.0,    # Tournament draws, live matches
@@ -176,36 +189,68 @@ class RateLimiter:
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             self.logger.error(f"Error loading rate limiter state: {e}")
     
-    def _save_state(self):
-        """Save rate limiter state to file"""
+    def _save_state(self, wait: bool = True):
+        """
+        Save rate limiter state to file
+        
+        Takes each API lock in turn, so callers must not hold an API lock
+        or the global lock.
+        
+        Args:
+            wait: Block until any save already in progress finishes; when
+                False, leave this save to the one in progress, which writes
+                again once it is done
+        """
+        self._save_pending = True
+        while True:
+            if not self._save_lock.acquire(blocking=wait):
+                # The holder checks _save_pending after releasing the lock
+                return
+            try:
+                self._save_pending = False
+                self._write_state()
+            finally:
+                self._save_lock.release()
+            if not self._save_pending:
+                return
+    
+    def _write_state(self):
+        """Snapshot the usage counters and history and write them to the state file"""
         state = {
             'usage': {},
             'request_history': {},
             'last_saved': datetime.now().isoformat()
         }
         
-        # Save usage counters
-        for api_name, api_usage in self.usage.items():
-            state['usage'][api_name] = {
-                'minute': api_usage['minute'],
-                'hour': api_usage['hour'],
-                'day': api_usage['day'],
-                'month': api_usage['month'],
-                'last_reset': {
-                    period: timestamp.isoformat() 
-                    for period, timestamp in api_usage['last_reset'].items()
+        # Copy each API's counters and recent history (last 100 requests
+        # per period) under its own lock, then serialize without holding it
+        for api_name in list(self.usage.keys()):
+            with self.api_locks[api_name]:
+                api_usage = self.usage[api_name]
+                state['usage'][api_name] = {
+                    'minute': api_usage['minute'],
+                    'hour': api_usage['hour'],
+                    'day': api_usage['day'],
+                    'month': api_usage['month'],
+                    'last_reset': dict(api_usage['last_reset'])
+                }
+        
+        for api_name in list(self.request_history.keys()):
+            with self.api_locks[api_name]:
+                state['request_history'][api_name] = {
+                    period: list(timestamps)[-100:]
+                    for period, timestamps in self.request_history[api_name].items()
                 }
+        
+        for api_usage in state['usage'].values():
+            api_usage['last_reset'] = {
+                period: timestamp.isoformat()
+                for period, timestamp in api_usage['last_reset'].items()
             }
         
-        # Save recent request history (last 100 requests per period)
-        for api_name, api_history in self.request_history.items():
-            state['request_history'][api_name] = {}
+        for api_history in state['request_history'].values():
             for period, timestamps in api_history.items():
-                # Keep only recent timestamps
-                recent_timestamps = list(timestamps)[-100:]
-                state['request_history'][api_name][period] = [
-                    ts.isoformat() for ts in recent_timestamps
-                ]
+                api_history[period] = [ts.isoformat() for ts in timestamps]
         
         try:
             with open(self.state_file, 'w') as f:
@@ -236,14 +281,7 @@ class RateLimiter:
             usage = self.usage[api_name]
             
             # Check each time period
-            periods = {
-                'minute': timedelta(minutes=1),
-                'hour': timedelta(hours=1),
-                'day': timedelta(days=1),
-                'month': timedelta(days=30)
-            }
-            
-            for period, duration in periods.items():
+            for period, duration in _PERIOD_DURATIONS:
                 if now - usage['last_reset'][period] >= duration:
                     usage[period] = 0
                     usage['last_reset'][period] = now
@@ -359,9 +397,13 @@ class RateLimiter:
             for period in ['minute', 'hour', 'day', 'month']:
                 history[period].append(now)
             
-            # Save state periodically
-            if usage['minute'] % 5 == 0:  # Save every 5 requests
-                self._save_state()
+            # Save state periodically (every 5 requests)
+            save_due = usage['minute'] % 5 == 0
+        
+        # Write the state file after releasing the lock so other callers
+        # aren't held up by disk I/O; a save already under way writes again
+        if save_due:
+            self._save_state(wait=False)
         
         return True
     
@@ -479,8 +521,29 @@ class RateLimiter:
                 for p in ['minute', 'hour', 'day', 'month']:
                     self.usage[api_name][p] = 0
                     self.usage[api_name]['last_reset'][p] = now
-            
-            self._save_state()
+        
+        self._save_state()
+    
+    def reset(self):
+        """
+        Clear usage counters and request history for every API
+        
+        Limits and priority weights are kept, so a limiter can be reused
+        from a clean slate instead of being rebuilt.
+        """
+        now = datetime.now()
+        for api_name in set(self.usage) | set(self.request_history):
+            with self.api_locks[api_name]:
+                if api_name in self.usage:
+                    usage = self.usage[api_name]
+                    for period, _ in _PERIOD_DURATIONS:
+                        usage[period] = 0
+                        usage['last_reset'][period] = now
+                if api_name in self.request_history:
+                    for timestamps in self.request_history[api_name].values():
+                        timestamps.clear()
+        
+        self._save_state()
     
     def add_api_config(self, api_name: str, config: Dict):
         """
@@ -521,8 +584,9 @@ class RateLimiter:
             # Create API-specific lock if it doesn't exist
             if api_name not in self.api_locks:
                 self.api_locks[api_name] = threading.RLock()
-            
-            self._save_state()
+        
+        # Saving takes each API lock, so it must not run under the global lock
+        self._save_state()
     
     def get_recommended_delay(self, api_name: str, priority: str = 'normal') -> float:
         """
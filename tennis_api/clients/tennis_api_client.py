@@ -7,7 +7,7 @@ fallback mechanisms, load balancing, and unified data aggregation.
 
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from .base_client import APIException, RateLimitException
@@ -69,6 +69,11 @@ class TennisAPIClient:
             'cache_hits': 0,
             'api_errors': {}
         }
+        
+        # Per-client stats are rebuilt only after a sub-client call or health
+        # reset bumps the version
+        self._stats_version = 0
+        self._client_stats_snapshot: Optional[Tuple[int, Dict]] = None
     
     def _initialize_clients(self):
         """Initialize all API clients"""
@@ -146,6 +151,13 @@ class TennisAPIClient:
                 health['is_healthy'] = False
                 logger.warning(f"Client {client_name} marked as unhealthy")
     
+    async def _call_client(self, client_name: str, method: str, *args):
+        """Await a sub-client method, marking client stats as changed afterwards"""
+        try:
+            return await getattr(self.clients[client_name], method)(*args)
+        finally:
+            self._stats_version += 1
+    
     def _get_healthy_clients(self) -> List[str]:
         """Get list of healthy clients in fallback order"""
         return [client for client in self.fallback_order 
@@ -193,10 +205,9 @@ class TennisAPIClient:
                 continue
                 
             try:
-                client = self.clients[client_name]
                 logger.info(f"Attempting to get player stats for {player_name} from {client_name}")
                 
-                player_stats = await client.get_player_stats(player_name)
+                player_stats = await self._call_client(client_name, 'get_player_stats', player_name)
                 
                 # Update health and stats
                 self._update_client_health(client_name, True)
@@ -259,10 +270,9 @@ class TennisAPIClient:
                 continue
                 
             try:
-                client = self.clients[client_name]
                 logger.info(f"Attempting to get tournament draw {tournament_id} from {client_name}")
                 
-                tournament_draw = await client.get_tournament_draw(tournament_id)
+                tournament_draw = await self._call_client(client_name, 'get_tournament_draw', tournament_id)
                 
                 self._update_client_health(client_name, True)
                 self.stats['successful_requests'] += 1
@@ -321,10 +331,9 @@ class TennisAPIClient:
                 continue
                 
             try:
-                client = self.clients[client_name]
                 logger.info(f"Attempting to get {tour} rankings from {client_name}")
                 
-                rankings = await client.get_rankings(tour)
+                rankings = await self._call_client(client_name, 'get_rankings', tour)
                 
                 self._update_client_health(client_name, True)
                 self.stats['successful_requests'] += 1
@@ -390,7 +399,7 @@ class TennisAPIClient:
                 if hasattr(client, 'get_head_to_head'):
                     logger.info(f"Attempting to get H2H {player1_name} vs {player2_name} from {client_name}")
                     
-                    h2h = await client.get_head_to_head(player1_name, player2_name)
+                    h2h = await self._call_client(client_name, 'get_head_to_head', player1_name, player2_name)
                     
                     self._update_client_health(client_name, True)
                     self.stats['successful_requests'] += 1
@@ -421,19 +430,25 @@ class TennisAPIClient:
             raise APIException("Live API client not available")
         
         try:
-            return await self.clients['live'].get_live_matches()
+            return await self._call_client('live', 'get_live_matches')
         except Exception as e:
             raise APIException(f"Failed to get live matches: {e}")
     
     def get_client_stats(self) -> Dict:
         """Get comprehensive statistics for all clients"""
-        client_stats = {}
-        
-        for client_name, client in self.clients.items():
-            client_stats[client_name] = {
-                **client.get_stats(),
-                'health': self.client_health[client_name]
-            }
+        snapshot = self._client_stats_snapshot
+        if snapshot is not None and snapshot[0] == self._stats_version:
+            client_stats = snapshot[1]
+        else:
+            client_stats = {}
+            
+            for client_name, client in self.clients.items():
+                client_stats[client_name] = {
+                    **client.get_stats(),
+                    'health': self.client_health[client_name]
+                }
+            
+            self._client_stats_snapshot = (self._stats_version, client_stats)
         
         return {
             'global_stats': self.stats,
@@ -454,6 +469,8 @@ class TennisAPIClient:
                 self.client_health[name]['is_healthy'] = True
                 self.client_health[name]['consecutive_failures'] = 0
             logger.info("Reset health for all clients")
+        
+        self._stats_version += 1
     
     async def health_check(self) -> Dict[str, bool]:
         """Perform health check on all clients"""
@@ -463,7 +480,7 @@ class TennisAPIClient:
             try:
                 # Try a simple operation to check health
                 if hasattr(client, 'get_rankings'):
-                    await client.get_rankings('atp')
+                    await self._call_client(client_name, 'get_rankings', 'atp')
                     health_status[client_name] = True
                     self._update_client_health(client_name, True)
                 else:
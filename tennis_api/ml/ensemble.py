@@ -16,7 +16,8 @@ import statistics
 
 from .prediction_models import OutcomePredictor, ScorePredictor, UpsetDetector, PredictionResult, ModelType
 from .feature_engineering import FeatureExtractor, FeatureConfig
-from ..models.enhanced_player import PlayerEnhanced, PerformanceContext
+from ..models.enhanced_player import PlayerEnhanced
+from ..models.ai_player import PerformanceContext
 
 
 class EnsembleMethod(Enum):
@@ -132,8 +133,10 @@ class PredictionEnsemble:
         self.score_predictor = ScorePredictor()
         self.upset_detector = UpsetDetector()
         
-        # Ensemble state
+        # Ensemble state; model_version is bumped whenever training or loading
+        # replaces the models, so predictions cached from older models expire
         self.is_trained: bool = False
+        self.model_version: int = 0
         self.model_performances: Dict[str, Dict[str, float]] = {}
         self.ensemble_history: List[ComprehensivePrediction] = []
         
@@ -212,6 +215,7 @@ class PredictionEnsemble:
         self._calculate_ensemble_weights()
         
         self.is_trained = True
+        self.model_version += 1
         return training_results
     
     def predict_match(self, player1_data: Dict[str, Any], player2_data: Dict[str, Any], 
@@ -550,6 +554,8 @@ class PredictionEnsemble:
     
     def load_ensemble(self, file_path: str) -> None:
         """Load the entire ensemble from file"""
+        self.model_version += 1
+        
         # Load individual models
         try:
             self.outcome_predictor.load_model(f"{file_path}_outcome.joblib")
@@ -9,7 +9,7 @@ from importlib import import_module
 from typing import List
 
 # Explicit imports to satisfy linters while keeping lazy loading for performance
-from .player_stats import PlayerStats, SurfaceStats, ServeStatistics, ReturnStatistics
+from .player_stats import PlayerStats, SurfaceStats, ServeStatistics, ReturnStatistics, PlayerStatsTable
 from .enhanced_player import PlayerEnhanced, PhysicalCondition, MentalState, ContextualFactors
 from .ai_player import PlayerAI, MLModel, PerformanceContext
 from .tournament_data import TournamentDraw, Match
@@ -21,6 +21,7 @@ _EXPORTS = {
     "SurfaceStats": (".player_stats", "SurfaceStats"),
     "ServeStatistics": (".player_stats", "ServeStatistics"),
     "ReturnStatistics": (".player_stats", "ReturnStatistics"),
+    "PlayerStatsTable": (".player_stats", "PlayerStatsTable"),
     "PlayerEnhanced": (".enhanced_player", "PlayerEnhanced"),
     "PhysicalCondition": (".enhanced_player", "PhysicalCondition"),
     "MentalState": (".enhanced_player", "MentalState"),
@@ -39,6 +40,7 @@ __all__: List[str] = [
     "SurfaceStats", 
     "ServeStatistics",
     "ReturnStatistics",
+    "PlayerStatsTable",
     "PlayerEnhanced",
     "PhysicalCondition",
     "MentalState",
@@ -264,7 +264,7 @@ class PlayerAI(PlayerEnhanced):
     
     def __post_init__(self):
         """Initialize AI models after object creation"""
-        super().__post_init__ if hasattr(super(), '__post_init__') else lambda: None)()
+        (super().__post_init__ if hasattr(super(), '__post_init__') else lambda: None)()
         
         # Initialize training data structures
         for model_name in ['serve', 'return', 'mental', 'outcome', 'score', 'adaptation']:
@@ -147,6 +147,20 @@ class PlayerEnhanced:
     last_match_date: Optional[datetime] = None
     next_match_date: Optional[datetime] = None
     
+    # Bumped whenever a field in _VERSIONED_FIELDS is assigned, so derived
+    # data (e.g. the match engine's prediction inputs) can be cached; in-place
+    # edits to api_stats should bump it by hand
+    mutation_count: int = field(default=0, init=False, repr=False, compare=False)
+    
+    _VERSIONED_FIELDS = frozenset({
+        'name', 'api_stats', 'current_ranking', 'recent_form_factor', 'surface_preference'
+    })
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in PlayerEnhanced._VERSIONED_FIELDS:
+            object.__setattr__(self, 'mutation_count', self.__dict__.get('mutation_count', 0) + 1)
+    
     def calculate_form_factor(self, recent_matches: Optional[List[str]] = None) -> float:
         """
         Calculate recent form factor based on last 10 matches
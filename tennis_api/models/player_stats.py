@@ -5,10 +5,29 @@ Data classes for representing comprehensive player statistics retrieved from ten
 Includes serve statistics, return statistics, surface-specific performance, and more.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
+import sys
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 @dataclass
@@ -85,15 +104,28 @@ class SurfaceStats:
     serve_percentage: float = 0.6
     return_percentage: float = 0.3
     
+    # Memoized calculated_win_percentage (-1.0 = not yet computed)
+    _cached_win_percentage: float = field(default=-1.0, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        # Changing the record invalidates the memoized win percentage
+        if name == 'wins' or name == 'losses':
+            object.__setattr__(self, '_cached_win_percentage', -1.0)
+        object.__setattr__(self, name, value)
+    
     @property
     def total_matches(self) -> int:
         return self.wins + self.losses
     
     @property
     def calculated_win_percentage(self) -> float:
-        if self.total_matches == 0:
-            return 0.5
-        return self.wins / self.total_matches
+        if self._cached_win_percentage >= 0.0:
+            return self._cached_win_percentage
+        
+        total = self.total_matches
+        win_percentage = self.wins / total if total else 0.5
+        object.__setattr__(self, '_cached_win_percentage', win_percentage)
+        return win_percentage
     
     def to_dict(self) -> Dict:
         return {
@@ -121,6 +153,117 @@ class SurfaceStats:
         )
 
 
+
+class HeadToHeadTable(MutableMapping):
+    """
+    Head-to-head records (opponent_name -> (wins, losses)) in compact storage
+    
+    Behaves like a dict of (wins, losses) tuples, but keeps the records in a
+    two-column int16 array with an opponent -> row map instead of one tuple
+    of Python ints per opponent.
+    """
+    
+    def __init__(self, records=None):
+        self._rows: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._records = np.zeros((8, 2), dtype=np.int16)
+        if records:
+            self.update(records)
+    
+    def __getitem__(self, opponent: str) -> Tuple[int, int]:
+        wins, losses = self._records[self._rows[opponent]]
+        return int(wins), int(losses)
+    
+    def __setitem__(self, opponent: str, record):
+        row = self._rows.get(opponent)
+        if row is None:
+            row = len(self._names)
+            if row == len(self._records):
+                # Grow by doubling so repeated inserts stay amortized O(1)
+                grown = np.zeros((2 * row, 2), dtype=np.int16)
+                grown[:row] = self._records
+                self._records = grown
+            opponent = sys.intern(opponent)
+            self._rows[opponent] = row
+            self._names.append(opponent)
+        wins, losses = record
+        self._records[row] = (wins, losses)
+    
+    def __delitem__(self, opponent: str):
+        row = self._rows.pop(opponent)
+        last = len(self._names) - 1
+        if row != last:
+            # Move the last record into the freed row
+            moved = self._names[last]
+            self._names[row] = moved
+            self._rows[moved] = row
+            self._records[row] = self._records[last]
+        self._names.pop()
+    
+    def __contains__(self, opponent) -> bool:
+        return opponent in self._rows
+    
+    def __iter__(self):
+        return iter(self._rows)
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+    
+    def records_for(self, opponents: List[str]) -> np.ndarray:
+        """Get (wins, losses) rows for opponents, zeros for unknown opponents"""
+        rows = np.fromiter((self._rows.get(opponent, -1) for opponent in opponents),
+                           dtype=np.intp, count=len(opponents))
+        records = self._records[np.maximum(rows, 0)].astype(np.int32)
+        records[rows < 0] = 0
+        return records
+
+
+def _convert_datetime(value):
+    """Parse ISO datetime strings, passing through other values"""
+    if isinstance(value, str):
+        return _parse_datetime(value)
+    return value
+
+
+def _convert_serve_stats(value):
+    """Build ServeStatistics from its serialized dictionary"""
+    return ServeStatistics.from_dict(value) if isinstance(value, dict) else value
+
+
+def _convert_return_stats(value):
+    """Build ReturnStatistics from its serialized dictionary"""
+    return ReturnStatistics.from_dict(value) if isinstance(value, dict) else value
+
+
+def _convert_surface_stats(value):
+    """Build surface -> SurfaceStats mapping from serialized stats"""
+    if not isinstance(value, dict):
+        return value
+    return {surface: SurfaceStats.from_dict(stats) if isinstance(stats, dict) else stats
+            for surface, stats in value.items()}
+
+
+def _convert_head_to_head(value):
+    """Restore (wins, losses) tuples from serialized head-to-head lists"""
+    if not isinstance(value, dict):
+        return value
+    return {opponent: tuple(record) if isinstance(record, list) and len(record) == 2 else record
+            for opponent, record in value.items()}
+
+
+# from_dict converters: field name -> function restoring the model value
+_PLAYER_STATS_CONVERTERS = {
+    'last_updated': _convert_datetime,
+    'serve_stats': _convert_serve_stats,
+    'return_stats': _convert_return_stats,
+    'surface_stats': _convert_surface_stats,
+    'head_to_head': _convert_head_to_head,
+}
+
+
 @dataclass
 class PlayerStats:
     """Comprehensive player statistics from tennis APIs"""
@@ -150,7 +293,14 @@ class PlayerStats:
     last_updated: datetime = field(default_factory=datetime.now)
     
     # Head-to-head records (opponent_name -> (wins, losses))
-    head_to_head: Dict[str, tuple] = field(default_factory=dict)
+    head_to_head: HeadToHeadTable = field(default_factory=HeadToHeadTable)
+    
+    def __post_init__(self):
+        """Intern player names and store head-to-head records compactly"""
+        if isinstance(self.name, str):
+            self.name = sys.intern(self.name)
+        if not isinstance(self.head_to_head, HeadToHeadTable):
+            self.head_to_head = HeadToHeadTable(self.head_to_head)
     
     def calculate_form_factor(self) -> float:
         """Calculate recent form factor based on last 10 matches"""
@@ -170,10 +320,10 @@ class PlayerStats:
     
     def get_surface_multiplier(self, surface: str) -> float:
         """Get performance multiplier for specific surface"""
-        if surface.lower() not in self.surface_stats:
+        surface_performance = self.surface_stats.get(surface.lower())
+        if surface_performance is None:
             return 1.0
             
-        surface_performance = self.surface_stats[surface.lower()]
         baseline_win_rate = 0.5
         
         # Calculate multiplier based on surface win rate vs baseline
@@ -185,10 +335,11 @@ class PlayerStats:
     
     def get_head_to_head_factor(self, opponent_name: str) -> float:
         """Get head-to-head performance factor against specific opponent"""
-        if opponent_name not in self.head_to_head:
+        record = self.head_to_head.get(opponent_name)
+        if record is None:
             return 1.0
             
-        wins, losses = self.head_to_head[opponent_name]
+        wins, losses = record
         total = wins + losses
         
         if total == 0:
@@ -199,6 +350,24 @@ class PlayerStats:
         factor = 0.7 + (h2h_win_rate * 0.6)
         return max(0.5, min(1.5, factor))
     
+    def batch_h2h_factors(self, opponents: List[str]) -> np.ndarray:
+        """
+        Get head-to-head factors against several opponents at once
+        
+        Args:
+            opponents: Opponent names to look up
+            
+        Returns:
+            Array of head-to-head factors aligned with the opponents
+        """
+        records = self.head_to_head.records_for(opponents)
+        wins = records[:, 0]
+        totals = records.sum(axis=1)
+        
+        factors = np.clip(0.7 + 0.6 * wins / np.maximum(totals, 1), 0.5, 1.5)
+        factors[totals == 0] = 1.0
+        return factors
+    
     def update_recent_form(self, match_results: List[str]):
         """Update recent match results (W/L)"""
         self.recent_matches = match_results[-10:]  # Keep last 10 matches
@@ -240,52 +409,216 @@ class PlayerStats:
         # Make a copy to avoid modifying the original data
         data = data.copy()
         
-        # Handle datetime conversion
-        if 'last_updated' in data:
-            if isinstance(data['last_updated'], str):
-                data['last_updated'] = datetime.fromisoformat(data['last_updated'])
-        
-        # Handle nested objects
-        if 'serve_stats' in data and isinstance(data['serve_stats'], dict):
-            data['serve_stats'] = ServeStatistics.from_dict(data['serve_stats'])
-        
-        if 'return_stats' in data and isinstance(data['return_stats'], dict):
-            data['return_stats'] = ReturnStatistics.from_dict(data['return_stats'])
-        
-        if 'surface_stats' in data and isinstance(data['surface_stats'], dict):
-            surface_stats = {}
-            for surface, stats in data['surface_stats'].items():
-                if isinstance(stats, dict):
-                    surface_stats[surface] = SurfaceStats.from_dict(stats)
-                else:
-                    surface_stats[surface] = stats
-            data['surface_stats'] = surface_stats
-        
-        if 'head_to_head' in data and isinstance(data['head_to_head'], dict):
-            h2h = {}
-            for opponent, record in data['head_to_head'].items():
-                if isinstance(record, list) and len(record) == 2:
-                    h2h[opponent] = tuple(record)
-                else:
-                    h2h[opponent] = record
-            data['head_to_head'] = h2h
+        # Convert serialized values back to their model types
+        for key, convert in _PLAYER_STATS_CONVERTERS.items():
+            if key in data:
+                data[key] = convert(data[key])
         
         # Filter data to only include valid PlayerStats constructor parameters
-        # Get all field names from the PlayerStats dataclass
-        import dataclasses
-        valid_fields = {field.name for field in dataclasses.fields(cls)}
-        
-        # Create filtered data dict with only valid constructor parameters
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+        filtered_data = {k: v for k, v in data.items() if k in cls._VALID_FIELDS}
         
         return cls(**filtered_data)
     
     def to_json(self) -> str:
         """Convert to JSON string"""
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            return orjson.dumps(self.to_dict(), option=options).decode()
         return json.dumps(self.to_dict(), indent=2)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'PlayerStats':
         """Create PlayerStats from JSON string"""
-        data = json.loads(json_str)
-        return cls.from_dict(data)
\ No newline at end of file
+        if _PLAYER_STATS_DECODER is not None:
+            try:
+                return _player_stats_from_msg(_PLAYER_STATS_DECODER.decode(json_str))
+            except msgspec.DecodeError:
+                pass  # Irregular payload, use the tolerant dict path
+        
+        data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
+        return cls.from_dict(data)
+
+
+# Constructor field names, computed once for from_dict filtering
+PlayerStats._VALID_FIELDS = frozenset(f.name for f in fields(PlayerStats))
+
+
+# Typed msgspec mirrors of the serialized dataclasses. from_json decodes
+# straight into these (datetimes included) and skips the intermediate dict.
+if msgspec is not None:
+    class _ServeStatisticsMsg(msgspec.Struct):
+        first_serve_percentage: float = msgspec.field(default=0.6, name='first_serve_pct')
+        first_serve_win_percentage: float = msgspec.field(default=0.7, name='first_serve_win_pct')
+        second_serve_win_percentage: float = msgspec.field(default=0.5, name='second_serve_win_pct')
+        aces_per_match: float = 5.0
+        double_faults_per_match: float = 2.0
+        service_games_won_percentage: float = msgspec.field(default=0.8, name='service_games_won_pct')
+    
+    class _ReturnStatisticsMsg(msgspec.Struct):
+        first_serve_return_points_won: float = msgspec.field(default=0.3, name='first_serve_return_won')
+        second_serve_return_points_won: float = msgspec.field(default=0.5, name='second_serve_return_won')
+        break_points_converted: float = 0.4
+        return_games_won_percentage: float = msgspec.field(default=0.2, name='return_games_won_pct')
+        return_winners_per_match: float = 8.0
+    
+    class _SurfaceStatsMsg(msgspec.Struct):
+        surface: str
+        matches_played: int = 0
+        wins: int = 0
+        losses: int = 0
+        win_percentage: float = 0.5
+        serve_percentage: float = 0.6
+        return_percentage: float = 0.3
+    
+    class _PlayerStatsMsg(msgspec.Struct):
+        name: str
+        current_ranking: int = 100
+        previous_ranking: int = 100
+        nationality: str = "Unknown"
+        age: int = 25
+        height_cm: int = 180
+        weight_kg: int = 75
+        plays: str = "Right"
+        serve_stats: _ServeStatisticsMsg = msgspec.field(default_factory=_ServeStatisticsMsg)
+        return_stats: _ReturnStatisticsMsg = msgspec.field(default_factory=_ReturnStatisticsMsg)
+        surface_stats: Dict[str, _SurfaceStatsMsg] = {}
+        recent_matches: List[str] = []
+        recent_form_factor: float = 1.0
+        current_tournament: Optional[str] = None
+        injury_status: str = "Healthy"
+        last_updated: Optional[datetime] = None
+        head_to_head: Dict[str, Tuple[int, int]] = {}
+    
+    _PLAYER_STATS_DECODER = msgspec.json.Decoder(_PlayerStatsMsg)
+else:
+    _PLAYER_STATS_DECODER = None
+
+
+def _player_stats_from_msg(msg) -> PlayerStats:
+    """Build PlayerStats from a decoded _PlayerStatsMsg"""
+    kwargs = msgspec.structs.asdict(msg)
+    kwargs['serve_stats'] = ServeStatistics(**msgspec.structs.asdict(msg.serve_stats))
+    kwargs['return_stats'] = ReturnStatistics(**msgspec.structs.asdict(msg.return_stats))
+    kwargs['surface_stats'] = {surface: SurfaceStats(**msgspec.structs.asdict(stats))
+                               for surface, stats in msg.surface_stats.items()}
+    if kwargs['last_updated'] is None:
+        del kwargs['last_updated']
+    return PlayerStats(**kwargs)
+
+
+def batch_form_factors(players: List[PlayerStats]) -> np.ndarray:
+    """
+    Calculate recent form factors for a cohort of players at once
+    
+    Vectorized equivalent of PlayerStats.calculate_form_factor for scoring
+    many players in simulation loops.
+    
+    Args:
+        players: Players whose recent match results should be scored
+        
+    Returns:
+        Array of form factors aligned with the input players
+    """
+    width = max((len(player.recent_matches) for player in players), default=0)
+    if width == 0:
+        return np.ones(len(players))
+    
+    # 2 = win, 1 = loss, 0 = no match recorded
+    outcomes = np.zeros((len(players), width), dtype=np.uint8)
+    for row, player in zip(outcomes, players):
+        row[:len(player.recent_matches)] = [2 if match == "W" else 1 for match in player.recent_matches]
+    
+    wins = (outcomes == 2).sum(axis=1)
+    totals = (outcomes != 0).sum(axis=1)
+    
+    factors = np.clip(0.7 + 0.6 * wins / np.maximum(totals, 1), 0.5, 1.5)
+    factors[totals == 0] = 1.0
+    return factors
+
+
+def batch_surface_multipliers(players: List[PlayerStats], surface: str) -> np.ndarray:
+    """
+    Get surface performance multipliers for a cohort of players at once
+    
+    Vectorized equivalent of PlayerStats.get_surface_multiplier.
+    
+    Args:
+        players: Players to score
+        surface: Surface name ("hard", "clay", "grass", "carpet")
+        
+    Returns:
+        Array of surface multipliers aligned with the input players
+    """
+    surface_key = surface.lower()
+    win_rates = np.full(len(players), 0.5)
+    for i, player in enumerate(players):
+        surface_performance = player.surface_stats.get(surface_key)
+        if surface_performance is not None:
+            win_rates[i] = surface_performance.calculated_win_percentage
+    
+    return np.clip(win_rates / 0.5, 0.6, 1.4)
+
+
+@dataclass
+class PlayerStatsTable:
+    """
+    Columnar view of numeric statistics for a cohort of players
+    
+    Each attribute is a NumPy column with one row per player, so simulation
+    sweeps that read a single statistic across every player scan one
+    contiguous array instead of walking nested PlayerStats objects.
+    
+    Percentage columns are stored as float16 (ample precision for values in
+    [0, 1]); per-match counts stay float32. Promote with
+    ``astype(np.float32)`` before accumulating over long sums.
+    """
+    names: np.ndarray
+    current_ranking: np.ndarray
+    
+    # Serve columns
+    first_serve_pct: np.ndarray
+    first_serve_win_pct: np.ndarray
+    second_serve_win_pct: np.ndarray
+    aces_per_match: np.ndarray
+    double_faults_per_match: np.ndarray
+    service_games_won_pct: np.ndarray
+    
+    # Return columns
+    first_serve_return_won: np.ndarray
+    second_serve_return_won: np.ndarray
+    break_points_converted: np.ndarray
+    return_games_won_pct: np.ndarray
+    return_winners_per_match: np.ndarray
+    
+    # Form
+    recent_form_factor: np.ndarray
+    
+    @classmethod
+    def from_players(cls, players: List[PlayerStats]) -> 'PlayerStatsTable':
+        """Build a table with one row per player, in input order"""
+        count = len(players)
+        serve = [player.serve_stats for player in players]
+        returns = [player.return_stats for player in players]
+        
+        def column(values, dtype=np.float16) -> np.ndarray:
+            return np.fromiter(values, dtype=dtype, count=count)
+        
+        return cls(
+            names=np.array([player.name for player in players], dtype=object),
+            current_ranking=column((player.current_ranking for player in players), np.int32),
+            first_serve_pct=column(s.first_serve_percentage for s in serve),
+            first_serve_win_pct=column(s.first_serve_win_percentage for s in serve),
+            second_serve_win_pct=column(s.second_serve_win_percentage for s in serve),
+            aces_per_match=column((s.aces_per_match for s in serve), np.float32),
+            double_faults_per_match=column((s.double_faults_per_match for s in serve), np.float32),
+            service_games_won_pct=column(s.service_games_won_percentage for s in serve),
+            first_serve_return_won=column(r.first_serve_return_points_won for r in returns),
+            second_serve_return_won=column(r.second_serve_return_points_won for r in returns),
+            break_points_converted=column(r.break_points_converted for r in returns),
+            return_games_won_pct=column(r.return_games_won_percentage for r in returns),
+            return_winners_per_match=column((r.return_winners_per_match for r in returns), np.float32),
+            recent_form_factor=column(player.recent_form_factor for player in players),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.names)
@@ -5,12 +5,46 @@ Data classes for representing tournament structures, draws, and individual match
 retrieved from tennis APIs.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Dict, List, Optional
 import json
+import sys
 import threading
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Standard tournament round order by draw size
+_ROUND_NAMES = {
+    128: ("First Round", "Second Round", "Third Round", "Fourth Round",
+          "Quarterfinals", "Semifinals", "Final"),
+    64: ("First Round", "Second Round", "Third Round",
+         "Quarterfinals", "Semifinals", "Final"),
+    32: ("First Round", "Second Round", "Quarterfinals", "Semifinals", "Final"),
+}
+
+# Surface-specific prediction factors
+_SURFACE_FACTORS = {
+    "hard": 1.0,
+    "clay": 0.9,
+    "grass": 1.1,
+    "carpet": 1.0
+}
+
 
 @dataclass
 class Match:
@@ -32,6 +66,15 @@ class Match:
     # Match status
     status: str = "scheduled"  # "scheduled", "in_progress", "completed", "cancelled"
     
+    def __post_init__(self):
+        """Intern player names so repeated copies share storage"""
+        if isinstance(self.player1, str):
+            self.player1 = sys.intern(self.player1)
+        if isinstance(self.player2, str):
+            self.player2 = sys.intern(self.player2)
+        if isinstance(self.winner, str):
+            self.winner = sys.intern(self.winner)
+    
     def to_dict(self) -> Dict:
         return {
             'match_id': self.match_id,
@@ -57,6 +100,104 @@ class Match:
         return bool(self.score and "w.o." in self.score.lower())
 
 
+class _LazyRounds(MutableMapping):
+    """
+    Round name -> matches mapping that deserializes each round on first access
+    
+    Deserialized draws keep every round's raw match data and only build the
+    Match objects of rounds that are actually read.
+    """
+    
+    def __init__(self, raw_rounds: Dict[str, list], convert_match):
+        # None marks a round whose matches are still in raw form
+        self._rounds: Dict[str, Optional[List[Match]]] = dict.fromkeys(raw_rounds)
+        self._raw = dict(raw_rounds)
+        self._convert_match = convert_match
+    
+    def __getitem__(self, round_name: str) -> List[Match]:
+        matches = self._rounds[round_name]
+        if matches is None:
+            matches = [self._convert_match(match_data) for match_data in self._raw.pop(round_name)]
+            self._rounds[round_name] = matches
+        return matches
+    
+    def __setitem__(self, round_name: str, matches: List[Match]):
+        self._rounds[round_name] = matches
+        self._raw.pop(round_name, None)
+    
+    def __delitem__(self, round_name: str):
+        del self._rounds[round_name]
+        self._raw.pop(round_name, None)
+    
+    def __contains__(self, round_name) -> bool:
+        return round_name in self._rounds
+    
+    def __iter__(self):
+        return iter(self._rounds)
+    
+    def __len__(self) -> int:
+        return len(self._rounds)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+def _convert_datetime(value):
+    """Parse ISO datetime strings, passing through datetimes and empty values"""
+    if isinstance(value, str) and value:
+        return _parse_datetime(value)
+    return value
+
+
+def _convert_match(match_data):
+    """Build a Match from its serialized dictionary"""
+    if not isinstance(match_data, dict):
+        return match_data
+    match_data = match_data.copy()
+    if 'match_date' in match_data:
+        match_data['match_date'] = _convert_datetime(match_data['match_date'])
+    return Match(**match_data)
+
+
+def _convert_rounds(rounds_data):
+    """Build a lazily deserialized round name -> matches mapping"""
+    if not isinstance(rounds_data, dict):
+        return rounds_data
+    return _LazyRounds(rounds_data, _convert_match)
+
+
+def _convert_seeded_players(seeds_data):
+    """Convert serialized string seed keys back to int, dropping invalid ones"""
+    if not isinstance(seeds_data, dict):
+        return seeds_data
+    seeded_players = {}
+    for seed_str, player in seeds_data.items():
+        try:
+            seeded_players[int(seed_str)] = player
+        except (ValueError, TypeError):
+            pass
+    return seeded_players
+
+
+# from_dict converters: field name -> function restoring the model value
+_TOURNAMENT_DRAW_CONVERTERS = {
+    'start_date': _convert_datetime,
+    'end_date': _convert_datetime,
+    'last_updated': _convert_datetime,
+    'rounds': _convert_rounds,
+    'seeded_players': _convert_seeded_players,
+}
+
+# from_dict fallbacks for required constructor fields missing from the data
+_TOURNAMENT_DRAW_REQUIRED_DEFAULTS = {
+    'category': 'Unknown',
+    'tournament_id': 'unknown',
+    'tournament_name': 'Unknown Tournament',
+    'year': 2024,
+    'surface': 'hard',
+}
+
+
 @dataclass
 class TournamentDraw:
     """Complete tournament draw with all matches and metadata"""
@@ -93,6 +234,12 @@ class TournamentDraw:
     
     def get_all_players(self) -> List[str]:
         """Get all players in the tournament (thread-safe)"""
+        # Fast path: all_players is only ever assigned a complete list, so
+        # readers can skip the lock once it is populated
+        all_players = self.all_players
+        if all_players:
+            return all_players
+        
         with self._players_lock:
             if self.all_players:
                 return self.all_players
@@ -103,7 +250,7 @@ class TournamentDraw:
                     players.add(match.player1)
                     players.add(match.player2)
             
-            self.all_players = sorted(list(players))
+            self.all_players = sorted(players)
             return self.all_players
     
     def get_seed(self, player_name: str) -> Optional[int]:
@@ -128,12 +275,15 @@ class TournamentDraw:
     
     def add_match(self, match: Match):
         """Add a match to the appropriate round"""
-        if match.round_name not in self.rounds:
-            self.rounds[match.round_name] = []
-        self.rounds[match.round_name].append(match)
+        round_matches = self.rounds.get(match.round_name)
+        if round_matches is None:
+            round_matches = self.rounds[match.round_name] = []
+        round_matches.append(match)
     
     def add_seeded_player(self, seed: int, player_name: str):
         """Add a seeded player"""
+        if isinstance(player_name, str):
+            player_name = sys.intern(player_name)
         self.seeded_players[seed] = player_name
     
     def get_match_by_id(self, match_id: str) -> Optional[Match]:
@@ -157,28 +307,15 @@ class TournamentDraw:
     
     def get_tournament_surface_factor(self) -> float:
         """Get surface-specific factor for predictions"""
-        surface_factors = {
-            "hard": 1.0,
-            "clay": 0.9,
-            "grass": 1.1,
-            "carpet": 1.0
-        }
-        return surface_factors.get(self.surface.lower(), 1.0)
+        return _SURFACE_FACTORS.get(self.surface.lower(), 1.0)
     
     @property
     def round_names(self) -> List[str]:
         """Get ordered list of round names"""
-        # Standard tournament round order
-        if self.draw_size == 128:
-            return ["First Round", "Second Round", "Third Round", "Fourth Round", 
-                   "Quarterfinals", "Semifinals", "Final"]
-        elif self.draw_size == 64:
-            return ["First Round", "Second Round", "Third Round", 
-                   "Quarterfinals", "Semifinals", "Final"]
-        elif self.draw_size == 32:
-            return ["First Round", "Second Round", "Quarterfinals", "Semifinals", "Final"]
-        else:
-            return sorted(self.rounds.keys())
+        standard_rounds = _ROUND_NAMES.get(self.draw_size)
+        if standard_rounds is not None:
+            return list(standard_rounds)
+        return sorted(self.rounds.keys())
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
@@ -210,72 +347,95 @@ class TournamentDraw:
         # Make a copy to avoid modifying the original data
         data = data.copy()
         
-        # Handle datetime conversion
-        if 'start_date' in data and data['start_date']:
-            data['start_date'] = datetime.fromisoformat(data['start_date'])
-        if 'end_date' in data and data['end_date']:
-            data['end_date'] = datetime.fromisoformat(data['end_date'])
-        if 'last_updated' in data:
-            if isinstance(data['last_updated'], str):
-                data['last_updated'] = datetime.fromisoformat(data['last_updated'])
-        
-        # Handle nested matches
-        if 'rounds' in data and isinstance(data['rounds'], dict):
-            rounds = {}
-            for round_name, matches_data in data['rounds'].items():
-                matches = []
-                for match_data in matches_data:
-                    if isinstance(match_data, dict):
-                        # Handle match datetime
-                        if 'match_date' in match_data and match_data['match_date']:
-                            match_data['match_date'] = datetime.fromisoformat(match_data['match_date'])
-                        matches.append(Match(**match_data))
-                    else:
-                        matches.append(match_data)
-                rounds[round_name] = matches
-            data['rounds'] = rounds
-        
-        # Handle seeded players (convert string keys back to int)
-        if 'seeded_players' in data and isinstance(data['seeded_players'], dict):
-            seeded_players = {}
-            for seed_str, player in data['seeded_players'].items():
-                try:
-                    seed = int(seed_str)
-                    seeded_players[seed] = player
-                except (ValueError, TypeError):
-                    pass
-            data['seeded_players'] = seeded_players
+        # Convert serialized values back to their model types
+        for key, convert in _TOURNAMENT_DRAW_CONVERTERS.items():
+            if key in data:
+                data[key] = convert(data[key])
         
         # Filter data to only include valid TournamentDraw constructor parameters
-        # Get all field names from the TournamentDraw dataclass
-        import dataclasses
-        valid_fields = {field.name for field in dataclasses.fields(cls)}
-        
-        # Create filtered data dict with only valid constructor parameters
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+        filtered_data = {k: v for k, v in data.items() if k in cls._VALID_FIELDS}
         
         # Ensure required fields have default values if missing
-        required_defaults = {
-            'category': 'Unknown',
-            'tournament_id': data.get('tournament_id', 'unknown'),
-            'tournament_name': data.get('tournament_name', 'Unknown Tournament'),
-            'year': data.get('year', 2024),
-            'surface': data.get('surface', 'hard')
-        }
-        
-        # Add missing required fields with defaults
-        for field_name, default_value in required_defaults.items():
-            if field_name not in filtered_data:
-                filtered_data[field_name] = default_value
+        for field_name, default_value in _TOURNAMENT_DRAW_REQUIRED_DEFAULTS.items():
+            filtered_data.setdefault(field_name, default_value)
         
         return cls(**filtered_data)
     
     def to_json(self) -> str:
         """Convert to JSON string"""
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            return orjson.dumps(self.to_dict(), option=options).decode()
         return json.dumps(self.to_dict(), indent=2)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'TournamentDraw':
         """Create TournamentDraw from JSON string"""
-        data = json.loads(json_str)
-        return cls.from_dict(data)
\ No newline at end of file
+        if _TOURNAMENT_DRAW_DECODER is not None:
+            try:
+                return _tournament_draw_from_msg(_TOURNAMENT_DRAW_DECODER.decode(json_str))
+            except msgspec.DecodeError:
+                pass  # Irregular payload, use the tolerant dict path
+        
+        data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
+        return cls.from_dict(data)
+
+
+# Constructor field names, computed once for from_dict filtering
+TournamentDraw._VALID_FIELDS = frozenset(f.name for f in fields(TournamentDraw))
+
+
+# Typed msgspec mirrors of the serialized dataclasses. from_json decodes
+# straight into these (datetimes included) and skips the intermediate dict.
+if msgspec is not None:
+    class _MatchMsg(msgspec.Struct):
+        match_id: str
+        round_name: str
+        player1: str
+        player2: str
+        player1_seed: Optional[int] = None
+        player2_seed: Optional[int] = None
+        winner: Optional[str] = None
+        score: Optional[str] = None
+        sets: Optional[List[List[int]]] = None
+        match_date: Optional[datetime] = None
+        match_duration_minutes: Optional[int] = None
+        status: str = "scheduled"
+    
+    class _TournamentDrawMsg(msgspec.Struct):
+        tournament_id: str = 'unknown'
+        tournament_name: str = 'Unknown Tournament'
+        year: int = 2024
+        surface: str = 'hard'
+        category: str = 'Unknown'
+        location: str = "Unknown"
+        start_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None
+        draw_size: int = 128
+        total_prize_money: Optional[int] = None
+        currency: str = "USD"
+        winner_points: int = 2000
+        rounds: Dict[str, List[_MatchMsg]] = {}
+        seeded_players: Dict[int, str] = {}
+        all_players: List[str] = []
+        status: str = "upcoming"
+        current_round: Optional[str] = None
+        last_updated: Optional[datetime] = None
+    
+    _TOURNAMENT_DRAW_DECODER = msgspec.json.Decoder(_TournamentDrawMsg)
+else:
+    _TOURNAMENT_DRAW_DECODER = None
+
+
+def _match_from_msg(msg) -> Match:
+    """Build Match from a decoded _MatchMsg"""
+    return Match(**msgspec.structs.asdict(msg))
+
+
+def _tournament_draw_from_msg(msg) -> TournamentDraw:
+    """Build TournamentDraw from a decoded _TournamentDrawMsg"""
+    kwargs = msgspec.structs.asdict(msg)
+    kwargs['rounds'] = _LazyRounds(msg.rounds, _match_from_msg)
+    if kwargs['last_updated'] is None:
+        del kwargs['last_updated']
+    return TournamentDraw(**kwargs)
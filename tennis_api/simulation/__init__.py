@@ -13,6 +13,7 @@ _EXPORTS = {
     "MatchState": (".enhanced_match_engine", "MatchState"),
     "PointOutcome": (".enhanced_match_engine", "PointOutcome"),
     "MatchStatistics": (".enhanced_match_engine", "MatchStatistics"),
+    "simulate_match_batch_numpy": (".enhanced_match_engine", "simulate_match_batch_numpy"),
 }
 
 __all__: List[str] = [
@@ -20,6 +21,7 @@ __all__: List[str] = [
     "MatchState",
     "PointOutcome", 
     "MatchStatistics",
+    "simulate_match_batch_numpy",
 ]
 
 
@@ -0,0 +1,587 @@
+"""
+Compiled Simulation Kernels
+
+Scalar point/game kernels used by the enhanced match engine's hot loops.
+They are compiled with Numba when it is installed; otherwise the hot paths
+fall back to pure-Python versions that play the same points.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Point outcome codes (kernels can't use the PointOutcome enum)
+OUTCOME_ACE = 0
+OUTCOME_DOUBLE_FAULT = 1
+OUTCOME_WINNER = 2
+OUTCOME_UNFORCED_ERROR = 3
+OUTCOME_REGULAR_PLAY = 4
+
+# Uniform draws consumed per simulated point
+RANDS_PER_POINT = 1
+
+# Uniform draws generated per refill inside the match kernel
+MATCH_RAND_BATCH = 1536
+
+# MatchStatistics counter layout; player 2 counters sit PLAYER_STRIDE after player 1's
+DURATION_MINUTES = 0
+TOTAL_POINTS = 1
+TOTAL_GAMES = 2
+SETS_PLAYED = 3
+P1_POINTS_WON = 4
+P1_GAMES_WON = 5
+P1_SETS_WON = 6
+P1_ACES = 7
+P1_DOUBLE_FAULTS = 8
+P1_BREAK_POINTS_WON = 9
+PLAYER_STRIDE = 6
+P2_POINTS_WON = P1_POINTS_WON + PLAYER_STRIDE
+P2_GAMES_WON = P1_GAMES_WON + PLAYER_STRIDE
+P2_SETS_WON = P1_SETS_WON + PLAYER_STRIDE
+P2_ACES = P1_ACES + PLAYER_STRIDE
+P2_DOUBLE_FAULTS = P1_DOUBLE_FAULTS + PLAYER_STRIDE
+P2_BREAK_POINTS_WON = P1_BREAK_POINTS_WON + PLAYER_STRIDE
+MOMENTUM_SWINGS = 16
+STAT_COUNT = 17
+
+# simulate_match_fused resume state layout
+STATE_P1_GAMES = 0
+STATE_P2_GAMES = 1
+STATE_P1_POINTS = 2
+STATE_P2_POINTS = 3
+STATE_SERVER = 4
+STATE_SET_INDEX = 5
+STATE_SIZE = 6
+
+
+def _build_set_terminal() -> np.ndarray:
+    """Set state table: 0 while in progress, else the winning player"""
+    table = np.zeros((8, 8), dtype=np.int8)
+    for g1 in range(8):
+        for g2 in range(8):
+            high = max(g1, g2)
+            if high >= 6 and (abs(g1 - g2) >= 2 or high == 7):
+                table[g1, g2] = 1 if g1 > g2 else 2
+    return table
+
+
+# SET_TERMINAL[p1_games, p2_games]; 6-6 plays one more game, so 7 games is the cap
+SET_TERMINAL = _build_set_terminal()
+
+
+# Serve model: first serve in 65% of the time and won at serve_perf (6% of
+# those as aces); second serve in 92% of the time and won at 0.8 * serve_perf;
+# otherwise a double fault
+FIRST_SERVE_IN = 0.65
+SECOND_SERVE_IN = 0.92
+ACE_RATE = 0.06
+SECOND_SERVE_FACTOR = 0.8
+
+# Outcome and whether the server won it, for each slot between the
+# cumulative thresholds in simulate_point
+_SLOT_OUTCOMES = np.array([OUTCOME_ACE, OUTCOME_REGULAR_PLAY, OUTCOME_WINNER,
+                           OUTCOME_REGULAR_PLAY, OUTCOME_WINNER, OUTCOME_DOUBLE_FAULT])
+_SLOT_SERVER_WINS = np.array([1, 1, 0, 1, 0, 0])
+
+
+def _build_momentum_delta() -> np.ndarray:
+    """Momentum change per (outcome_code, point_winner - 1, serving_player - 1)"""
+    table = np.empty((5, 2, 2), dtype=np.float64)
+    for outcome in range(5):
+        for winner in (1, 2):
+            for server in (1, 2):
+                if outcome == OUTCOME_ACE:
+                    delta = 0.15 if winner == server else -0.15
+                elif outcome == OUTCOME_DOUBLE_FAULT:
+                    delta = -0.2 if winner != server else 0.2
+                else:
+                    delta = 0.05 if winner == 1 else -0.05
+                table[outcome, winner - 1, server - 1] = delta
+    return table
+
+
+# Momentum is positive in player 1's favour; swings are changes above 0.1
+MOMENTUM_DELTA = _build_momentum_delta()
+MOMENTUM_DECAY = 0.95
+MOMENTUM_SWING = 0.1
+
+
+@njit(cache=True, fastmath=True)
+def simulate_point(serve_perf, serving_player, r):
+    """
+    Simulate one point from a single uniform draw
+
+    The draw is placed among cumulative outcome thresholds, which carry the
+    same probabilities as the first/second serve decision tree, so the
+    outcome is an index lookup rather than a chain of branches.
+
+    Returns:
+        Tuple of (point_winner, outcome_code)
+    """
+    first_won = FIRST_SERVE_IN * serve_perf
+    second_in = (1.0 - FIRST_SERVE_IN) * SECOND_SERVE_IN
+    # int() each comparison: uncompiled, NumPy bools add as a logical OR
+    slot = (int(r >= first_won * ACE_RATE) + int(r >= first_won) + int(r >= FIRST_SERVE_IN)
+            + int(r >= FIRST_SERVE_IN + second_in * serve_perf * SECOND_SERVE_FACTOR)
+            + int(r >= FIRST_SERVE_IN + second_in))
+    if _SLOT_SERVER_WINS[slot]:
+        return serving_player, _SLOT_OUTCOMES[slot]
+    return 3 - serving_player, _SLOT_OUTCOMES[slot]
+
+
+def simulate_points(serve_perf, serving_player, draws):
+    """
+    Vectorized simulate_point over an array of uniform draws
+
+    Plain NumPy: every draw is placed among the same cumulative thresholds
+    in one searchsorted call.
+
+    Returns:
+        Tuple of (point_winners, outcome_codes) arrays
+    """
+    first_won = FIRST_SERVE_IN * serve_perf
+    second_in = (1.0 - FIRST_SERVE_IN) * SECOND_SERVE_IN
+    thresholds = np.array([first_won * ACE_RATE, first_won, FIRST_SERVE_IN,
+                           FIRST_SERVE_IN + second_in * serve_perf * SECOND_SERVE_FACTOR,
+                           FIRST_SERVE_IN + second_in])
+    slots = np.searchsorted(thresholds, draws, side='right')
+    winners = np.where(_SLOT_SERVER_WINS[slots] == 1, serving_player, 3 - serving_player)
+    return winners, _SLOT_OUTCOMES[slots]
+
+
+@njit(cache=True, fastmath=True)
+def simulate_game_core(serve_perf, pressure, fatigue_penalty, momentum, serving_player,
+                       p1_points, p2_points, rands, rand_idx, counters):
+    """
+    Simulate points of a game until it is decided or the draws run out
+
+    Applies the engine's per-point momentum, pressure and fatigue
+    adjustments to the server's base serve performance, and adds point,
+    ace, double fault and momentum swing counts to ``counters`` in place.
+
+    Returns:
+        Tuple of (game_winner, p1_points, p2_points, momentum, rand_idx).
+        game_winner is 0 when the draws ran out first; call again with a
+        refilled buffer and the returned points/momentum to continue.
+    """
+    server_offset = (serving_player - 1) * PLAYER_STRIDE
+    n_rands = rands.shape[0]
+
+    while rand_idx + RANDS_PER_POINT <= n_rands:
+        # Dynamic factors
+        momentum_effect = momentum if serving_player == 1 else -momentum
+        perf = serve_perf + momentum_effect * 0.05 - pressure * 0.03 - fatigue_penalty
+        perf = max(0.2, min(0.95, perf))
+
+        winner, outcome = simulate_point(perf, serving_player, rands[rand_idx])
+        rand_idx += RANDS_PER_POINT
+
+        counters[TOTAL_POINTS] += 1
+        counters[P1_POINTS_WON + (winner - 1) * PLAYER_STRIDE] += 1
+        p1_points += winner == 1
+        p2_points += winner == 2
+
+        if outcome == OUTCOME_ACE:
+            counters[P1_ACES + server_offset] += 1
+        elif outcome == OUTCOME_DOUBLE_FAULT:
+            counters[P1_DOUBLE_FAULTS + server_offset] += 1
+
+        # Momentum update
+        momentum_change = MOMENTUM_DELTA[outcome, winner - 1, serving_player - 1]
+        momentum = max(-1.0, min(1.0, momentum * MOMENTUM_DECAY + momentum_change))
+        if abs(momentum_change) > MOMENTUM_SWING:
+            counters[MOMENTUM_SWINGS] += 1
+
+        if (p1_points >= 4 and p1_points - p2_points >= 2) or (p2_points >= 4 and p2_points - p1_points >= 2):
+            game_winner = 1 if p1_points > p2_points else 2
+            return game_winner, p1_points, p2_points, momentum, rand_idx
+
+    return 0, p1_points, p2_points, momentum, rand_idx
+
+
+@njit(cache=True, fastmath=True)
+def simulate_game_static(serve_perf, serving_player, p1_points, p2_points,
+                         rands, rand_idx, counters):
+    """
+    simulate_game_core without momentum, pressure or fatigue
+
+    Every point is played at ``serve_perf``; point, ace and double fault
+    counts are added to ``counters`` in place.
+
+    Returns:
+        Tuple of (game_winner, p1_points, p2_points, rand_idx), with
+        game_winner 0 when the draws ran out first.
+    """
+    server_offset = (serving_player - 1) * PLAYER_STRIDE
+    n_rands = rands.shape[0]
+
+    while rand_idx + RANDS_PER_POINT <= n_rands:
+        winner, outcome = simulate_point(serve_perf, serving_player, rands[rand_idx])
+        rand_idx += RANDS_PER_POINT
+
+        counters[TOTAL_POINTS] += 1
+        counters[P1_POINTS_WON + (winner - 1) * PLAYER_STRIDE] += 1
+        p1_points += winner == 1
+        p2_points += winner == 2
+        if outcome == OUTCOME_ACE:
+            counters[P1_ACES + server_offset] += 1
+        elif outcome == OUTCOME_DOUBLE_FAULT:
+            counters[P1_DOUBLE_FAULTS + server_offset] += 1
+
+        if (p1_points >= 4 and p1_points - p2_points >= 2) or (p2_points >= 4 and p2_points - p1_points >= 2):
+            game_winner = 1 if p1_points > p2_points else 2
+            return game_winner, p1_points, p2_points, rand_idx
+
+    return 0, p1_points, p2_points, rand_idx
+
+
+@njit(cache=True, fastmath=True)
+def simulate_match_fused(serve_perf, fatigue, pressure, momentum, dynamic, sets_to_win,
+                         state, rands, rand_idx, counters, set_scores):
+    """
+    Play a match through to the end in one compiled call
+
+    ``serve_perf`` and ``fatigue`` are (max_sets, 2) tables of each player's
+    base serve performance and fatigue penalty for every set, so between-set
+    fatigue needs no Python calls. Games, points, server and set index live
+    in ``state`` and are updated in place; if the draws run out, refill
+    ``rands`` and call again to resume. Statistics go to ``counters`` and
+    finished sets to ``set_scores``.
+
+    Returns:
+        Tuple of (match_over, momentum, rand_idx)
+    """
+    while counters[P1_SETS_WON] < sets_to_win and counters[P2_SETS_WON] < sets_to_win:
+        set_index = state[STATE_SET_INDEX]
+        server = state[STATE_SERVER]
+        if dynamic:
+            game_winner, p1_points, p2_points, momentum, rand_idx = simulate_game_core(
+                serve_perf[set_index, server - 1], pressure, fatigue[set_index, server - 1],
+                momentum, server, state[STATE_P1_POINTS], state[STATE_P2_POINTS],
+                rands, rand_idx, counters
+            )
+        else:
+            game_winner, p1_points, p2_points, rand_idx = simulate_game_static(
+                serve_perf[set_index, server - 1], server, state[STATE_P1_POINTS],
+                state[STATE_P2_POINTS], rands, rand_idx, counters
+            )
+        if game_winner == 0:
+            state[STATE_P1_POINTS] = p1_points
+            state[STATE_P2_POINTS] = p2_points
+            return False, momentum, rand_idx
+
+        state[STATE_P1_POINTS] = 0
+        state[STATE_P2_POINTS] = 0
+        winner_offset = (game_winner - 1) * PLAYER_STRIDE
+        counters[P1_GAMES_WON + winner_offset] += 1
+        counters[TOTAL_GAMES] += 1
+        if game_winner != server:
+            counters[P1_BREAK_POINTS_WON + winner_offset] += 1
+        state[STATE_P1_GAMES + game_winner - 1] += 1
+        state[STATE_SERVER] = 3 - server
+
+        set_winner = SET_TERMINAL[state[STATE_P1_GAMES], state[STATE_P2_GAMES]]
+        if set_winner:
+            set_scores[set_index, 0] = state[STATE_P1_GAMES]
+            set_scores[set_index, 1] = state[STATE_P2_GAMES]
+            state[STATE_P1_GAMES] = 0
+            state[STATE_P2_GAMES] = 0
+            state[STATE_SET_INDEX] += 1
+            counters[P1_SETS_WON + (set_winner - 1) * PLAYER_STRIDE] += 1
+            counters[SETS_PLAYED] += 1
+
+    return True, momentum, rand_idx
+
+
+@njit(cache=True, fastmath=True)
+def simulate_match_core(p1_serve, p2_serve, pressure, p1_fatigue, p2_fatigue,
+                        sets_to_win, first_server, counters):
+    """
+    Simulate a whole match with fixed base serve performance
+
+    Draws come from ``np.random``, so seed it first for reproducible
+    results. Game, set and point counts are added to ``counters``.
+
+    Returns:
+        Tuple of (match_winner, p1_sets, p2_sets)
+    """
+    rands = np.random.random(MATCH_RAND_BATCH)
+    rand_idx = 0
+    momentum = 0.0
+    server = first_server
+    p1_sets = 0
+    p2_sets = 0
+
+    while p1_sets < sets_to_win and p2_sets < sets_to_win:
+        p1_games = 0
+        p2_games = 0
+        set_winner = 0
+        while set_winner == 0:
+            serve_perf = p1_serve if server == 1 else p2_serve
+            fatigue = p1_fatigue if server == 1 else p2_fatigue
+            p1_points = 0
+            p2_points = 0
+            while True:
+                game_winner, p1_points, p2_points, momentum, rand_idx = simulate_game_core(
+                    serve_perf, pressure, fatigue, momentum, server,
+                    p1_points, p2_points, rands, rand_idx, counters
+                )
+                if game_winner:
+                    break
+                rands = np.random.random(MATCH_RAND_BATCH)
+                rand_idx = 0
+
+            counters[P1_GAMES_WON + (game_winner - 1) * PLAYER_STRIDE] += 1
+            counters[TOTAL_GAMES] += 1
+            if game_winner != server:
+                counters[P1_BREAK_POINTS_WON + (game_winner - 1) * PLAYER_STRIDE] += 1
+            if game_winner == 1:
+                p1_games += 1
+            else:
+                p2_games += 1
+            server = 3 - server
+            set_winner = SET_TERMINAL[p1_games, p2_games]
+
+        counters[P1_SETS_WON + (set_winner - 1) * PLAYER_STRIDE] += 1
+        counters[SETS_PLAYED] += 1
+        if set_winner == 1:
+            p1_sets += 1
+        else:
+            p2_sets += 1
+
+    return (1 if p1_sets > p2_sets else 2), p1_sets, p2_sets
+
+
+@njit(parallel=True, cache=True)
+def simulate_match_batch(p1_serve, p2_serve, pressure, p1_fatigue, p2_fatigue,
+                         sets_to_win, first_server, seeds):
+    """
+    Simulate one independent match per seed, in parallel when compiled
+
+    Each match reseeds the generator from its own seed, so results don't
+    depend on how matches are spread across threads. Compiled, that is
+    Numba's internal generator; uncompiled it is NumPy's global one, whose
+    state is saved and restored around the batch (see below).
+
+    Returns:
+        Tuple of (winners, p1_sets, p2_sets) int8 arrays
+    """
+    n_matches = seeds.shape[0]
+    winners = np.empty(n_matches, dtype=np.int8)
+    p1_sets = np.empty(n_matches, dtype=np.int8)
+    p2_sets = np.empty(n_matches, dtype=np.int8)
+
+    for i in prange(n_matches):
+        np.random.seed(seeds[i])
+        counters = np.zeros(STAT_COUNT, dtype=np.int64)
+        winner, sets1, sets2 = simulate_match_core(
+            p1_serve, p2_serve, pressure, p1_fatigue, p2_fatigue,
+            sets_to_win, first_server, counters
+        )
+        winners[i] = winner
+        p1_sets[i] = sets1
+        p2_sets[i] = sets2
+
+    return winners, p1_sets, p2_sets
+
+
+if not NUMBA_AVAILABLE:
+    # Interpreted, the kernels above spend their time boxing NumPy scalars and
+    # indexing small arrays, which is slower than the engine's original
+    # pure-Python loop. The versions below replace the per-point hot paths with
+    # the same steps on Python floats and ints, tallying counters in a list
+    # that is added to the counter array once per call. They play the same
+    # points from the same draws as the compiled kernels (momentum may differ
+    # from fastmath's in the last bit).
+
+    _interpreted_docs = {kernel.__name__: kernel.__doc__ for kernel in (
+        simulate_point, simulate_game_core, simulate_game_static, simulate_match_fused, simulate_match_batch
+    )}
+    _SECOND_IN = (1.0 - FIRST_SERVE_IN) * SECOND_SERVE_IN
+
+    def _build_slot_effects():
+        """Per serving player and slot: (point_winner, outcome_code, momentum_change, is_swing)"""
+        effects = []
+        for server in (1, 2):
+            server_effects = []
+            for slot in range(len(_SLOT_OUTCOMES)):
+                winner = server if _SLOT_SERVER_WINS[slot] else 3 - server
+                outcome = int(_SLOT_OUTCOMES[slot])
+                change = float(MOMENTUM_DELTA[outcome, winner - 1, server - 1])
+                server_effects.append((winner, outcome, change, abs(change) > MOMENTUM_SWING))
+            effects.append(tuple(server_effects))
+        return tuple(effects)
+
+    _SLOT_EFFECTS = _build_slot_effects()
+    _SET_TERMINAL_ROWS = SET_TERMINAL.tolist()
+
+    def _play_game_points(serve_perf, pressure, fatigue_penalty, momentum, dynamic, serving_player,
+                          p1_points, p2_points, draws, rand_idx, tally):
+        """
+        simulate_game_core/simulate_game_static over a memoryview of draws
+
+        Counts go to the ``tally`` list; momentum is returned unchanged when
+        ``dynamic`` is off.
+        """
+        effects = _SLOT_EFFECTS[serving_player - 1]
+        server_offset = (serving_player - 1) * PLAYER_STRIDE
+        n_rands = len(draws)
+        perf = serve_perf
+
+        while rand_idx + RANDS_PER_POINT <= n_rands:
+            if dynamic:
+                momentum_effect = momentum if serving_player == 1 else -momentum
+                perf = serve_perf + momentum_effect * 0.05 - pressure * 0.03 - fatigue_penalty
+                perf = max(0.2, min(0.95, perf))
+
+            # The same cumulative thresholds as simulate_point
+            r = draws[rand_idx]
+            rand_idx += RANDS_PER_POINT
+            first_won = FIRST_SERVE_IN * perf
+            slot = ((r >= first_won * ACE_RATE) + (r >= first_won) + (r >= FIRST_SERVE_IN)
+                    + (r >= FIRST_SERVE_IN + _SECOND_IN * perf * SECOND_SERVE_FACTOR)
+                    + (r >= FIRST_SERVE_IN + _SECOND_IN))
+            winner, outcome, momentum_change, is_swing = effects[slot]
+
+            tally[TOTAL_POINTS] += 1
+            if winner == 1:
+                tally[P1_POINTS_WON] += 1
+                p1_points += 1
+            else:
+                tally[P2_POINTS_WON] += 1
+                p2_points += 1
+            if outcome == OUTCOME_ACE:
+                tally[P1_ACES + server_offset] += 1
+            elif outcome == OUTCOME_DOUBLE_FAULT:
+                tally[P1_DOUBLE_FAULTS + server_offset] += 1
+
+            if dynamic:
+                momentum = max(-1.0, min(1.0, momentum * MOMENTUM_DECAY + momentum_change))
+                if is_swing:
+                    tally[MOMENTUM_SWINGS] += 1
+
+            if (p1_points >= 4 and p1_points - p2_points >= 2) or (p2_points >= 4 and p2_points - p1_points >= 2):
+                return (1 if p1_points > p2_points else 2), p1_points, p2_points, momentum, rand_idx
+
+        return 0, p1_points, p2_points, momentum, rand_idx
+
+    def _add_tally(counters, tally):
+        """Add a tally list's non-zero counts to a counter array"""
+        for index, count in enumerate(tally):
+            if count:
+                counters[index] += count
+
+    def simulate_point(serve_perf, serving_player, r):
+        r = float(r)
+        first_won = FIRST_SERVE_IN * serve_perf
+        slot = ((r >= first_won * ACE_RATE) + (r >= first_won) + (r >= FIRST_SERVE_IN)
+                + (r >= FIRST_SERVE_IN + _SECOND_IN * serve_perf * SECOND_SERVE_FACTOR)
+                + (r >= FIRST_SERVE_IN + _SECOND_IN))
+        winner, outcome, _, _ = _SLOT_EFFECTS[serving_player - 1][slot]
+        return winner, outcome
+
+    def simulate_game_core(serve_perf, pressure, fatigue_penalty, momentum, serving_player,
+                           p1_points, p2_points, rands, rand_idx, counters):
+        tally = [0] * STAT_COUNT
+        result = _play_game_points(
+            float(serve_perf), float(pressure), float(fatigue_penalty), float(momentum), True,
+            int(serving_player), int(p1_points), int(p2_points), memoryview(rands), int(rand_idx), tally
+        )
+        _add_tally(counters, tally)
+        return result
+
+    def simulate_game_static(serve_perf, serving_player, p1_points, p2_points,
+                             rands, rand_idx, counters):
+        tally = [0] * STAT_COUNT
+        game_winner, p1_points, p2_points, _, rand_idx = _play_game_points(
+            float(serve_perf), 0.0, 0.0, 0.0, False, int(serving_player), int(p1_points), int(p2_points),
+            memoryview(rands), int(rand_idx), tally
+        )
+        _add_tally(counters, tally)
+        return game_winner, p1_points, p2_points, rand_idx
+
+    def simulate_match_fused(serve_perf, fatigue, pressure, momentum, dynamic, sets_to_win,
+                             state, rands, rand_idx, counters, set_scores):
+        serve_perf = serve_perf.tolist()
+        fatigue = fatigue.tolist()
+        pressure = float(pressure)
+        momentum = float(momentum)
+        dynamic = bool(dynamic)
+        draws = memoryview(rands)
+        rand_idx = int(rand_idx)
+        p1_games, p2_games, p1_points, p2_points, server, set_index = state.tolist()
+        p1_sets = int(counters[P1_SETS_WON])
+        p2_sets = int(counters[P2_SETS_WON])
+        tally = [0] * STAT_COUNT
+        match_over = True
+
+        while p1_sets < sets_to_win and p2_sets < sets_to_win:
+            game_winner, p1_points, p2_points, momentum, rand_idx = _play_game_points(
+                serve_perf[set_index][server - 1], pressure, fatigue[set_index][server - 1],
+                momentum, dynamic, server, p1_points, p2_points, draws, rand_idx, tally
+            )
+            if game_winner == 0:
+                match_over = False
+                break
+
+            p1_points = p2_points = 0
+            winner_offset = (game_winner - 1) * PLAYER_STRIDE
+            tally[P1_GAMES_WON + winner_offset] += 1
+            tally[TOTAL_GAMES] += 1
+            if game_winner != server:
+                tally[P1_BREAK_POINTS_WON + winner_offset] += 1
+            if game_winner == 1:
+                p1_games += 1
+            else:
+                p2_games += 1
+            server = 3 - server
+
+            set_winner = _SET_TERMINAL_ROWS[p1_games][p2_games]
+            if set_winner:
+                set_scores[set_index, 0] = p1_games
+                set_scores[set_index, 1] = p2_games
+                p1_games = p2_games = 0
+                set_index += 1
+                tally[P1_SETS_WON + (set_winner - 1) * PLAYER_STRIDE] += 1
+                tally[SETS_PLAYED] += 1
+                if set_winner == 1:
+                    p1_sets += 1
+                else:
+                    p2_sets += 1
+
+        state[:] = (p1_games, p2_games, p1_points, p2_points, server, set_index)
+        _add_tally(counters, tally)
+        return match_over, momentum, rand_idx
+
+    _interpreted_simulate_match_batch = simulate_match_batch
+
+    def simulate_match_batch(p1_serve, p2_serve, pressure, p1_fatigue, p2_fatigue,
+                             sets_to_win, first_server, seeds):
+        # Uncompiled, np.random.seed reseeds NumPy's global generator. The
+        # kernels draw from np.random so they stay bit-identical to the
+        # compiled path, so restore the caller's state afterwards instead of
+        # switching to per-match Generators
+        state = np.random.get_state()
+        try:
+            return _interpreted_simulate_match_batch(
+                p1_serve, p2_serve, pressure, p1_fatigue, p2_fatigue,
+                sets_to_win, first_server, seeds
+            )
+        finally:
+            np.random.set_state(state)
+
+    for _replacement in (simulate_point, simulate_game_core, simulate_game_static,
+                         simulate_match_fused, simulate_match_batch):
+        _replacement.__doc__ = _interpreted_docs[_replacement.__name__]
@@ -5,16 +5,48 @@ This module implements an advanced tennis match simulation engine that integrate
 AI predictions, dynamic state management, and real-time factor adjustments.
 """
 
-import random
+import time
+import weakref
 import numpy as np
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+from dataclasses import replace
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Any, Tuple
 from enum import Enum
 
 from ..models.enhanced_player import PlayerEnhanced
-from ..models.ai_player import PlayerAI, PerformanceContext
-from ..ml.ensemble import PredictionEnsemble, ComprehensivePrediction
+from . import _kernels
+from ._kernels import (
+    OUTCOME_ACE, OUTCOME_DOUBLE_FAULT, SET_TERMINAL,
+    simulate_game_core, simulate_game_static, simulate_match_batch, simulate_match_fused, simulate_point,
+    simulate_points
+)
+
+if TYPE_CHECKING:
+    from ..ml.ensemble import ComprehensivePrediction, PredictionEnsemble
+
+# Number of uniform draws generated per RNG refill in the point simulation
+_RAND_BATCH_SIZE = 4096
+
+# Points drawn up front per match by simulate_match_batch_numpy; a match
+# rarely needs more, and draws another block if it does
+_BATCH_POINTS_PER_MATCH = 500
+
+# Maximum number of matchups kept in the shared AI prediction cache, per ensemble
+_PREDICTION_CACHE_SIZE = 1024
+
+# Chance the server wins a point per unit of serve performance: first serve
+# in and won, or second serve in and won at the reduced rate
+_SERVE_POINT_WEIGHT = (_kernels.FIRST_SERVE_IN + (1.0 - _kernels.FIRST_SERVE_IN)
+                       * _kernels.SECOND_SERVE_IN * _kernels.SECOND_SERVE_FACTOR)
+
+
+def _freeze(value: Any) -> Any:
+    """Turn nested dicts and lists into hashable tuples for use in a cache key"""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in sorted(value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
 
 
 class MatchState(Enum):
@@ -33,59 +65,234 @@ class PointOutcome(Enum):
     REGULAR_PLAY = "regular_play"
 
 
-@dataclass
+# PointOutcome for each kernel outcome code
+_POINT_OUTCOMES = (
+    PointOutcome.ACE,
+    PointOutcome.DOUBLE_FAULT,
+    PointOutcome.WINNER,
+    PointOutcome.UNFORCED_ERROR,
+    PointOutcome.REGULAR_PLAY
+)
+
+
+def _counter(index: int) -> property:
+    """Named accessor for one MatchStatistics counter"""
+    def getter(self) -> int:
+        return int(self.counters[index])
+    
+    def setter(self, value: int) -> None:
+        self.counters[index] = value
+    
+    return property(getter, setter)
+
+
 class MatchStatistics:
-    """Comprehensive match statistics"""
-    duration_minutes: int = 0
-    total_points: int = 0
-    total_games: int = 0
-    sets_played: int = 0
+    """
+    Comprehensive match statistics
+    
+    All counters live in one int64 array (``counters``, laid out by the
+    index constants in ``_kernels``) so compiled kernels can update them in
+    place; the named attributes read and write that array.
+    """
+    __slots__ = ('counters',)
+    
+    duration_minutes = _counter(_kernels.DURATION_MINUTES)
+    total_points = _counter(_kernels.TOTAL_POINTS)
+    total_games = _counter(_kernels.TOTAL_GAMES)
+    sets_played = _counter(_kernels.SETS_PLAYED)
     
     # Player statistics
-    p1_points_won: int = 0
-    p1_games_won: int = 0
-    p1_sets_won: int = 0
-    p1_aces: int = 0
-    p1_double_faults: int = 0
-    p1_break_points_won: int = 0
-    
-    p2_points_won: int = 0
-    p2_games_won: int = 0
-    p2_sets_won: int = 0
-    p2_aces: int = 0
-    p2_double_faults: int = 0
-    p2_break_points_won: int = 0
+    p1_points_won = _counter(_kernels.P1_POINTS_WON)
+    p1_games_won = _counter(_kernels.P1_GAMES_WON)
+    p1_sets_won = _counter(_kernels.P1_SETS_WON)
+    p1_aces = _counter(_kernels.P1_ACES)
+    p1_double_faults = _counter(_kernels.P1_DOUBLE_FAULTS)
+    p1_break_points_won = _counter(_kernels.P1_BREAK_POINTS_WON)
+    
+    p2_points_won = _counter(_kernels.P2_POINTS_WON)
+    p2_games_won = _counter(_kernels.P2_GAMES_WON)
+    p2_sets_won = _counter(_kernels.P2_SETS_WON)
+    p2_aces = _counter(_kernels.P2_ACES)
+    p2_double_faults = _counter(_kernels.P2_DOUBLE_FAULTS)
+    p2_break_points_won = _counter(_kernels.P2_BREAK_POINTS_WON)
     
     # Dynamic factors
-    momentum_swings: int = 0
+    momentum_swings = _counter(_kernels.MOMENTUM_SWINGS)
+    
+    def __init__(self, **counts: int):
+        self.counters = np.zeros(_kernels.STAT_COUNT, dtype=np.int64)
+        for name, value in counts.items():
+            if not isinstance(getattr(type(self), name, None), property):
+                raise TypeError(f"MatchStatistics got an unexpected keyword argument {name!r}")
+            setattr(self, name, value)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MatchStatistics):
+            return NotImplemented
+        return bool(np.array_equal(self.counters, other.counters))
+    
+    def __repr__(self) -> str:
+        return f"MatchStatistics({self.counters.tolist()})"
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert statistics to dictionary"""
+        c = self.counters.tolist()
         return {
-            'duration_minutes': self.duration_minutes,
-            'total_points': self.total_points,
-            'total_games': self.total_games,
-            'sets_played': self.sets_played,
+            'duration_minutes': c[_kernels.DURATION_MINUTES],
+            'total_points': c[_kernels.TOTAL_POINTS],
+            'total_games': c[_kernels.TOTAL_GAMES],
+            'sets_played': c[_kernels.SETS_PLAYED],
             'player1': {
-                'points_won': self.p1_points_won,
-                'games_won': self.p1_games_won,
-                'sets_won': self.p1_sets_won,
-                'aces': self.p1_aces,
-                'double_faults': self.p1_double_faults,
-                'break_points_won': self.p1_break_points_won
+                'points_won': c[_kernels.P1_POINTS_WON],
+                'games_won': c[_kernels.P1_GAMES_WON],
+                'sets_won': c[_kernels.P1_SETS_WON],
+                'aces': c[_kernels.P1_ACES],
+                'double_faults': c[_kernels.P1_DOUBLE_FAULTS],
+                'break_points_won': c[_kernels.P1_BREAK_POINTS_WON]
             },
             'player2': {
-                'points_won': self.p2_points_won,
-                'games_won': self.p2_games_won,
-                'sets_won': self.p2_sets_won,
-                'aces': self.p2_aces,
-                'double_faults': self.p2_double_faults,
-                'break_points_won': self.p2_break_points_won
+                'points_won': c[_kernels.P2_POINTS_WON],
+                'games_won': c[_kernels.P2_GAMES_WON],
+                'sets_won': c[_kernels.P2_SETS_WON],
+                'aces': c[_kernels.P2_ACES],
+                'double_faults': c[_kernels.P2_DOUBLE_FAULTS],
+                'break_points_won': c[_kernels.P2_BREAK_POINTS_WON]
             },
-            'momentum_swings': self.momentum_swings
+            'momentum_swings': c[_kernels.MOMENTUM_SWINGS]
         }
 
 
+def _game_win_prob(p: float) -> float:
+    """Probability the server holds a game given their point-win probability"""
+    q = 1.0 - p
+    # Win to love, 15 or 30, or reach deuce (20 ways) and win from there
+    return p ** 4 * (1.0 + 4.0 * q + 10.0 * q * q) + 20.0 * p ** 3 * q ** 3 * p * p / (p * p + q * q)
+
+
+def _set_outcome_probs(hold1: float, hold2: float, first_server: int) -> Dict[Tuple[int, int], float]:
+    """
+    Exact set outcome distribution under the engine's set rules
+    
+    Serve alternates every game and a set at 6-6 is decided by one more game,
+    as in ``simulate_set``.
+    
+    Returns:
+        Mapping of (set_winner, first server of the next set) to probability
+    """
+    outcomes: Dict[Tuple[int, int], float] = {}
+    states = {(0, 0): 1.0}
+    
+    for games_played in range(13):
+        server = first_server if games_played % 2 == 0 else 3 - first_server
+        p1_game = hold1 if server == 1 else 1.0 - hold2
+        next_states: Dict[Tuple[int, int], float] = {}
+        
+        for (g1, g2), prob in states.items():
+            for game_winner, p in ((1, p1_game), (2, 1.0 - p1_game)):
+                n1, n2 = (g1 + 1, g2) if game_winner == 1 else (g1, g2 + 1)
+                if SET_TERMINAL[n1, n2]:
+                    next_server = first_server if (n1 + n2) % 2 == 0 else 3 - first_server
+                    key = (game_winner, next_server)
+                    outcomes[key] = outcomes.get(key, 0.0) + prob * p
+                else:
+                    next_states[(n1, n2)] = next_states.get((n1, n2), 0.0) + prob * p
+        
+        states = next_states
+    
+    return outcomes
+
+
+def _match_win_prob(p1_serve_win: float, p2_serve_win: float,
+                    sets_to_win: int, first_server: int = 1) -> float:
+    """Exact probability that player 1 wins the match from its first point"""
+    hold1 = _game_win_prob(p1_serve_win)
+    hold2 = _game_win_prob(p2_serve_win)
+    set_outcomes = {server: _set_outcome_probs(hold1, hold2, server) for server in (1, 2)}
+    memo: Dict[Tuple[int, int, int], float] = {}
+    
+    def win_from(sets1: int, sets2: int, server: int) -> float:
+        if sets1 == sets_to_win:
+            return 1.0
+        if sets2 == sets_to_win:
+            return 0.0
+        key = (sets1, sets2, server)
+        if key not in memo:
+            memo[key] = sum(
+                prob * (win_from(sets1 + 1, sets2, next_server) if set_winner == 1
+                        else win_from(sets1, sets2 + 1, next_server))
+                for (set_winner, next_server), prob in set_outcomes[server].items()
+            )
+        return memo[key]
+    
+    return win_from(0, 0, first_server)
+
+
+def simulate_match_batch_numpy(n_matches: int, p1_serve: float, p2_serve: float,
+                               sets_to_win: int = 2, first_server: int = 1,
+                               rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate independent matches with NumPy alone (no Numba required)
+    
+    Points are played at each player's fixed serve performance, without
+    momentum, pressure or fatigue. Draws and point outcomes are computed in
+    bulk for every match; only the game/set bookkeeping loops in Python.
+    
+    Args:
+        n_matches: Number of matches to simulate
+        p1_serve: Player 1's serve performance
+        p2_serve: Player 2's serve performance
+        sets_to_win: Sets needed to win a match
+        first_server: Player serving the first game
+        rng: Generator to draw from (a fresh one if omitted)
+        
+    Returns:
+        Tuple of (winners, p1_sets, p2_sets) int8 arrays
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    point_win = np.array([p1_serve, p2_serve]) * _SERVE_POINT_WEIGHT
+    # server_wins[m, k, s]: whether player s + 1 wins point k of match m on serve
+    server_wins = rng.random((n_matches, _BATCH_POINTS_PER_MATCH, 1)) < point_win
+    set_terminal = SET_TERMINAL.tolist()
+    
+    winners = np.empty(n_matches, dtype=np.int8)
+    p1_sets = np.empty(n_matches, dtype=np.int8)
+    p2_sets = np.empty(n_matches, dtype=np.int8)
+    
+    for match in range(n_matches):
+        outcomes = server_wins[match].tolist()
+        point = 0
+        server = first_server
+        sets = [0, 0]
+        
+        while sets[0] < sets_to_win and sets[1] < sets_to_win:
+            games = [0, 0]
+            set_winner = 0
+            while not set_winner:
+                p1_points = p2_points = 0
+                while True:
+                    if point == len(outcomes):
+                        # Rare long match: draw another block for it
+                        outcomes = (rng.random((_BATCH_POINTS_PER_MATCH, 1)) < point_win).tolist()
+                        point = 0
+                    if outcomes[point][server - 1] == (server == 1):
+                        p1_points += 1
+                    else:
+                        p2_points += 1
+                    point += 1
+                    if (p1_points >= 4 and p1_points - p2_points >= 2) or (p2_points >= 4 and p2_points - p1_points >= 2):
+                        break
+                games[0 if p1_points > p2_points else 1] += 1
+                server = 3 - server
+                set_winner = set_terminal[games[0]][games[1]]
+            sets[set_winner - 1] += 1
+        
+        winners[match] = 1 if sets[0] > sets[1] else 2
+        p1_sets[match] = sets[0]
+        p2_sets[match] = sets[1]
+    
+    return winners, p1_sets, p2_sets
+
+
 class EnhancedMatchEngine:
     """
     Enhanced Tennis Match Simulation Engine
@@ -94,19 +301,42 @@ class EnhancedMatchEngine:
     factor adjustments to provide highly realistic match simulations.
     """
     
-    def __init__(self, prediction_ensemble: Optional[PredictionEnsemble] = None,
+    __slots__ = (
+        'prediction_ensemble', 'surface', 'tournament_tier', 'verbose', 'use_dynamic_factors',
+        '_rng', '_rand_buf', '_rand_idx', 'match_state', 'statistics',
+        'player1', 'player2', '_players', 'current_momentum', 'pressure_level', 'crowd_factor',
+        'sets_to_win', 'current_set_scores', '_sets_played', 'current_game_score',
+        'serving_player', '_serve_perf_base', 'ai_predictions', '_player_data_cache'
+    )
+    
+    # AI predictions shared across engines, per ensemble: the ensemble's
+    # model_version when they were made, and predictions keyed on the matchup
+    # and its context in LRU order (least recent first). Weakly keyed so the
+    # cache doesn't keep ensembles alive
+    _prediction_caches: "weakref.WeakKeyDictionary[PredictionEnsemble, Tuple[int, OrderedDict[Tuple, ComprehensivePrediction]]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    
+    def __init__(self, prediction_ensemble: Optional["PredictionEnsemble"] = None,
                  surface: str = "hard", tournament_tier: str = "ATP250",
-                 verbose: bool = False, seed: Optional[int] = None):
+                 verbose: bool = False, seed: Optional[int] = None,
+                 use_dynamic_factors: bool = True):
         
         self.prediction_ensemble = prediction_ensemble
         self.surface = surface
         self.tournament_tier = tournament_tier
         self.verbose = verbose
         
-        # Set random seed for reproducibility
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
+        # With dynamic factors off every point is played at the server's base
+        # serve performance: no momentum, pressure or in-match fatigue
+        self.use_dynamic_factors = use_dynamic_factors
+        
+        # Per-engine generator (seeded for reproducibility, never the global
+        # RNGs); point simulation draws from a pre-generated buffer so RNG
+        # cost is paid in vectorized batches
+        self._rng = np.random.default_rng(seed)
+        self._rand_buf = self._rng.random(_RAND_BATCH_SIZE)
+        self._rand_idx = 0
         
         # Match state
         self.match_state = MatchState.PRE_MATCH
@@ -115,6 +345,7 @@ class EnhancedMatchEngine:
         # Players (will be set during simulation)
         self.player1: Optional[PlayerEnhanced] = None
         self.player2: Optional[PlayerEnhanced] = None
+        self._players: Tuple[Optional[PlayerEnhanced], Optional[PlayerEnhanced]] = (None, None)
         
         # Dynamic match factors
         self.current_momentum: float = 0.0  # -1.0 to 1.0
@@ -123,21 +354,35 @@ class EnhancedMatchEngine:
         
         # Match tracking
         self.sets_to_win: int = 3
-        self.current_set_scores: List[Tuple[int, int]] = []
+        self.current_set_scores: np.ndarray = np.zeros((2 * self.sets_to_win - 1, 2), dtype=np.int8)
+        self._sets_played: int = 0
         self.current_game_score: Tuple[int, int] = (0, 0)
         self.serving_player: int = 1
         
+        # Server's base serve performance for the current game, as
+        # (serving_player, performance); cleared when the game ends
+        self._serve_perf_base: Optional[Tuple[int, float]] = None
+        
         # AI prediction cache
-        self.ai_predictions: Optional[ComprehensivePrediction] = None
+        self.ai_predictions: Optional["ComprehensivePrediction"] = None
+        
+        # Prediction inputs per player: id -> (player, mutation_count, data)
+        self._player_data_cache: Dict[int, Tuple[PlayerEnhanced, int, Dict[str, Any]]] = {}
     
     def setup_match(self, player1: PlayerEnhanced, player2: PlayerEnhanced,
                    sets_to_win: int = 3, player1_serves_first: bool = True) -> None:
         """Setup the match with enhanced players"""
         self.player1 = player1
         self.player2 = player2
+        self._players = (player1, player2)
+        self._serve_perf_base = None
         self.sets_to_win = sets_to_win
         self.serving_player = 1 if player1_serves_first else 2
         
+        # Games per set, one row for each set the match can last
+        self.current_set_scores = np.zeros((2 * sets_to_win - 1, 2), dtype=np.int8)
+        self._sets_played = 0
+        
         # Initialize match state
         self.match_state = MatchState.IN_PROGRESS
         
@@ -163,17 +408,50 @@ class EnhancedMatchEngine:
             'pressure_level': self.pressure_level
         }
         
-        # Generate predictions
-        self.ai_predictions = self.prediction_ensemble.predict_match(
-            player1_data, player2_data, match_context
-        )
+        # Reuse the prediction for a matchup that has already been predicted
+        # from exactly the same inputs by the ensemble's current models
+        caches = EnhancedMatchEngine._prediction_caches
+        model_version = getattr(self.prediction_ensemble, 'model_version', 0)
+        cached = caches.get(self.prediction_ensemble)
+        if cached is None or cached[0] != model_version:
+            cached = caches[self.prediction_ensemble] = (model_version, OrderedDict())
+        cache = cached[1]
+        key = (_freeze(player1_data), _freeze(player2_data), _freeze(match_context))
+        prediction = cache.get(key)
+        
+        if prediction is None:
+            # Generate predictions
+            prediction = self.prediction_ensemble.predict_match(
+                player1_data, player2_data, match_context
+            )
+            cache[key] = prediction
+            if len(cache) > _PREDICTION_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        
+        self.ai_predictions = prediction
         
         if self.verbose:
             winner_name = self.player1.name if self.ai_predictions.winner_prediction == 1 else self.player2.name
             print(f"AI Prediction: {winner_name} wins ({self.ai_predictions.win_probability:.1%})")
     
+    @classmethod
+    def clear_prediction_cache(cls) -> None:
+        """Drop all cached AI predictions"""
+        EnhancedMatchEngine._prediction_caches.clear()
+    
     def _prepare_player_data(self, player: PlayerEnhanced) -> Dict[str, Any]:
-        """Prepare player data for AI prediction"""
+        """
+        Prepare player data for AI prediction
+        
+        The result is reused until the player's mutation_count changes.
+        """
+        version = getattr(player, 'mutation_count', 0)
+        cached = self._player_data_cache.get(id(player))
+        if cached is not None and cached[0] is player and cached[1] == version:
+            return cached[2]
+        
         data = {
             'name': player.name,
             'current_ranking': player.current_ranking,
@@ -189,6 +467,7 @@ class EnhancedMatchEngine:
             }
             data['recent_matches'] = player.api_stats.recent_matches
         
+        self._player_data_cache[id(player)] = (player, version, data)
         return data
     
     def _initialize_match_context(self) -> None:
@@ -217,25 +496,77 @@ class EnhancedMatchEngine:
         if not self.player1 or not self.player2:
             raise ValueError("Players not set up for simulation")
         
-        server = self.player1 if self.serving_player == 1 else self.player2
-        returner = self.player2 if self.serving_player == 1 else self.player1
+        if not self.use_dynamic_factors:
+            point_winner, outcome_code = self._execute_point_simulation(self._base_serve_performance())
+            self._update_point_statistics(point_winner, outcome_code)
+            return point_winner, _POINT_OUTCOMES[outcome_code]
         
-        # Get adjusted serve performance
-        serve_performance = server.get_adjusted_serve_percentage(
-            self.surface, returner.current_ranking
+        # Apply dynamic factors to the game's base serve performance
+        serve_performance = self._apply_dynamic_factors(
+            self._base_serve_performance(), self.serving_player
         )
         
-        # Apply dynamic factors
-        serve_performance = self._apply_dynamic_factors(serve_performance, self.serving_player)
-        
         # Execute point simulation
-        point_winner, outcome = self._execute_point_simulation(serve_performance)
+        point_winner, outcome_code = self._execute_point_simulation(serve_performance)
         
         # Update statistics and dynamics
-        self._update_point_statistics(point_winner, outcome)
-        self._update_dynamic_factors(point_winner, outcome)
+        self._update_point_statistics(point_winner, outcome_code)
+        self._update_dynamic_factors(point_winner, outcome_code)
         
-        return point_winner, outcome
+        return point_winner, _POINT_OUTCOMES[outcome_code]
+    
+    def simulate_points_batch(self, n: int) -> np.ndarray:
+        """
+        Simulate n points on the current server's serve in one vectorized pass
+        
+        Every point is played at the serve performance in effect when the
+        batch starts: the game score doesn't advance and momentum isn't
+        updated, but point statistics are recorded as simulate_point does.
+        With dynamic factors off this matches n simulate_point calls.
+        
+        Args:
+            n: Number of points to simulate
+            
+        Returns:
+            (n, 2) int8 array of (point_winner, outcome_code) rows
+        """
+        if not self.player1 or not self.player2:
+            raise ValueError("Players not set up for simulation")
+        
+        serve_performance = self._base_serve_performance()
+        if self.use_dynamic_factors:
+            serve_performance = self._apply_dynamic_factors(serve_performance, self.serving_player)
+        winners, outcome_codes = simulate_points(serve_performance, self.serving_player, self._take_rands(n))
+        
+        counters = self.statistics.counters
+        p1_points = int(np.count_nonzero(winners == 1))
+        counters[_kernels.TOTAL_POINTS] += n
+        counters[_kernels.P1_POINTS_WON] += p1_points
+        counters[_kernels.P2_POINTS_WON] += n - p1_points
+        server_offset = (self.serving_player - 1) * _kernels.PLAYER_STRIDE
+        counters[_kernels.P1_ACES + server_offset] += int(np.count_nonzero(outcome_codes == OUTCOME_ACE))
+        counters[_kernels.P1_DOUBLE_FAULTS + server_offset] += int(np.count_nonzero(outcome_codes == OUTCOME_DOUBLE_FAULT))
+        
+        return np.column_stack((winners, outcome_codes)).astype(np.int8)
+    
+    def _base_serve_performance(self) -> float:
+        """
+        Current server's adjusted serve percentage, computed once per game
+        
+        Surface and returner ranking don't change within a game; fatigue,
+        momentum and pressure still apply per point in _apply_dynamic_factors.
+        """
+        cached = self._serve_perf_base
+        if cached is not None and cached[0] == self.serving_player:
+            return cached[1]
+        
+        server = self._players[self.serving_player - 1]
+        returner = self._players[2 - self.serving_player]
+        serve_performance = server.get_adjusted_serve_percentage(
+            self.surface, returner.current_ranking
+        )
+        self._serve_perf_base = (self.serving_player, serve_performance)
+        return serve_performance
     
     def _apply_dynamic_factors(self, base_performance: float, serving_player: int) -> float:
         """Apply dynamic factors to adjust performance"""
@@ -249,102 +580,111 @@ class EnhancedMatchEngine:
         adjusted_performance -= self.pressure_level * 0.03
         
         # Apply fatigue
-        server = self.player1 if serving_player == 1 else self.player2
+        server = self._players[serving_player - 1]
         fatigue_effect = (1.0 - server.physical_condition.fatigue_factor) * 0.04
         adjusted_performance -= fatigue_effect
         
         # Ensure reasonable bounds
         return max(0.2, min(0.95, adjusted_performance))
     
-    def _execute_point_simulation(self, serve_performance: float) -> Tuple[int, PointOutcome]:
-        """Execute the actual point simulation"""
-        # First serve attempt
-        if random.random() <= 0.65:  # First serve in
-            if random.random() <= serve_performance:
-                # Check for ace
-                if random.random() <= 0.06:
-                    return self.serving_player, PointOutcome.ACE
-                else:
-                    return self.serving_player, PointOutcome.REGULAR_PLAY
-            else:
-                return 3 - self.serving_player, PointOutcome.WINNER
-        else:
-            # Second serve
-            if random.random() <= 0.92:  # Second serve in
-                if random.random() <= serve_performance * 0.8:
-                    return self.serving_player, PointOutcome.REGULAR_PLAY
-                else:
-                    return 3 - self.serving_player, PointOutcome.WINNER
-            else:
-                return 3 - self.serving_player, PointOutcome.DOUBLE_FAULT
+    def _refill_rands(self) -> None:
+        """Replace the uniform draw buffer with a fresh batch"""
+        self._rand_buf = self._rng.random(_RAND_BATCH_SIZE)
+        self._rand_idx = 0
+    
+    def _next_rand(self) -> float:
+        """Next uniform draw from the buffered generator"""
+        if self._rand_idx == _RAND_BATCH_SIZE:
+            self._refill_rands()
+        value = float(self._rand_buf[self._rand_idx])
+        self._rand_idx += 1
+        return value
+    
+    def _take_rands(self, n: int) -> np.ndarray:
+        """Next n uniform draws from the buffered generator"""
+        parts = []
+        while n:
+            if self._rand_idx == _RAND_BATCH_SIZE:
+                self._refill_rands()
+            take = min(n, _RAND_BATCH_SIZE - self._rand_idx)
+            parts.append(self._rand_buf[self._rand_idx:self._rand_idx + take])
+            self._rand_idx += take
+            n -= take
+        return np.concatenate(parts) if parts else np.empty(0)
     
-    def _update_point_statistics(self, winner: int, outcome: PointOutcome) -> None:
+    def _execute_point_simulation(self, serve_performance: float) -> Tuple[int, int]:
+        """Execute the actual point simulation, returning (winner, outcome code)"""
+        winner, outcome_code = simulate_point(serve_performance, self.serving_player, self._next_rand())
+        return int(winner), int(outcome_code)
+    
+    def _update_point_statistics(self, winner: int, outcome_code: int) -> None:
         """Update match statistics after a point"""
-        self.statistics.total_points += 1
-        
-        if winner == 1:
-            self.statistics.p1_points_won += 1
-        else:
-            self.statistics.p2_points_won += 1
+        counters = self.statistics.counters
+        counters[_kernels.TOTAL_POINTS] += 1
+        counters[_kernels.P1_POINTS_WON + (winner - 1) * _kernels.PLAYER_STRIDE] += 1
         
         # Update specific outcome statistics
-        if outcome == PointOutcome.ACE:
-            if self.serving_player == 1:
-                self.statistics.p1_aces += 1
-            else:
-                self.statistics.p2_aces += 1
-        elif outcome == PointOutcome.DOUBLE_FAULT:
-            if self.serving_player == 1:
-                self.statistics.p1_double_faults += 1
-            else:
-                self.statistics.p2_double_faults += 1
+        server_offset = (self.serving_player - 1) * _kernels.PLAYER_STRIDE
+        if outcome_code == OUTCOME_ACE:
+            counters[_kernels.P1_ACES + server_offset] += 1
+        elif outcome_code == OUTCOME_DOUBLE_FAULT:
+            counters[_kernels.P1_DOUBLE_FAULTS + server_offset] += 1
     
-    def _update_dynamic_factors(self, winner: int, outcome: PointOutcome) -> None:
+    def _update_dynamic_factors(self, winner: int, outcome_code: int) -> None:
         """Update dynamic match factors"""
         # Update momentum
-        momentum_change = 0.0
-        
-        if outcome == PointOutcome.ACE:
-            momentum_change = 0.15 if winner == self.serving_player else -0.15
-        elif outcome == PointOutcome.DOUBLE_FAULT:
-            momentum_change = -0.2 if winner != self.serving_player else 0.2
-        else:
-            momentum_change = 0.05 if winner == 1 else -0.05
+        momentum_change = _kernels.MOMENTUM_DELTA[outcome_code, winner - 1, self.serving_player - 1]
         
         # Apply momentum change with decay
-        self.current_momentum = max(-1.0, min(1.0, self.current_momentum * 0.95 + momentum_change))
+        self.current_momentum = max(-1.0, min(1.0, self.current_momentum * _kernels.MOMENTUM_DECAY
+                                              + float(momentum_change)))
         
         # Track momentum swings
-        if abs(momentum_change) > 0.1:
-            self.statistics.momentum_swings += 1
+        if abs(momentum_change) > _kernels.MOMENTUM_SWING:
+            self.statistics.counters[_kernels.MOMENTUM_SWINGS] += 1
     
     def simulate_game(self) -> int:
         """Simulate a complete game"""
-        points = [0, 0]  # [player1_points, player2_points]
+        if not self.player1 or not self.player2:
+            raise ValueError("Players not set up for simulation")
+        
+        server = self._players[self.serving_player - 1]
         
+        # Inputs that stay fixed for the whole game
+        serve_performance = self._base_serve_performance()
+        fatigue_penalty = (1.0 - server.physical_condition.fatigue_factor) * 0.04
+        
+        # Run the points in the compiled kernel, which also updates the point
+        # statistics in place; refill the draws if it runs dry
+        p1_points = p2_points = 0
         while True:
-            winner, outcome = self.simulate_point()
-            points[winner - 1] += 1
-            
-            # Check for game win
-            if max(points) >= 4 and abs(points[0] - points[1]) >= 2:
-                game_winner = 1 if points[0] > points[1] else 2
+            if self.use_dynamic_factors:
+                (game_winner, p1_points, p2_points,
+                 self.current_momentum, self._rand_idx) = simulate_game_core(
+                    serve_performance, self.pressure_level, fatigue_penalty,
+                    self.current_momentum, self.serving_player, p1_points, p2_points,
+                    self._rand_buf, self._rand_idx, self.statistics.counters
+                )
+            else:
+                game_winner, p1_points, p2_points, self._rand_idx = simulate_game_static(
+                    serve_performance, self.serving_player, p1_points, p2_points,
+                    self._rand_buf, self._rand_idx, self.statistics.counters
+                )
+            if game_winner:
                 break
+            self._refill_rands()
         
-        # Update game statistics
-        if game_winner == 1:
-            self.statistics.p1_games_won += 1
-        else:
-            self.statistics.p2_games_won += 1
+        self._serve_perf_base = None
         
-        self.statistics.total_games += 1
+        # Update game statistics
+        counters = self.statistics.counters
+        winner_offset = (game_winner - 1) * _kernels.PLAYER_STRIDE
+        counters[_kernels.P1_GAMES_WON + winner_offset] += 1
+        counters[_kernels.TOTAL_GAMES] += 1
         
         # Check for break points
         if self.serving_player != game_winner:
-            if game_winner == 1:
-                self.statistics.p1_break_points_won += 1
-            else:
-                self.statistics.p2_break_points_won += 1
+            counters[_kernels.P1_BREAK_POINTS_WON + winner_offset] += 1
         
         return game_winner
     
@@ -360,14 +700,13 @@ class EnhancedMatchEngine:
             self.serving_player = 3 - self.serving_player
             
             # Check for set win
-            if max(games) >= 6:
-                if abs(games[0] - games[1]) >= 2:
-                    break
-                elif max(games) == 7:  # 7-5 or 7-6 tiebreak
-                    break
+            set_winner = SET_TERMINAL[games[0], games[1]]
+            if set_winner:
+                break
         
-        set_winner = 1 if games[0] > games[1] else 2
-        self.current_set_scores.append((games[0], games[1]))
+        set_winner = int(set_winner)
+        self.current_set_scores[self._sets_played] = games
+        self._sets_played += 1
         
         # Update set statistics
         if set_winner == 1:
@@ -383,34 +722,107 @@ class EnhancedMatchEngine:
         
         return set_winner
     
-    def simulate_match(self) -> Dict[str, Any]:
-        """Simulate the complete match"""
+    def match_win_probability(self, p1_serve_win: float, p2_serve_win: float,
+                              sets_to_win: Optional[int] = None) -> float:
+        """
+        Exact probability that player 1 wins the match
+        
+        Solves the game -> set -> match recursion under the engine's scoring
+        rules instead of sampling matches.
+        
+        Args:
+            p1_serve_win: Player 1's probability of winning a point on serve
+            p2_serve_win: Player 2's probability of winning a point on serve
+            sets_to_win: Sets needed to win (defaults to the match setup)
+            
+        Returns:
+            Player 1's match win probability
+        """
+        return _match_win_prob(p1_serve_win, p2_serve_win,
+                               sets_to_win or self.sets_to_win, self.serving_player)
+    
+    def _serve_point_win_probability(self, serving_player: int) -> float:
+        """Point-win probability on serve from the current match conditions"""
+        server = self._players[serving_player - 1]
+        returner = self._players[2 - serving_player]
+        serve_performance = server.get_adjusted_serve_percentage(
+            self.surface, returner.current_ranking
+        )
+        return self._apply_dynamic_factors(serve_performance, serving_player) * _SERVE_POINT_WEIGHT
+    
+    def _predict_match_outcome(self) -> Dict[str, Any]:
+        """Analytical match outcome from the current match conditions"""
+        p1_win = self.match_win_probability(
+            self._serve_point_win_probability(1), self._serve_point_win_probability(2)
+        )
+        match_winner = 1 if p1_win >= 0.5 else 2
+        
+        return {
+            'winner': match_winner,
+            'winner_name': self.player1.name if match_winner == 1 else self.player2.name,
+            'player1_win_probability': p1_win,
+            'player2_win_probability': 1.0 - p1_win
+        }
+    
+    def simulate_match(self, deterministic: bool = False) -> Dict[str, Any]:
+        """
+        Simulate the complete match
+        
+        Args:
+            deterministic: Return exact win probabilities for the current
+                match conditions instead of sampling a match
+        """
         if not self.player1 or not self.player2:
             raise ValueError("Players not set up for simulation")
         
-        match_start = datetime.now()
+        if deterministic:
+            return self._predict_match_outcome()
         
-        while (self.statistics.p1_sets_won < self.sets_to_win and 
-               self.statistics.p2_sets_won < self.sets_to_win):
-            
-            set_winner = self.simulate_set()
-            
-            # Apply fatigue between sets
+        match_start_ns = time.monotonic_ns()
+        
+        # Play every remaining set in the compiled kernel, refilling draws
+        # whenever it runs dry
+        first_set = self._sets_played
+        serve_perf, fatigue = self._per_set_serve_conditions()
+        state = np.zeros(_kernels.STATE_SIZE, dtype=np.int64)
+        state[_kernels.STATE_SERVER] = self.serving_player
+        state[_kernels.STATE_SET_INDEX] = first_set
+        while True:
+            match_over, self.current_momentum, self._rand_idx = simulate_match_fused(
+                serve_perf, fatigue, self.pressure_level, self.current_momentum,
+                self.use_dynamic_factors, self.sets_to_win, state, self._rand_buf,
+                self._rand_idx, self.statistics.counters, self.current_set_scores
+            )
+            if match_over:
+                break
+            self._refill_rands()
+        
+        self.serving_player = int(state[_kernels.STATE_SERVER])
+        self._sets_played = int(state[_kernels.STATE_SET_INDEX])
+        
+        # Apply fatigue between sets
+        for set_number in range(first_set, self._sets_played):
+            if self.verbose:
+                games1, games2 = self.current_set_scores[set_number].tolist()
+                winner_name = self.player1.name if games1 > games2 else self.player2.name
+                print(f"Set {set_number + 1} won by {winner_name}: {games1}-{games2}")
             self._apply_between_set_effects()
         
         # Match complete
         self.match_state = MatchState.MATCH_COMPLETE
-        match_duration = (datetime.now() - match_start).seconds // 60
+        match_duration = (time.monotonic_ns() - match_start_ns) // 60_000_000_000
         self.statistics.duration_minutes = match_duration
         
         # Determine match winner
         match_winner = 1 if self.statistics.p1_sets_won > self.statistics.p2_sets_won else 2
         
+        final_score = [tuple(games) for games in self.current_set_scores[:self._sets_played].tolist()]
+        
         # Create result
         result = {
             'winner': match_winner,
             'winner_name': self.player1.name if match_winner == 1 else self.player2.name,
-            'final_score': self.current_set_scores,
+            'final_score': final_score,
             'statistics': self.statistics.to_dict(),
             'ai_prediction_accuracy': self._calculate_prediction_accuracy() if self.ai_predictions else None,
             'match_duration_minutes': match_duration
@@ -422,13 +834,81 @@ class EnhancedMatchEngine:
         if self.verbose:
             winner_name = self.player1.name if match_winner == 1 else self.player2.name
             print(f"Match won by {winner_name}")
-            print(f"Final score: {self.current_set_scores}")
+            print(f"Final score: {final_score}")
             print(f"Duration: {match_duration} minutes")
         
         return result
     
+    def simulate_match_batch(self, n_matches: int) -> Dict[str, Any]:
+        """
+        Monte Carlo estimate of the match outcome over many simulated matches
+        
+        Matches run in a compiled, parallel kernel from the current match
+        conditions; between-set fatigue and player updates are not applied
+        and the engine's own match state is left untouched.
+        
+        Args:
+            n_matches: Number of matches to simulate
+            
+        Returns:
+            Dictionary with player 1's estimated win probability and the
+            per-match winners and set counts
+        """
+        if not self.player1 or not self.player2:
+            raise ValueError("Players not set up for simulation")
+        
+        p1_serve = self.player1.get_adjusted_serve_percentage(self.surface, self.player2.current_ranking)
+        p2_serve = self.player2.get_adjusted_serve_percentage(self.surface, self.player1.current_ranking)
+        p1_fatigue = (1.0 - self.player1.physical_condition.fatigue_factor) * 0.04
+        p2_fatigue = (1.0 - self.player2.physical_condition.fatigue_factor) * 0.04
+        seeds = self._rng.integers(0, 2 ** 32, size=n_matches, dtype=np.int64)
+        
+        winners, p1_sets, p2_sets = simulate_match_batch(
+            p1_serve, p2_serve, self.pressure_level, p1_fatigue, p2_fatigue,
+            self.sets_to_win, self.serving_player, seeds
+        )
+        
+        return {
+            'player1_win_probability': float(np.mean(winners == 1)) if n_matches else 0.0,
+            'winners': winners,
+            'p1_sets': p1_sets,
+            'p2_sets': p2_sets
+        }
+    
+    def _per_set_serve_conditions(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Base serve performance and fatigue penalty per remaining set
+        
+        Steps both players through the between-set effects on their current
+        physical condition, then restores it, so each row holds the
+        conditions the players would start that set with.
+        
+        Returns:
+            Two (max_sets, 2) arrays indexed by set number and player
+        """
+        max_sets = 2 * self.sets_to_win - 1
+        serve_perf = np.zeros((max_sets, 2))
+        fatigue = np.zeros((max_sets, 2))
+        saved = [replace(player.physical_condition) for player in self._players]
+        
+        try:
+            for set_number in range(self._sets_played, max_sets):
+                for index in range(2):
+                    player = self._players[index]
+                    serve_perf[set_number, index] = player.get_adjusted_serve_percentage(
+                        self.surface, self._players[1 - index].current_ranking
+                    )
+                    fatigue[set_number, index] = (1.0 - player.physical_condition.fatigue_factor) * 0.04
+                self._apply_between_set_effects()
+        finally:
+            for player, condition in zip(self._players, saved):
+                vars(player.physical_condition).update(vars(condition))
+        
+        return serve_perf, fatigue
+    
     def _apply_between_set_effects(self) -> None:
         """Apply fatigue and recovery effects between sets"""
+        self._serve_perf_base = None
         if self.player1 and self.player2:
             # Apply fatigue
             self.player1.physical_condition.apply_match_fatigue(30, 1)  # Approximate set duration
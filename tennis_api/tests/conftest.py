@@ -0,0 +1,71 @@
+"""
+Shared Test Fixtures
+
+Session-wide fixtures reused across the tennis API test modules.
+"""
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from tennis_api.clients.tennis_api_client import TennisAPIClient
+from tennis_api.config.test_config import TestConfig
+
+
+@pytest.fixture(scope="session")
+def shared_client():
+    """One mock-configured TennisAPIClient for the whole test session"""
+    client = TennisAPIClient(TestConfig.get_mock_config())
+    yield client
+    client.close()
+
+
+# The ML objects below are untrained and the tests only predict with them, so
+# one of each serves the session. Imports are deferred so modules that don't
+# use them skip loading the ML stack.
+
+@pytest.fixture(scope="session")
+def prediction_ensemble():
+    """One untrained PredictionEnsemble for the whole test session"""
+    from tennis_api.ml.ensemble import PredictionEnsemble
+    return PredictionEnsemble()
+
+
+@pytest.fixture(scope="session")
+def feature_extractor():
+    """One default-configured FeatureExtractor for the whole test session"""
+    from tennis_api.ml.feature_engineering import FeatureExtractor
+    return FeatureExtractor()
+
+
+@pytest.fixture(scope="session")
+def outcome_predictor():
+    """One untrained OutcomePredictor for the whole test session"""
+    from tennis_api.ml.prediction_models import OutcomePredictor
+    return OutcomePredictor()
+
+
+@pytest.fixture(scope="session")
+def score_predictor():
+    """One untrained ScorePredictor for the whole test session"""
+    from tennis_api.ml.prediction_models import ScorePredictor
+    return ScorePredictor()
+
+
+@pytest.fixture(scope="session")
+def upset_detector():
+    """One untrained UpsetDetector for the whole test session"""
+    from tennis_api.ml.prediction_models import UpsetDetector
+    return UpsetDetector()
+
+
+if uvloop is not None:
+    # pytest-asyncio wants a non-empty mapping, so the hook only exists when
+    # there is a faster loop to offer
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop"""
+        return {"uvloop": uvloop.new_event_loop}
@@ -1,50 +1,54 @@
-#!/usr/bin/env python3
 """
-Simple test script to verify rate limiter functionality
+Basic Functionality Tests
+
+Rate limiter checks against the shared mock-configured client; no live API
+calls are made.
 """
 
-import sys
-from pathlib import Path
-
-# Add tennis_api to path
-sys.path.insert(0, str(Path(__file__).parent))
-
-try:
-    print("Testing imports...")
-    from tennis_api.cache.rate_limiter import RateLimiter
-    print("✓ RateLimiter imported successfully")
-    
-    from tennis_api.config.api_config import get_api_config
-    print("✓ get_api_config imported successfully")
-    
-    from tennis_api.clients.base_client import APIException
-    print("✓ APIException imported successfully")
-    
-    print("\nTesting rate limiter creation...")
-    limiter = RateLimiter()
-    print("✓ RateLimiter created successfully")
-    
-    print("\nTesting basic functionality...")
-    availability = limiter.check_availability('rapidapi_tennis_live', 'normal')
-    print(f"✓ check_availability returned: {availability['available']}")
-    
-    result = limiter.acquire('rapidapi_tennis_live', 'normal')
-    print(f"✓ acquire returned: {result}")
-    
-    stats = limiter.get_usage_stats('rapidapi_tennis_live')
-    print(f"✓ get_usage_stats returned {len(stats)} fields")
-    
-    print("\nTesting configuration...")
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tennis_api.cache.rate_limiter import RateLimiter
+from tennis_api.clients.base_client import APIException
+
+
+@pytest.mark.parametrize("api_name", [
+    "rapidapi_tennis_live",
+    "rapidapi_tennis_rankings",
+    "rapidapi_tennis_stats",
+])
+def test_imports_and_rate_limiter(shared_client, api_name):
+    """Rate limiter reports availability, grants requests and tracks usage"""
+    assert issubclass(APIException, Exception)
+    limiter = shared_client.rate_limiter
+    assert isinstance(limiter, RateLimiter)
+
+    availability = limiter.check_availability(api_name, 'normal')
+    assert 'available' in availability
+
+    assert isinstance(limiter.acquire(api_name, 'normal'), bool)
+    assert len(limiter.get_usage_stats(api_name)) > 0
+
+
+def test_rate_limiter_under_contention():
+    """Concurrent acquires never grant more requests than the limit allows"""
+    limits = {'contention_api': {
+        'requests_per_minute': 500,
+        'requests_per_hour': 1000,
+        'requests_per_day': 1000,
+        'requests_per_month': 1000,
+    }}
+    limiter = RateLimiter(limits, state_file="test_contention_rate_limiter_state.json")
     try:
-        config = get_api_config()
-        print("✓ Configuration loaded successfully")
-    except Exception as e:
-        print(f"⚠️  Configuration failed (expected if no .env): {e}")
-    
-    print("\n🎉 All basic tests passed successfully!")
-    
-except Exception as e:
-    print(f"❌ Test failed: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
\ No newline at end of file
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            granted = sum(pool.map(
+                lambda _: sum(limiter.acquire('contention_api') for _ in range(50)),
+                range(16),
+            ))
+
+        assert granted == 500
+        assert limiter.usage['contention_api']['minute'] == 500
+        assert len(limiter.request_history['contention_api']['minute']) == 500
+    finally:
+        limiter.state_file.unlink(missing_ok=True)
@@ -10,150 +10,249 @@ Tests focus on:
 - Atomic file operations
 """
 
+import gc
 import os
-import tempfile
-import time
+import struct
+import threading
 import pickle
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
-from tennis_api.cache.cache_manager import CacheManager, MemoryCache
+import pytest
+
+from tennis_api.cache.cache_manager import CacheManager, MemoryCache, _CODEC_RAW, _entry_tag
+
+
+@pytest.fixture(scope="module")
+def cache_factory(tmp_path_factory):
+    """Build CacheManagers on fresh directories that pytest cleans up"""
+    def make(**kwargs):
+        return CacheManager(str(tmp_path_factory.mktemp('cache')), **kwargs)
+    return make
+
+
+class FakeClock:
+    """Manually advanced stand-in for datetime.now"""
+    
+    def __init__(self):
+        self.now = datetime(2024, 1, 1, 12, 0, 0)
+    
+    def __call__(self):
+        return self.now
+    
+    def advance(self, seconds):
+        self.now += timedelta(seconds=seconds)
+
+
+def write_entry(cache_path, entry, key, data_type):
+    """Write a cache file by hand in the layout CacheManager.set produces"""
+    with open(cache_path, 'wb') as f:
+        f.write(_entry_tag(key, data_type))
+        f.write(_CODEC_RAW)
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 class TestTTLExpiryBoundaryConditions:
     """Test TTL expiry at exact boundaries"""
     
-    def test_cache_exactly_at_ttl_boundary(self):
+    def test_cache_exactly_at_ttl_boundary(self, cache_factory):
         """Test cache entry exactly at TTL expiry time"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Set a very short TTL for testing
-            test_ttl = timedelta(seconds=1)
-            cache_manager.cache_config['test_type'] = test_ttl
-            
-            # Cache some data
-            cache_manager.set('test_key', 'test_data', 'test_type')
-            
-            # Verify it's cached
-            result = cache_manager.get('test_key', 'test_type')
-            assert result == 'test_data'
-            
-            # Wait exactly the TTL duration
-            time.sleep(1.1)  # Slightly over TTL to ensure expiry
-            
-            # Should be expired now
-            result = cache_manager.get('test_key', 'test_type')
-            assert result is None
-            assert cache_manager.stats['expired'] == 1
+        clock = FakeClock()
+        cache_manager = cache_factory(time_fn=clock)
+        
+        # Set a very short TTL for testing
+        test_ttl = timedelta(seconds=1)
+        cache_manager.cache_config['test_type'] = test_ttl
+        
+        # Cache some data
+        cache_manager.set('test_key', 'test_data', 'test_type')
+        
+        # Verify it's cached
+        result = cache_manager.get('test_key', 'test_type')
+        assert result == 'test_data'
+        
+        # Advance just past the TTL duration
+        clock.advance(1.1)
+        
+        # Should be expired now
+        result = cache_manager.get('test_key', 'test_type')
+        assert result is None
+        assert cache_manager.stats['expired'] == 1
     
-    def test_cache_just_before_ttl_expiry(self):
+    def test_cache_just_before_ttl_expiry(self, cache_factory):
         """Test cache entry just before TTL expiry"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Set TTL for testing
-            test_ttl = timedelta(seconds=2)
-            cache_manager.cache_config['test_type'] = test_ttl
-            
-            # Cache some data
-            cache_manager.set('test_key', 'test_data', 'test_type')
-            
-            # Wait just under TTL
-            time.sleep(1.5)
-            
-            # Should still be valid
-            result = cache_manager.get('test_key', 'test_type')
-            assert result == 'test_data'
-            assert cache_manager.stats['hits'] == 1
+        clock = FakeClock()
+        cache_manager = cache_factory(time_fn=clock)
+        
+        # Set TTL for testing
+        test_ttl = timedelta(seconds=2)
+        cache_manager.cache_config['test_type'] = test_ttl
+        
+        # Cache some data
+        cache_manager.set('test_key', 'test_data', 'test_type')
+        
+        # Advance to just under TTL
+        clock.advance(1.5)
+        
+        # Should still be valid
+        result = cache_manager.get('test_key', 'test_type')
+        assert result == 'test_data'
+        assert cache_manager.stats['hits'] == 1
     
-    def test_cache_startup_cleanup_ttl_boundary(self):
+    def test_cache_startup_cleanup_ttl_boundary(self, cache_factory):
         """Test startup cleanup respects TTL boundaries"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Test TTL-aware cleanup by simulating scenario where
-            # an old cache file should be cleaned up during get() operation
-            cache_manager = CacheManager(temp_dir)
-            cache_manager.cache_config['test_type'] = timedelta(seconds=1)
-            
-            # Create a cache file manually with old timestamp
-            cache_path = cache_manager._get_cache_path('test_key', 'test_type')
-            old_cache_entry = {
-                'data': 'old_data',
-                'timestamp': datetime.now() - timedelta(seconds=2),  # Expired
-                'data_type': 'test_type',
-                'key': 'test_key'
-            }
-            
-            with open(cache_path, 'wb') as f:
-                pickle.dump(old_cache_entry, f)
-            
-            # Verify file exists
-            assert cache_path.exists()
-            
-            # Try to get the expired cache - should return None and clean up
+        # Test TTL-aware cleanup by simulating scenario where
+        # an old cache file should be cleaned up during get() operation
+        cache_manager = cache_factory()
+        cache_manager.cache_config['test_type'] = timedelta(seconds=1)
+        
+        # Create a cache file manually with old timestamp
+        cache_path = cache_manager._get_cache_path('test_key', 'test_type')
+        old_cache_entry = {
+            'data': 'old_data',
+            'timestamp': datetime.now() - timedelta(seconds=2),  # Expired
+            'key': 'test_key'
+        }
+        
+        write_entry(cache_path, old_cache_entry, 'test_key', 'test_type')
+        entry_time = old_cache_entry['timestamp'].timestamp()
+        os.utime(cache_path, (entry_time, entry_time))
+        
+        # Verify file exists
+        assert cache_path.exists()
+        
+        # Try to get the expired cache - should return None and clean up
+        # from the file time alone, without unpickling it
+        with patch('pickle.load', side_effect=AssertionError("unpickled expired entry")):
             result = cache_manager.get('test_key', 'test_type')
-            assert result is None
-            assert cache_manager.stats['expired'] == 1
-            
-            # File should be cleaned up by the get() operation
-            assert not cache_path.exists()
+        assert result is None
+        assert cache_manager.stats['expired'] == 1
+        
+        # File should be cleaned up by the get() operation
+        assert not cache_path.exists()
 
 
 class TestCacheSizeTypeParsingWithUnderscores:
     """Test cache size type parsing when data_type contains underscores"""
     
-    def test_single_underscore_in_data_type(self):
+    def test_single_underscore_in_data_type(self, cache_factory):
         """Test data type with single underscore"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Cache data with underscore in type
-            cache_manager.set('key1', 'data1', 'player_stats')
-            cache_manager.set('key2', 'data2', 'player_stats')
-            
-            size_info = cache_manager.get_cache_size()
-            
-            # Should correctly parse type despite underscore
-            assert 'player_stats' in size_info['type_counts']
-            assert size_info['type_counts']['player_stats'] == 2
+        cache_manager = cache_factory()
+        
+        # Cache data with underscore in type
+        cache_manager.set('key1', 'data1', 'player_stats')
+        cache_manager.set('key2', 'data2', 'player_stats')
+        
+        size_info = cache_manager.get_cache_size()
+        
+        # Should correctly parse type despite underscore
+        assert 'player_stats' in size_info['type_counts']
+        assert size_info['type_counts']['player_stats'] == 2
     
-    def test_multiple_underscores_in_data_type(self):
+    def test_multiple_underscores_in_data_type(self, cache_factory):
         """Test data type with multiple underscores"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Cache data with multiple underscores
-            cache_manager.set('key1', 'data1', 'tournament_draw_men_singles')
-            cache_manager.set('key2', 'data2', 'tournament_draw_women_doubles')
-            
-            size_info = cache_manager.get_cache_size()
-            
-            # Should correctly parse full type names
-            assert 'tournament_draw_men_singles' in size_info['type_counts']
-            assert 'tournament_draw_women_doubles' in size_info['type_counts']
-            assert size_info['type_counts']['tournament_draw_men_singles'] == 1
-            assert size_info['type_counts']['tournament_draw_women_doubles'] == 1
+        cache_manager = cache_factory()
+        
+        # Cache data with multiple underscores
+        cache_manager.set('key1', 'data1', 'tournament_draw_men_singles')
+        cache_manager.set('key2', 'data2', 'tournament_draw_women_doubles')
+        
+        size_info = cache_manager.get_cache_size()
+        
+        # Should correctly parse full type names
+        assert 'tournament_draw_men_singles' in size_info['type_counts']
+        assert 'tournament_draw_women_doubles' in size_info['type_counts']
+        assert size_info['type_counts']['tournament_draw_men_singles'] == 1
+        assert size_info['type_counts']['tournament_draw_women_doubles'] == 1
     
-    def test_similar_type_names_with_underscores(self):
+    def test_similar_type_names_with_underscores(self, cache_factory):
         """Test similar type names that could be confused during parsing"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Cache data with similar but distinct type names
-            cache_manager.set('key1', 'data1', 'player')
-            cache_manager.set('key2', 'data2', 'player_stats')
-            cache_manager.set('key3', 'data3', 'player_stats_detailed')
-            
-            size_info = cache_manager.get_cache_size()
-            
-            # Should distinguish between similar type names
-            assert 'player' in size_info['type_counts']
-            assert 'player_stats' in size_info['type_counts']
-            assert 'player_stats_detailed' in size_info['type_counts']
-            assert size_info['type_counts']['player'] == 1
-            assert size_info['type_counts']['player_stats'] == 1
-            assert size_info['type_counts']['player_stats_detailed'] == 1
+        cache_manager = cache_factory()
+        
+        # Cache data with similar but distinct type names
+        cache_manager.set('key1', 'data1', 'player')
+        cache_manager.set('key2', 'data2', 'player_stats')
+        cache_manager.set('key3', 'data3', 'player_stats_detailed')
+        
+        size_info = cache_manager.get_cache_size()
+        
+        # Should distinguish between similar type names
+        assert 'player' in size_info['type_counts']
+        assert 'player_stats' in size_info['type_counts']
+        assert 'player_stats_detailed' in size_info['type_counts']
+        assert size_info['type_counts']['player'] == 1
+        assert size_info['type_counts']['player_stats'] == 1
+        assert size_info['type_counts']['player_stats_detailed'] == 1
+    
+    def test_type_operations_match_exact_type(self, cache_factory):
+        """Test that per-type operations don't touch types sharing a prefix"""
+        cache_manager = cache_factory()
+        cache_manager.set('key1', 'data1', 'player')
+        cache_manager.set('key2', 'data2', 'player_stats')
+        
+        assert cache_manager.warmup_cache('player')['checked'] == 1
+        assert cache_manager.invalidate_by_type('player') == 1
+        assert cache_manager.get('key2', 'player_stats') == 'data2'
+    
+    def test_types_with_same_sanitized_name_do_not_collide(self, cache_factory):
+        """Test that one key under types sanitizing alike keeps separate entries"""
+        cache_manager = cache_factory()
+        cache_manager.set('key', 'dotted', 'player.stats')
+        cache_manager.set('key', 'underscored', 'player_stats')
+        
+        assert cache_manager.get('key', 'player.stats') == 'dotted'
+        assert cache_manager.get('key', 'player_stats') == 'underscored'
+
+
+class TestCacheSizeScanReuse:
+    """Test reuse of the directory scan behind get_cache_size"""
+    
+    def test_repeated_calls_reuse_scan(self, cache_factory):
+        """Test that back-to-back calls don't rescan an unchanged directory"""
+        cache_manager = cache_factory()
+        cache_manager.set('key1', 'data1', 'player')
+        
+        first = cache_manager.get_cache_size()
+        with patch.object(Path, 'glob', side_effect=AssertionError("rescanned")):
+            second = cache_manager.get_cache_size()
+        
+        assert second['total_files'] == first['total_files'] == 1
+        second['type_counts']['player'] = 99
+        assert cache_manager.get_cache_size()['type_counts']['player'] == 1
+    
+    def test_writes_and_removals_refresh_scan(self, cache_factory):
+        """Test that changes made through the manager show up immediately"""
+        cache_manager = cache_factory()
+        cache_manager.set('key1', 'data1', 'player')
+        assert cache_manager.get_cache_size()['total_files'] == 1
+        
+        cache_manager.set('key2', 'data2', 'player')
+        assert cache_manager.get_cache_size()['total_files'] == 2
+        
+        cache_manager.invalidate('key1', 'player')
+        assert cache_manager.get_cache_size()['total_files'] == 1
+        
+        cache_manager.clear_all()
+        assert cache_manager.get_cache_size()['total_files'] == 0
+    
+    def test_index_matches_directory_and_rescans_on_request(self, cache_factory):
+        """Test that tracked totals match disk and external writes need a rescan"""
+        cache_manager = cache_factory()
+        cache_manager.get_cache_size()
+        cache_manager.set('key1', {'data': 'x' * 500}, 'player_stats')
+        cache_manager.set('key1', {'data': 'x' * 50}, 'player_stats')
+        cache_manager.set('key2', 'data2', 'rankings')
+        
+        tracked = cache_manager.get_cache_size()
+        on_disk = sum(p.stat().st_size for p in cache_manager.cache_dir.glob("*.cache"))
+        assert tracked['total_size_bytes'] == on_disk
+        assert tracked['type_counts'] == {'player_stats': 1, 'rankings': 1}
+        
+        # Another manager writing to the same directory isn't seen until a rescan
+        CacheManager(cache_manager.cache_dir).set('key3', 'data3', 'rankings')
+        assert cache_manager.get_cache_size()['total_files'] == 2
+        assert cache_manager.get_cache_size(cached=False)['type_counts']['rankings'] == 2
 
 
 class TestMemoryCacheCollisions:
@@ -174,6 +273,30 @@ class TestMemoryCacheCollisions:
         assert memory_cache.get('key1', 'player_stats_detailed') == 'data3'
         assert memory_cache.size() == 3
     
+    def test_memory_cache_ttl_follows_injected_clock(self):
+        """Test that memory entries expire against the supplied clock"""
+        clock = FakeClock()
+        memory_cache = MemoryCache(max_size=10, time_fn=clock)
+        memory_cache.memory_ttl['test_type'] = timedelta(seconds=1)
+        memory_cache.set('key1', 'data1', 'test_type')
+        
+        clock.advance(1)
+        assert memory_cache.get('key1', 'test_type') == 'data1'
+        clock.advance(0.1)
+        assert memory_cache.get('key1', 'test_type') is None
+        assert memory_cache.size() == 0
+    
+    def test_memory_cache_set_many_keeps_most_recent(self):
+        """Test that a bulk insert trims to capacity and keeps LRU order"""
+        memory_cache = MemoryCache(max_size=3)
+        memory_cache.set('old', 'data', 'test')
+        memory_cache.set_many([(f'key{i}', f'value{i}', 'test') for i in range(4)])
+        
+        assert memory_cache.size() == 3
+        assert memory_cache.get('old', 'test') is None
+        assert memory_cache.get('key0', 'test') is None
+        assert [memory_cache.get(f'key{i}', 'test') for i in (1, 2, 3)] == ['value1', 'value2', 'value3']
+    
     def test_memory_cache_type_suffix_collision(self):
         """Test memory cache with types that share suffixes"""
         memory_cache = MemoryCache(max_size=100)
@@ -223,300 +346,482 @@ class TestMemoryCacheCollisions:
         assert memory_cache.get('key', 'type2') is None     # Evicted
         assert memory_cache.get('key', 'type3') == 'data3'  # Still there
         assert memory_cache.get('key', 'type4') == 'data4'  # New entry
+    
+    def test_memory_cache_evicts_one_entry_at_capacity(self):
+        """Test that a full cache drops only its least recently used entry"""
+        memory_cache = MemoryCache(max_size=20)
+        
+        for i in range(25):
+            memory_cache.set(f'key{i}', i, 'player')
+        
+        assert memory_cache.size() == 20
+        assert memory_cache.get('key4', 'player') is None
+        assert memory_cache.get('key5', 'player') == 5
+
+
+class TestCacheManagerMemoryLayer:
+    """Test the in-memory layer CacheManager checks before disk"""
+    
+    def test_repeat_get_served_from_memory(self, cache_factory):
+        """Test that written and loaded entries are returned without unpickling"""
+        cache_manager = cache_factory()
+        cache_manager.set('key1', {'rank': 1}, 'rankings')
+        
+        with patch('pickle.load', side_effect=AssertionError("read from disk")):
+            assert cache_manager.get('key1', 'rankings') == {'rank': 1}
+        assert cache_manager.stats['hits'] == 1
+        
+        # A fresh manager loads from disk once, then remembers
+        other = CacheManager(cache_manager.cache_dir)
+        assert other.get('key1', 'rankings') == {'rank': 1}
+        with patch('pickle.load', side_effect=AssertionError("read from disk")):
+            assert other.get('key1', 'rankings') == {'rank': 1}
+    
+    def test_large_entry_loaded_from_memory_map(self, cache_factory):
+        """Test that entries above the mmap threshold round-trip without pickle.load"""
+        cache_manager = cache_factory()
+        data = {'history': list(range(10000)), 'name': 'x' * 20000}
+        cache_manager.set('key1', data, 'player_stats')
+        
+        other = CacheManager(cache_manager.cache_dir)
+        with patch('pickle.load', side_effect=AssertionError("buffered read")):
+            assert other.get('key1', 'player_stats') == data
+            assert other.warmup_cache('player_stats')['valid'] == 1
+    
+    def test_memory_entries_follow_disk_ttl_and_invalidation(self, cache_factory):
+        """Test that remembered entries expire and invalidate like disk entries"""
+        clock = FakeClock()
+        cache_manager = cache_factory(time_fn=clock)
+        cache_manager.cache_config['test_type'] = timedelta(seconds=1)
+        
+        cache_manager.set('key1', 'data1', 'test_type')
+        clock.advance(1.1)
+        assert cache_manager.get('key1', 'test_type') is None
+        assert cache_manager.stats['expired'] == 1
+        
+        cache_manager.set('key2', 'data2', 'test_type')
+        cache_manager.invalidate('key2', 'test_type')
+        assert cache_manager.get('key2', 'test_type') is None
+        
+        cache_manager.set('key3', 'data3', 'test_type')
+        cache_manager.invalidate_by_type('test_type')
+        assert cache_manager.get('key3', 'test_type') is None
 
 
 class TestWarmupForceRemovalBehavior:
     """Test warmup force=True removes only expired entries"""
     
-    def test_warmup_force_removes_only_expired(self):
+    def test_warmup_force_removes_only_expired(self, cache_factory):
         """Test that force=True only removes expired entries, not valid ones"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Set short TTL for testing
-            cache_manager.cache_config['test_type'] = timedelta(seconds=1)
-            
-            # Create valid and expired entries
-            cache_manager.set('valid_key', 'valid_data', 'test_type')
-            
-            # Create expired entry manually
-            expired_path = cache_manager._get_cache_path('expired_key', 'test_type')
-            expired_entry = {
-                'data': 'expired_data',
-                'timestamp': datetime.now() - timedelta(seconds=2),
-                'data_type': 'test_type',
-                'key': 'expired_key'
-            }
-            
-            with open(expired_path, 'wb') as f:
-                pickle.dump(expired_entry, f)
-            
-            # Run warmup with force=True
-            result = cache_manager.warmup_cache('test_type', force=True)
-            
-            # Should have processed both, expired 1, removed 1
-            assert result['checked'] == 2
-            assert result['expired'] == 1
-            assert result['removed'] == 1
-            assert result['valid'] == 1
-            
-            # Valid entry should still exist
-            assert cache_manager.get('valid_key', 'test_type') == 'valid_data'
-            
-            # Expired entry should be gone
-            assert cache_manager.get('expired_key', 'test_type') is None
+        cache_manager = cache_factory()
+        
+        # Set short TTL for testing
+        cache_manager.cache_config['test_type'] = timedelta(seconds=1)
+        
+        # Create valid and expired entries
+        cache_manager.set('valid_key', 'valid_data', 'test_type')
+        
+        # Create expired entry manually
+        expired_path = cache_manager._get_cache_path('expired_key', 'test_type')
+        expired_entry = {
+            'data': 'expired_data',
+            'timestamp': datetime.now() - timedelta(seconds=2),
+            'key': 'expired_key'
+        }
+        
+        write_entry(expired_path, expired_entry, 'expired_key', 'test_type')
+        
+        # Run warmup with force=True
+        result = cache_manager.warmup_cache('test_type', force=True)
+        
+        # Should have processed both, expired 1, removed 1
+        assert result['checked'] == 2
+        assert result['expired'] == 1
+        assert result['removed'] == 1
+        assert result['valid'] == 1
+        
+        # Valid entry should still exist
+        assert cache_manager.get('valid_key', 'test_type') == 'valid_data'
+        
+        # Expired entry should be gone
+        assert cache_manager.get('expired_key', 'test_type') is None
     
-    def test_warmup_force_false_preserves_expired(self):
+    def test_warmup_force_false_preserves_expired(self, cache_factory):
         """Test that force=False counts but doesn't remove expired entries"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Set short TTL for testing
-            cache_manager.cache_config['test_type'] = timedelta(seconds=1)
-            
-            # Create expired entry manually
-            expired_path = cache_manager._get_cache_path('expired_key', 'test_type')
-            expired_entry = {
-                'data': 'expired_data',
-                'timestamp': datetime.now() - timedelta(seconds=2),
-                'data_type': 'test_type',
-                'key': 'expired_key'
-            }
-            
-            with open(expired_path, 'wb') as f:
-                pickle.dump(expired_entry, f)
-            
-            # Run warmup with force=False
-            result = cache_manager.warmup_cache('test_type', force=False)
-            
-            # Should count expired but not remove
-            assert result['checked'] == 1
-            assert result['expired'] == 1
-            assert result['removed'] == 0
-            
-            # Expired file should still exist
-            assert expired_path.exists()
+        cache_manager = cache_factory()
+        
+        # Set short TTL for testing
+        cache_manager.cache_config['test_type'] = timedelta(seconds=1)
+        
+        # Create expired entry manually
+        expired_path = cache_manager._get_cache_path('expired_key', 'test_type')
+        expired_entry = {
+            'data': 'expired_data',
+            'timestamp': datetime.now() - timedelta(seconds=2),
+            'key': 'expired_key'
+        }
+        
+        write_entry(expired_path, expired_entry, 'expired_key', 'test_type')
+        
+        # Run warmup with force=False
+        result = cache_manager.warmup_cache('test_type', force=False)
+        
+        # Should count expired but not remove
+        assert result['checked'] == 1
+        assert result['expired'] == 1
+        assert result['removed'] == 0
+        
+        # Expired file should still exist
+        assert expired_path.exists()
+    
+    def test_warmup_skips_loading_entries_expired_by_mtime(self, cache_factory):
+        """Test that warmup expires stamped files without unpickling them"""
+        clock = FakeClock()
+        cache_manager = cache_factory(time_fn=clock)
+        cache_manager.cache_config['test_type'] = timedelta(seconds=1)
+        cache_manager.set('old_key', 'old_data', 'test_type')
+        clock.advance(2)
+        
+        with patch('pickle.load', side_effect=AssertionError("unpickled expired entry")):
+            result = cache_manager.warmup_cache('test_type', force=True)
+        
+        assert result['checked'] == 1
+        assert result['removed'] == 1
+        assert cache_manager.get_cache_size()['total_files'] == 0
+    
+    def test_warmup_restores_gc_state(self, cache_factory):
+        """Test that warmup pauses the collector and restores its prior state"""
+        cache_manager = cache_factory()
+        cache_manager.set('key', {'nested': [1, 2, 3]}, 'test_type')
+        
+        states = []
+        real_load = pickle.load
+        
+        def tracking_load(f):
+            states.append(gc.isenabled())
+            return real_load(f)
+        
+        assert gc.isenabled()
+        with patch('pickle.load', side_effect=tracking_load):
+            assert cache_manager.warmup_cache('test_type')['valid'] == 1
+        assert states == [False]
+        assert gc.isenabled()
+        
+        gc.disable()
+        try:
+            cache_manager.warmup_cache('test_type')
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
 
 
 class TestCacheIntegrityValidation:
     """Test cache integrity validation behavior"""
     
-    def test_get_detects_key_mismatch(self):
+    def test_get_detects_key_mismatch(self, cache_factory):
         """Test that get() detects and handles key mismatches"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Create corrupted cache entry with wrong key
-            cache_path = cache_manager._get_cache_path('requested_key', 'test_type')
-            corrupted_entry = {
-                'data': 'test_data',
-                'timestamp': datetime.now(),
-                'data_type': 'test_type',
-                'key': 'different_key'  # Wrong key!
-            }
-            
-            with open(cache_path, 'wb') as f:
-                pickle.dump(corrupted_entry, f)
-            
-            # Should detect corruption and return None
+        cache_manager = cache_factory()
+        
+        # Create corrupted cache entry with wrong key
+        cache_path = cache_manager._get_cache_path('requested_key', 'test_type')
+        corrupted_entry = {
+            'data': 'test_data',
+            'timestamp': datetime.now(),
+            'key': 'different_key'
+        }
+        
+        # Tagged for a different key
+        write_entry(cache_path, corrupted_entry, 'different_key', 'test_type')
+        
+        # Should detect corruption from the tag alone and return None
+        with patch('pickle.load', side_effect=AssertionError("unpickled mismatched entry")):
             result = cache_manager.get('requested_key', 'test_type')
-            assert result is None
-            assert cache_manager.stats['misses'] == 1
-            
-            # Corrupted file should be removed
-            assert not cache_path.exists()
+        assert result is None
+        assert cache_manager.stats['misses'] == 1
+        
+        # Corrupted file should be removed
+        assert not cache_path.exists()
     
-    def test_get_detects_data_type_mismatch(self):
+    def test_get_detects_data_type_mismatch(self, cache_factory):
         """Test that get() detects and handles data type mismatches"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Create corrupted cache entry with wrong data type
-            cache_path = cache_manager._get_cache_path('test_key', 'requested_type')
-            corrupted_entry = {
-                'data': 'test_data',
-                'timestamp': datetime.now(),
-                'data_type': 'different_type',  # Wrong type!
-                'key': 'test_key'
-            }
-            
-            with open(cache_path, 'wb') as f:
-                pickle.dump(corrupted_entry, f)
-            
-            # Should detect corruption and return None
+        cache_manager = cache_factory()
+        
+        # Create corrupted cache entry with wrong data type
+        cache_path = cache_manager._get_cache_path('test_key', 'requested_type')
+        corrupted_entry = {
+            'data': 'test_data',
+            'timestamp': datetime.now(),
+            'key': 'test_key'
+        }
+        
+        # Tagged for a different data type
+        write_entry(cache_path, corrupted_entry, 'test_key', 'different_type')
+        
+        # Should detect corruption from the tag alone and return None
+        with patch('pickle.load', side_effect=AssertionError("unpickled mismatched entry")):
             result = cache_manager.get('test_key', 'requested_type')
-            assert result is None
-            assert cache_manager.stats['misses'] == 1
-            
-            # Corrupted file should be removed
-            assert not cache_path.exists()
+        assert result is None
+        assert cache_manager.stats['misses'] == 1
+        
+        # Corrupted file should be removed
+        assert not cache_path.exists()
     
-    def test_get_cache_info_validates_integrity(self):
+    def test_get_cache_info_validates_integrity(self, cache_factory):
         """Test that get_cache_info() also validates cache integrity"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Create corrupted cache entry
-            cache_path = cache_manager._get_cache_path('test_key', 'test_type')
-            corrupted_entry = {
-                'data': 'test_data',
-                'timestamp': datetime.now(),
-                'data_type': 'wrong_type',  # Wrong type!
-                'key': 'test_key'
-            }
-            
-            with open(cache_path, 'wb') as f:
-                pickle.dump(corrupted_entry, f)
-            
-            # Should detect corruption and return None
-            result = cache_manager.get_cache_info('test_key', 'test_type')
-            assert result is None
+        cache_manager = cache_factory()
+        
+        # Create corrupted cache entry
+        cache_path = cache_manager._get_cache_path('test_key', 'test_type')
+        corrupted_entry = {
+            'data': 'test_data',
+            'timestamp': datetime.now(),
+            'key': 'test_key'
+        }
+        
+        # Tagged for a different data type
+        write_entry(cache_path, corrupted_entry, 'test_key', 'wrong_type')
+        
+        # Should detect corruption and return None
+        result = cache_manager.get_cache_info('test_key', 'test_type')
+        assert result is None
+
+
+class TestRegisteredSchemas:
+    """Test per-type codecs registered in place of pickle"""
+    
+    def test_registered_schema_round_trips_compactly(self, cache_factory):
+        """Test that a registered schema replaces pickle and produces smaller files"""
+        def pack_points(points):
+            return struct.pack(f'<{len(points)}i', *points)
+        
+        def unpack_points(raw):
+            return list(struct.unpack(f'<{len(raw) // 4}i', raw))
+        
+        points = list(range(100000, 102000, 7))
+        cache_manager = cache_factory()
+        cache_manager.set('pickled', points, 'ranking_points')
+        cache_manager.register_schema('ranking_points', pack_points, unpack_points)
+        cache_manager.set('packed', points, 'ranking_points')
+        
+        pickled_size = cache_manager._get_cache_path('pickled', 'ranking_points').stat().st_size
+        packed_size = cache_manager._get_cache_path('packed', 'ranking_points').stat().st_size
+        assert packed_size < pickled_size
+        
+        other = CacheManager(cache_manager.cache_dir)
+        other.register_schema('ranking_points', pack_points, unpack_points)
+        with patch('pickle.load', side_effect=AssertionError("unpickled schema entry")):
+            assert other.get('packed', 'ranking_points') == points
+        assert other.get('pickled', 'ranking_points') == points
+        assert other.get_cache_info('packed', 'ranking_points')['key'] == 'packed'
+        
+        # Without the schema the entry can't be decoded and is dropped
+        assert CacheManager(cache_manager.cache_dir).get('packed', 'ranking_points') is None
 
 
 class TestAtomicFileOperations:
     """Test atomic file operation behavior"""
     
-    def test_set_atomic_write_failure_cleanup(self):
+    def test_set_atomic_write_failure_cleanup(self, cache_factory):
         """Test that failed atomic writes clean up temporary files"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Mock tempfile to simulate failure after temp file creation
-            with patch('tempfile.NamedTemporaryFile') as mock_tempfile:
-                mock_temp = MagicMock()
-                mock_temp.name = os.path.join(temp_dir, 'temp_file')
-                mock_temp.fileno.return_value = 1  # Return valid integer
-                mock_temp.__enter__ = MagicMock(return_value=mock_temp)
-                mock_temp.__exit__ = MagicMock(return_value=None)
-                mock_tempfile.return_value = mock_temp
-                
-                # Create temp file manually to simulate partial creation
-                Path(mock_temp.name).touch()
-                
-                # Mock os.replace to fail
-                with patch('os.replace', side_effect=OSError("Simulated failure")):
-                    # Should handle the error gracefully
-                    cache_manager.set('test_key', 'test_data', 'test_type')
-                
-                # Verify error was handled gracefully (no cache file created)
-                cache_path = cache_manager._get_cache_path('test_key', 'test_type')
-                assert not cache_path.exists(), "Cache file should not exist after failed atomic write"
-    
-    def test_set_pickle_error_handling(self):
-        """Test handling of pickle errors during cache set"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Create an object that can't be pickled
-            unpicklable_data = lambda x: x  # Functions can't be pickled
-            
-            # Should handle pickle error gracefully (no exception raised)
-            cache_manager.set('test_key', unpicklable_data, 'test_type')
-            
-            # Should not have created any cache file
+        cache_manager = cache_factory()
+        
+        # Hand out a real temp file so the cleanup can be observed
+        temp_path = str(cache_manager.cache_dir / 'temp_file')
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        with patch('tempfile.mkstemp', return_value=(fd, temp_path)):
+            # Mock os.replace to fail
+            with patch('os.replace', side_effect=OSError("Simulated failure")):
+                # Should handle the error gracefully
+                cache_manager.set('test_key', 'test_data', 'test_type')
+            
+            assert not os.path.exists(temp_path), "Temp file should be removed after failed atomic write"
+            
+            # Verify error was handled gracefully (no cache file created)
             cache_path = cache_manager._get_cache_path('test_key', 'test_type')
-            assert not cache_path.exists(), "Cache file should not exist after pickle error"
-            
-            # Verify that get returns None (no cache entry exists)
-            result = cache_manager.get('test_key', 'test_type')
-            assert result is None, "Should return None when no cache entry exists"
+            assert not cache_path.exists(), "Cache file should not exist after failed atomic write"
+    
+    def test_commit_publishes_all_entries(self, cache_factory):
+        """Test that a committed batch is fully visible and leaves no staging files"""
+        cache_manager = cache_factory()
+        cache_manager.get_cache_size()
+        
+        written = cache_manager.commit({
+            ('key1', 'player_stats'): {'rank': 1},
+            ('key2', 'rankings'): [1, 2, 3],
+        })
+        
+        assert written == 2
+        assert cache_manager.stats['writes'] == 2
+        assert cache_manager.get_cache_size()['type_counts'] == {'player_stats': 1, 'rankings': 1}
+        assert all(name.endswith('.cache') for name in os.listdir(cache_manager.cache_dir))
+        
+        other = CacheManager(cache_manager.cache_dir)
+        assert other.get('key1', 'player_stats') == {'rank': 1}
+        assert other.get('key2', 'rankings') == [1, 2, 3]
+    
+    def test_commit_failure_publishes_nothing(self, cache_factory):
+        """Test that a write failing partway through a batch leaves neither entry visible"""
+        cache_manager = cache_factory()
+        real_write = os.write
+        calls = []
+        
+        def failing_write(fd, data):
+            calls.append(fd)
+            if len(calls) == 2:
+                raise OSError("Simulated crash between entries")
+            return real_write(fd, data)
+        
+        with patch('os.write', side_effect=failing_write):
+            written = cache_manager.commit({
+                ('key1', 'test_type'): 'data1',
+                ('key2', 'test_type'): 'data2',
+            })
+        
+        assert written == 0
+        assert os.listdir(cache_manager.cache_dir) == []
+        assert cache_manager.get('key1', 'test_type') is None
+        assert cache_manager.get('key2', 'test_type') is None
+    
+    def test_set_pickle_error_handling(self, cache_factory):
+        """Test handling of pickle errors during cache set"""
+        cache_manager = cache_factory()
+        
+        # Create an object that can't be pickled
+        unpicklable_data = lambda x: x  # Functions can't be pickled
+        
+        # Should handle pickle error gracefully (no exception raised)
+        cache_manager.set('test_key', unpicklable_data, 'test_type')
+        
+        # Should not have created any cache file
+        cache_path = cache_manager._get_cache_path('test_key', 'test_type')
+        assert not cache_path.exists(), "Cache file should not exist after pickle error"
+        
+        # Verify that get returns None (no cache entry exists)
+        result = cache_manager.get('test_key', 'test_type')
+        assert result is None, "Should return None when no cache entry exists"
+    
+    def test_set_unpicklable_data_creates_no_files(self, cache_factory):
+        """Test that objects pickle rejects with TypeError fail before any file is written"""
+        cache_manager = cache_factory()
+        
+        with patch('tempfile.mkstemp', side_effect=AssertionError("temp file created")):
+            cache_manager.set('test_key', threading.Lock(), 'test_type')
+        
+        assert cache_manager.stats['pickle_errors'] == 1
+        assert cache_manager.stats['writes'] == 0
+        assert os.listdir(cache_manager.cache_dir) == []
 
 
 class TestExpandedErrorHandling:
     """Test expanded error handling for pickle operations"""
     
-    def test_get_handles_eoferror(self):
+    def test_get_handles_eoferror(self, cache_factory):
         """Test that get() handles EOFError from truncated pickle files"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Create truncated/corrupted pickle file
-            cache_path = cache_manager._get_cache_path('test_key', 'test_type')
-            
-            # Write partial pickle data that will cause EOFError
-            with open(cache_path, 'wb') as f:
-                f.write(b'\x80\x03}')  # Incomplete pickle data
+        cache_manager = cache_factory()
+        
+        # Create truncated/corrupted pickle file
+        cache_path = cache_manager._get_cache_path('test_key', 'test_type')
+        
+        # Write partial pickle data that will cause EOFError
+        with open(cache_path, 'wb') as f:
+            # Valid tag, codec and protocol header, then an unfinished dict
+            f.write(_entry_tag('test_key', 'test_type'))
+            f.write(_CODEC_RAW)
+            f.write(pickle.PROTO + bytes([pickle.HIGHEST_PROTOCOL]) + pickle.EMPTY_DICT)
+        
+        # Should handle EOFError gracefully
+        result = cache_manager.get('test_key', 'test_type')
+        assert result is None
+        assert cache_manager.stats['misses'] == 1
+        
+        # Corrupted file should be cleaned up
+        assert not cache_path.exists()
+    
+    def test_get_handles_attributeerror(self, cache_factory):
+        """Test that get() handles AttributeError from malformed pickle"""
+        cache_manager = cache_factory()
+        
+        cache_path = cache_manager._get_cache_path('test_key', 'test_type')
+        
+        # Mock pickle.load to raise AttributeError
+        with patch('pickle.load', side_effect=AttributeError("Malformed pickle")):
+            # Create dummy file
+            cache_path.touch()
             
-            # Should handle EOFError gracefully
+            # Should handle AttributeError gracefully
             result = cache_manager.get('test_key', 'test_type')
             assert result is None
             assert cache_manager.stats['misses'] == 1
-            
-            # Corrupted file should be cleaned up
-            assert not cache_path.exists()
     
-    def test_get_handles_attributeerror(self):
-        """Test that get() handles AttributeError from malformed pickle"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            cache_path = cache_manager._get_cache_path('test_key', 'test_type')
-            
-            # Mock pickle.load to raise AttributeError
-            with patch('pickle.load', side_effect=AttributeError("Malformed pickle")):
-                # Create dummy file
-                cache_path.touch()
-                
-                # Should handle AttributeError gracefully
-                result = cache_manager.get('test_key', 'test_type')
-                assert result is None
-                assert cache_manager.stats['misses'] == 1
-    
-    def test_get_handles_typeerror(self):
+    def test_get_handles_typeerror(self, cache_factory):
         """Test that get() handles TypeError from unexpected pickle content"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            cache_path = cache_manager._get_cache_path('test_key', 'test_type')
+        cache_manager = cache_factory()
+        
+        cache_path = cache_manager._get_cache_path('test_key', 'test_type')
+        
+        # Mock pickle.load to raise TypeError
+        with patch('pickle.load', side_effect=TypeError("Unexpected type")):
+            # Create dummy file
+            cache_path.touch()
             
-            # Mock pickle.load to raise TypeError
-            with patch('pickle.load', side_effect=TypeError("Unexpected type")):
-                # Create dummy file
-                cache_path.touch()
-                
-                # Should handle TypeError gracefully
-                result = cache_manager.get('test_key', 'test_type')
-                assert result is None
-                assert cache_manager.stats['misses'] == 1
+            # Should handle TypeError gracefully
+            result = cache_manager.get('test_key', 'test_type')
+            assert result is None
+            assert cache_manager.stats['misses'] == 1
 
 
 class TestCacheSizeInfoTypeAnnotation:
     """Test CacheSizeInfo TypedDict return type"""
     
-    def test_get_cache_size_returns_correct_structure(self):
+    def test_get_cache_size_returns_correct_structure(self, cache_factory):
         """Test that get_cache_size returns exactly the expected structure"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_manager = CacheManager(temp_dir)
-            
-            # Add some cache entries with larger data to ensure measurable size
-            large_data1 = {'data': 'x' * 1000, 'metadata': {'items': list(range(100))}}
-            large_data2 = {'data': 'y' * 1000, 'metadata': {'items': list(range(100))}}
-            cache_manager.set('key1', large_data1, 'type1')
-            cache_manager.set('key2', large_data2, 'type2')
-            
-            # Get some cache hits/misses
-            _ = cache_manager.get('key1', 'type1')  # hit
-            _ = cache_manager.get('nonexistent', 'type1')  # miss
-            
-            size_info = cache_manager.get_cache_size()
-            
-            # Verify all required fields are present with correct types
-            assert isinstance(size_info['total_files'], int)
-            assert isinstance(size_info['total_size_bytes'], int)
-            assert isinstance(size_info['total_size_mb'], float)
-            assert isinstance(size_info['type_counts'], dict)
-            assert isinstance(size_info['hits'], int)
-            assert isinstance(size_info['misses'], int)
-            assert isinstance(size_info['expired'], int)
-            assert isinstance(size_info['writes'], int)
-            
-            # Verify values make sense
-            assert size_info['total_files'] == 2
-            assert size_info['total_size_bytes'] > 0
-            assert size_info['total_size_mb'] >= 0  # Small files can round to 0.00 MB
-            assert size_info['hits'] == 1
-            assert size_info['misses'] == 1
-            assert size_info['writes'] == 2
+        cache_manager = cache_factory()
+        
+        # Add some cache entries with larger data to ensure measurable size
+        large_data1 = {'data': 'x' * 1000, 'metadata': {'items': list(range(100))}}
+        large_data2 = {'data': 'y' * 1000, 'metadata': {'items': list(range(100))}}
+        cache_manager.set('key1', large_data1, 'type1')
+        cache_manager.set('key2', large_data2, 'type2')
+        
+        # Get some cache hits/misses
+        _ = cache_manager.get('key1', 'type1')  # hit
+        _ = cache_manager.get('nonexistent', 'type1')  # miss
+        
+        size_info = cache_manager.get_cache_size()
+        
+        # Verify all required fields are present with correct types
+        assert isinstance(size_info['total_files'], int)
+        assert isinstance(size_info['total_size_bytes'], int)
+        assert isinstance(size_info['total_size_mb'], float)
+        assert isinstance(size_info['type_counts'], dict)
+        assert isinstance(size_info['hits'], int)
+        assert isinstance(size_info['misses'], int)
+        assert isinstance(size_info['expired'], int)
+        assert isinstance(size_info['writes'], int)
+        
+        # Verify values make sense
+        assert size_info['total_files'] == 2
+        assert size_info['total_size_bytes'] > 0
+        assert size_info['total_size_mb'] >= 0  # Small files can round to 0.00 MB
+        assert size_info['hits'] == 1
+        assert size_info['misses'] == 1
+        assert size_info['writes'] == 2
+    
+    def test_large_entries_compressed_with_lz4(self, cache_factory):
+        """Test that compressible entries shrink on disk and still round-trip"""
+        pytest.importorskip("lz4.frame")
+        cache_manager = cache_factory()
+        large_data1 = {'data': 'x' * 1000, 'metadata': {'items': list(range(100))}}
+        large_data2 = {'data': 'y' * 1000, 'metadata': {'items': list(range(100))}}
+        cache_manager.set('key1', large_data1, 'type1')
+        cache_manager.set('key2', large_data2, 'type2')
+        
+        raw_size = len(pickle.dumps(large_data1)) + len(pickle.dumps(large_data2))
+        assert cache_manager.get_cache_size()['total_size_bytes'] < raw_size
+        
+        other = CacheManager(cache_manager.cache_dir)
+        assert other.get('key1', 'type1') == large_data1
+        assert other.get('key2', 'type2') == large_data2
 
 
 if __name__ == '__main__':
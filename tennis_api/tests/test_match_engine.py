@@ -0,0 +1,419 @@
+"""
+Enhanced Match Engine Tests
+
+Tests for the stochastic match simulation engine: reproducibility, score
+structure and statistics bookkeeping.
+"""
+
+import gc
+import importlib.util
+import random
+import sys
+from functools import lru_cache
+
+import numpy as np
+import pytest
+
+from tennis_api.models.enhanced_player import PlayerEnhanced
+from tennis_api.models.player_stats import PlayerStats
+from tennis_api.simulation import _kernels, enhanced_match_engine, simulate_match_batch_numpy
+from tennis_api.simulation._kernels import SET_TERMINAL, simulate_game_core, simulate_match_batch, simulate_point
+from tennis_api.simulation.enhanced_match_engine import (
+    _POINT_OUTCOMES, _SERVE_POINT_WEIGHT, EnhancedMatchEngine, MatchStatistics, PointOutcome,
+    _game_win_prob, _match_win_prob
+)
+
+
+def _run_match(seed=42, sets_to_win=2, **engine_kwargs):
+    engine = EnhancedMatchEngine(seed=seed, **engine_kwargs)
+    player1 = PlayerEnhanced(name="Player One", current_ranking=10)
+    player2 = PlayerEnhanced(name="Player Two", current_ranking=40)
+    engine.setup_match(player1, player2, sets_to_win=sets_to_win)
+    return engine, engine.simulate_match()
+
+
+def _step_match(seed=8, sets_to_win=3, **engine_kwargs):
+    """Play a match set by set through simulate_set instead of simulate_match"""
+    engine = EnhancedMatchEngine(seed=seed, **engine_kwargs)
+    player1 = PlayerEnhanced(name="Player One", current_ranking=10)
+    player2 = PlayerEnhanced(name="Player Two", current_ranking=40)
+    engine.setup_match(player1, player2, sets_to_win=sets_to_win)
+    while max(engine.statistics.p1_sets_won, engine.statistics.p2_sets_won) < sets_to_win:
+        engine.simulate_set()
+        engine._apply_between_set_effects()
+    return engine
+
+
+@pytest.fixture
+def python_kernels(monkeypatch):
+    """A fresh copy of _kernels loaded with Numba hidden, so it runs as plain Python"""
+    spec = importlib.util.spec_from_file_location("_python_kernels", _kernels.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with monkeypatch.context() as patch:
+        # Only while loading: the compiled kernels still compile lazily
+        patch.setitem(sys.modules, "numba", None)
+        spec.loader.exec_module(module)
+    assert not module.NUMBA_AVAILABLE
+    return module
+
+
+def _valid_set_score(games1, games2):
+    high, low = max(games1, games2), min(games1, games2)
+    return (high == 6 and low <= 4) or (high == 7 and low in (5, 6))
+
+
+def test_same_seed_reproduces_match():
+    """Engines with the same seed produce identical matches"""
+    _, first = _run_match(seed=7)
+    _, second = _run_match(seed=7)
+
+    assert first['final_score'] == second['final_score']
+    assert first['statistics'] == second['statistics']
+
+
+def test_match_result_structure():
+    """Completed matches have valid set scores and consistent statistics"""
+    for seed in range(5):
+        engine, result = _run_match(seed=seed, sets_to_win=3)
+        stats = result['statistics']
+        p1, p2 = stats['player1'], stats['player2']
+
+        assert max(p1['sets_won'], p2['sets_won']) == 3
+        assert result['winner'] == (1 if p1['sets_won'] == 3 else 2)
+        assert stats['sets_played'] == len(result['final_score'])
+        assert all(isinstance(score, tuple) for score in result['final_score'])
+        assert all(_valid_set_score(g1, g2) for g1, g2 in result['final_score'])
+        assert stats['total_points'] == p1['points_won'] + p2['points_won']
+        assert stats['total_games'] == p1['games_won'] + p2['games_won']
+        assert stats['total_games'] == sum(g1 + g2 for g1, g2 in result['final_score'])
+
+
+def test_game_kernel_resumes_after_running_out_of_draws():
+    """A game split across draw buffers ends the same as one run in a single buffer"""
+    rands = np.random.default_rng(3).random(600)
+    whole_counters = np.zeros(_kernels.STAT_COUNT, dtype=np.int64)
+    whole = simulate_game_core(0.6, 0.5, 0.0, 0.0, 1, 0, 0, rands, 0, whole_counters)
+
+    counters = np.zeros(_kernels.STAT_COUNT, dtype=np.int64)
+    partial = simulate_game_core(0.6, 0.5, 0.0, 0.0, 1, 0, 0, rands[:3], 0, counters)
+    assert partial[0] == 0
+    rest = simulate_game_core(0.6, 0.5, 0.0, partial[3], 1, partial[1], partial[2],
+                              rands[3:], 0, counters)
+
+    assert rest[0] == whole[0]
+    assert rest[1:3] == whole[1:3]
+    assert rest[4] + 3 == whole[4]
+    assert np.array_equal(counters, whole_counters)
+
+
+def test_point_thresholds_match_serve_tree():
+    """Single-draw point outcomes carry the serve decision tree's probabilities"""
+    perf = 0.7
+    draws = (np.arange(200_000) + 0.5) / 200_000
+    results = [simulate_point(perf, 1, r) for r in draws]
+
+    def frequency(winner, code):
+        return sum(1 for w, c in results if w == winner and c == code) / len(draws)
+
+    assert frequency(1, _kernels.OUTCOME_ACE) == pytest.approx(0.65 * perf * 0.06, abs=1e-4)
+    assert frequency(2, _kernels.OUTCOME_WINNER) == pytest.approx(0.65 * (1 - perf) + 0.35 * 0.92 * (1 - perf * 0.8), abs=1e-4)
+    assert frequency(2, _kernels.OUTCOME_DOUBLE_FAULT) == pytest.approx(0.35 * 0.08, abs=1e-4)
+    assert sum(w == 1 for w, _ in results) / len(draws) == pytest.approx(0.65 * perf + 0.35 * 0.92 * perf * 0.8, abs=1e-4)
+
+
+def test_match_statistics_counters():
+    """Named statistics read and write the shared counter array"""
+    stats = MatchStatistics(p2_aces=3)
+    stats.p1_points_won += 2
+    stats.counters[_kernels.MOMENTUM_SWINGS] += 1
+
+    assert stats.counters[_kernels.P2_ACES] == 3
+    assert stats.to_dict()['player1']['points_won'] == 2
+    assert stats.momentum_swings == 1
+    assert stats == MatchStatistics(p2_aces=3, p1_points_won=2, momentum_swings=1)
+
+
+def test_game_win_probability_closed_form():
+    """Closed-form game probability matches the point-by-point recursion"""
+    def recursive(p):
+        @lru_cache(maxsize=None)
+        def win(a, b):
+            if a >= 4 and a - b >= 2:
+                return 1.0
+            if b >= 4 and b - a >= 2:
+                return 0.0
+            if a == b == 3:
+                return p * p / (p * p + (1 - p) * (1 - p))
+            return p * win(a + 1, b) + (1 - p) * win(a, b + 1)
+        return win(0, 0)
+
+    for p in (0.3, 0.5, 0.62, 0.8):
+        assert _game_win_prob(p) == pytest.approx(recursive(p))
+
+
+def test_match_win_probability():
+    """Analytical match probabilities are consistent across servers and formats"""
+    # Equal players: serving first in one match is serving second in the other
+    assert _match_win_prob(0.6, 0.6, 2, 1) + _match_win_prob(0.6, 0.6, 2, 2) == pytest.approx(1.0)
+    assert _match_win_prob(0.65, 0.6, 3) > _match_win_prob(0.65, 0.6, 2) > 0.5
+
+    engine = EnhancedMatchEngine(seed=1)
+    player1 = PlayerEnhanced(name="Player One", current_ranking=10)
+    player2 = PlayerEnhanced(name="Player Two", current_ranking=40)
+    engine.setup_match(player1, player2, sets_to_win=2)
+    prediction = engine.simulate_match(deterministic=True)
+
+    assert prediction['player1_win_probability'] + prediction['player2_win_probability'] == pytest.approx(1.0)
+    assert engine.statistics.total_points == 0
+
+
+def test_set_terminal_table():
+    """Set table marks finished sets with their winner"""
+    assert SET_TERMINAL[6, 4] == 1 and SET_TERMINAL[5, 7] == 2 and SET_TERMINAL[7, 6] == 1
+    assert SET_TERMINAL[6, 5] == 0 and SET_TERMINAL[5, 5] == 0 and SET_TERMINAL[6, 6] == 0
+
+
+def test_match_batch_reproducible_per_seed():
+    """Batch matches depend only on their own seed"""
+    seeds = np.arange(64, dtype=np.int64)
+    winners, p1_sets, p2_sets = simulate_match_batch(0.62, 0.6, 0.5, 0.0, 0.0, 2, 1, seeds)
+    again = simulate_match_batch(0.62, 0.6, 0.5, 0.0, 0.0, 2, 1, seeds[::-1].copy())
+
+    assert np.array_equal(winners, again[0][::-1])
+    assert np.all(np.maximum(p1_sets, p2_sets) == 2)
+    assert np.array_equal(winners, np.where(p1_sets == 2, 1, 2))
+
+
+def test_engine_match_batch():
+    """Engine batch wrapper returns one result per match"""
+    engine = EnhancedMatchEngine(seed=5)
+    engine.setup_match(PlayerEnhanced(name="Player One", current_ranking=10),
+                       PlayerEnhanced(name="Player Two", current_ranking=40), sets_to_win=2)
+    batch = engine.simulate_match_batch(200)
+
+    assert len(batch['winners']) == 200
+    assert 0.0 <= batch['player1_win_probability'] <= 1.0
+    assert engine.statistics.total_points == 0
+
+
+class _CountingEnsemble:
+    """Stand-in ensemble that counts predict_match calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.model_version = 0
+
+    def predict_match(self, player1_data, player2_data, match_context):
+        self.calls += 1
+        return object()
+
+
+def test_ai_predictions_cached_per_matchup():
+    """Repeated setups of the same matchup reuse the cached prediction"""
+    EnhancedMatchEngine.clear_prediction_cache()
+    ensemble = _CountingEnsemble()
+    player1 = PlayerEnhanced(name="Player One", current_ranking=10)
+    player2 = PlayerEnhanced(name="Player Two", current_ranking=40)
+
+    predictions = []
+    for surface in ("hard", "hard", "clay"):
+        engine = EnhancedMatchEngine(prediction_ensemble=ensemble, surface=surface)
+        engine.setup_match(player1, player2)
+        predictions.append(engine.ai_predictions)
+
+    assert ensemble.calls == 2
+    assert predictions[0] is predictions[1]
+
+    EnhancedMatchEngine.clear_prediction_cache()
+    EnhancedMatchEngine(prediction_ensemble=ensemble).setup_match(player1, player2)
+    assert ensemble.calls == 3
+
+
+def test_ai_prediction_cache_keyed_on_all_player_inputs():
+    """Any change to the data the ensemble sees triggers a fresh prediction"""
+    EnhancedMatchEngine.clear_prediction_cache()
+    ensemble = _CountingEnsemble()
+    player1 = PlayerEnhanced(name="Player One", current_ranking=10)
+    player2 = PlayerEnhanced(name="Player Two", current_ranking=40)
+
+    def setup():
+        EnhancedMatchEngine(prediction_ensemble=ensemble).setup_match(player1, player2)
+
+    setup()
+    player1.surface_preference = "clay"
+    setup()
+    player2.recent_form_factor = 1.001
+    setup()
+    player1.api_stats = PlayerStats(name="Player One", recent_matches=["W", "W"])
+    setup()
+    player1.api_stats = PlayerStats(name="Player One", recent_matches=["W", "L"])
+    setup()
+    setup()
+    assert ensemble.calls == 5
+
+
+def test_ai_prediction_cache_follows_ensemble_models():
+    """Retrained ensembles predict afresh, and dropped ensembles leave the cache"""
+    EnhancedMatchEngine.clear_prediction_cache()
+    ensemble = _CountingEnsemble()
+    player1 = PlayerEnhanced(name="Player One", current_ranking=10)
+    player2 = PlayerEnhanced(name="Player Two", current_ranking=40)
+
+    EnhancedMatchEngine(prediction_ensemble=ensemble).setup_match(player1, player2)
+    ensemble.model_version += 1
+    EnhancedMatchEngine(prediction_ensemble=ensemble).setup_match(player1, player2)
+    EnhancedMatchEngine(prediction_ensemble=ensemble).setup_match(player1, player2)
+    assert ensemble.calls == 2
+
+    del ensemble
+    gc.collect()
+    assert not EnhancedMatchEngine._prediction_caches
+
+
+def test_serve_performance_computed_once_per_game(monkeypatch):
+    """Points in the same game reuse the server's base serve performance"""
+    engine = EnhancedMatchEngine(seed=3)
+    player1 = PlayerEnhanced(name="Player One", current_ranking=10)
+    player2 = PlayerEnhanced(name="Player Two", current_ranking=40)
+    engine.setup_match(player1, player2)
+
+    calls = []
+    original = PlayerEnhanced.get_adjusted_serve_percentage
+    monkeypatch.setattr(PlayerEnhanced, "get_adjusted_serve_percentage",
+                        lambda self, *args: calls.append(self.name) or original(self, *args))
+
+    for _ in range(5):
+        winner, outcome = engine.simulate_point()
+        assert winner in (1, 2) and isinstance(outcome, PointOutcome)
+    engine.serving_player = 2
+    engine.simulate_point()
+
+    assert calls == ["Player One", "Player Two"]
+
+
+def test_engines_do_not_share_random_state():
+    """Seeded engines neither touch nor depend on the global RNGs"""
+    _, expected = _run_match(seed=11)
+
+    python_state = random.getstate()
+    numpy_state = np.random.get_state()[1].copy()
+    engine = EnhancedMatchEngine(seed=11)
+    assert random.getstate() == python_state
+    assert np.array_equal(np.random.get_state()[1], numpy_state)
+
+    engine.setup_match(PlayerEnhanced(name="Player One", current_ranking=10),
+                       PlayerEnhanced(name="Player Two", current_ranking=40), sets_to_win=2)
+    EnhancedMatchEngine(seed=99)
+    random.random()
+    np.random.random()
+
+    assert engine.simulate_match()['statistics'] == expected['statistics']
+
+
+def test_static_engine_skips_dynamic_factors():
+    """With dynamic factors off, momentum never moves and stats stay consistent"""
+    engine, result = _run_match(seed=4, sets_to_win=3, use_dynamic_factors=False)
+    stats = result['statistics']
+
+    assert engine.current_momentum == 0.0
+    assert stats['momentum_swings'] == 0
+    assert stats['total_points'] == stats['player1']['points_won'] + stats['player2']['points_won']
+    assert engine.simulate_point()[0] in (1, 2)
+    assert engine.current_momentum == 0.0
+
+
+def test_match_state_uses_slots():
+    """Statistics and engines carry no per-instance __dict__"""
+    assert not hasattr(MatchStatistics(), '__dict__')
+    engine, _ = _run_match(seed=2)
+    assert not hasattr(engine, '__dict__')
+
+
+def test_fused_match_matches_set_by_set_simulation():
+    """The compiled match kernel plays the same match as simulate_set calls"""
+    engine, result = _run_match(seed=8, sets_to_win=3)
+    stepped = _step_match(seed=8, sets_to_win=3)
+
+    assert stepped.statistics.to_dict() == result['statistics']
+    assert stepped.current_set_scores.tolist() == engine.current_set_scores.tolist()
+    assert stepped.current_momentum == engine.current_momentum
+
+
+def test_player_data_reused_until_player_changes():
+    """Prediction inputs are rebuilt only after a versioned player field changes"""
+    engine = EnhancedMatchEngine()
+    player = PlayerEnhanced(name="Player One", current_ranking=10)
+
+    data = engine._prepare_player_data(player)
+    assert engine._prepare_player_data(player) is data
+
+    player.current_ranking = 5
+    refreshed = engine._prepare_player_data(player)
+    assert refreshed is not data
+    assert refreshed['current_ranking'] == 5
+
+
+def test_numpy_match_batch_agrees_with_exact_probability():
+    """NumPy-only batch win rate converges on the analytical probability"""
+    winners, p1_sets, p2_sets = simulate_match_batch_numpy(
+        4000, 0.68, 0.64, sets_to_win=2, rng=np.random.default_rng(0)
+    )
+    expected = _match_win_prob(0.68 * _SERVE_POINT_WEIGHT, 0.64 * _SERVE_POINT_WEIGHT, 2)
+
+    assert np.mean(winners == 1) == pytest.approx(expected, abs=0.03)
+    assert np.all(np.maximum(p1_sets, p2_sets) == 2)
+    assert np.array_equal(winners, np.where(p1_sets == 2, 1, 2))
+
+
+def test_point_batch_matches_single_points():
+    """A static point batch draws the same points as repeated simulate_point calls"""
+    engines = []
+    for _ in range(2):
+        engine = EnhancedMatchEngine(seed=11, use_dynamic_factors=False)
+        engine.setup_match(PlayerEnhanced(name="Player One", current_ranking=10),
+                           PlayerEnhanced(name="Player Two", current_ranking=40))
+        engines.append(engine)
+    batched, single = engines
+
+    # Long enough to cross a draw buffer refill
+    n = 5000
+    points = batched.simulate_points_batch(n)
+    expected = [single.simulate_point() for _ in range(n)]
+
+    assert points.shape == (n, 2) and points.dtype == np.int8
+    assert points[:, 0].tolist() == [winner for winner, _ in expected]
+    assert [_POINT_OUTCOMES[code] for code in points[:, 1]] == [outcome for _, outcome in expected]
+    assert batched.statistics == single.statistics
+    assert len(batched.simulate_points_batch(0)) == 0
+
+
+def test_python_kernels_match_compiled(python_kernels, monkeypatch):
+    """Without Numba the kernels run as plain Python and play the same matches"""
+    draws = np.random.default_rng(6).random(2000)
+    assert [python_kernels.simulate_point(0.7, 1, r) for r in draws] == \
+        [tuple(int(v) for v in simulate_point(0.7, 1, r)) for r in draws]
+
+    def play():
+        """Fused and game-by-game matches, with and without dynamic factors"""
+        outcomes = []
+        for dynamic in (True, False):
+            _, result = _run_match(seed=8, sets_to_win=3, use_dynamic_factors=dynamic)
+            stepped = _step_match(seed=8, sets_to_win=3, use_dynamic_factors=dynamic)
+            # Compiled with fastmath, momentum can differ in the last bit
+            outcomes.append((result['final_score'], result['statistics'], stepped.statistics.to_dict(),
+                             stepped.current_set_scores.tolist(), pytest.approx(stepped.current_momentum)))
+        return outcomes
+
+    compiled = play()
+    seeds = np.arange(16, dtype=np.int64)
+    compiled_batch = simulate_match_batch(0.62, 0.6, 0.5, 0.0, 0.0, 2, 1, seeds)
+
+    for name in ("simulate_game_core", "simulate_game_static", "simulate_match_batch",
+                 "simulate_match_fused", "simulate_point", "simulate_points"):
+        monkeypatch.setattr(enhanced_match_engine, name, getattr(python_kernels, name))
+    assert play() == compiled
+
+    numpy_state = np.random.get_state()[1].copy()
+    fallback_batch = python_kernels.simulate_match_batch(0.62, 0.6, 0.5, 0.0, 0.0, 2, 1, seeds)
+    assert all(np.array_equal(a, b) for a, b in zip(fallback_batch, compiled_batch))
+    assert np.array_equal(np.random.get_state()[1], numpy_state)
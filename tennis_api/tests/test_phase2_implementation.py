@@ -6,21 +6,14 @@ feature engineering pipeline, and enhanced match simulation.
 """
 
 import pytest
-import sys
-from pathlib import Path
 from typing import Dict, List, Any
 import json
 
-# Add tennis_api to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from models.enhanced_player import PlayerEnhanced, PhysicalCondition, MentalState, ContextualFactors
-from models.ai_player import PlayerAI, PerformanceContext, MLModel
-from models.player_stats import PlayerStats, ServeStatistics, ReturnStatistics
-from ml.feature_engineering import FeatureExtractor, FeatureConfig
-from ml.prediction_models import OutcomePredictor, ScorePredictor, UpsetDetector
-from ml.ensemble import PredictionEnsemble
-from simulation.enhanced_match_engine import EnhancedMatchEngine
+from tennis_api.models.enhanced_player import PlayerEnhanced, PhysicalCondition, MentalState, ContextualFactors
+from tennis_api.models.ai_player import PlayerAI, PerformanceContext, MLModel
+from tennis_api.models.player_stats import PlayerStats, ServeStatistics, ReturnStatistics
+from tennis_api.ml.feature_engineering import FeatureExtractor, FeatureConfig
+from tennis_api.simulation.enhanced_match_engine import EnhancedMatchEngine, PointOutcome
 
 
 class TestEnhancedPlayerModels:
@@ -128,10 +121,8 @@ class TestFeatureEngineering:
         assert extractor.config.max_features == 30
         assert extractor.config.include_ranking_features
         
-    def test_ranking_feature_extraction(self):
+    def test_ranking_feature_extraction(self, feature_extractor):
         """Test ranking feature extraction"""
-        extractor = FeatureExtractor()
-        
         player1_data = {
             'current_ranking': 5,
             'previous_ranking': 8,
@@ -144,7 +135,7 @@ class TestFeatureEngineering:
             'seed': 8
         }
         
-        features = extractor.extract_ranking_features(player1_data, player2_data)
+        features = feature_extractor.extract_ranking_features(player1_data, player2_data)
         
         assert 'ranking_difference' in features
         assert 'player1_ranking_trend' in features
@@ -155,10 +146,8 @@ class TestFeatureEngineering:
         assert features['player1_top10'] == 1.0
         assert features['player2_top10'] == 0.0
         
-    def test_form_feature_extraction(self):
+    def test_form_feature_extraction(self, feature_extractor):
         """Test form feature extraction"""
-        extractor = FeatureExtractor()
-        
         player1_data = {
             'recent_form_factor': 1.2,
             'recent_matches': ['W', 'W', 'L', 'W', 'W']
@@ -169,20 +158,18 @@ class TestFeatureEngineering:
             'recent_matches': ['L', 'W', 'L', 'L', 'W']
         }
         
-        features = extractor.extract_form_features(player1_data, player2_data)
+        features = feature_extractor.extract_form_features(player1_data, player2_data)
         
         assert 'form_advantage' in features
         assert 'player1_recent_win_rate' in features
         assert 'win_rate_difference' in features
         
-        assert features['form_advantage'] == 0.4  # 1.2 - 0.8
+        assert features['form_advantage'] == pytest.approx(0.4)  # 1.2 - 0.8
         assert features['player1_recent_win_rate'] == 0.8  # 4/5 wins
         assert features['player2_recent_win_rate'] == 0.4  # 2/5 wins
         
-    def test_surface_feature_extraction(self):
+    def test_surface_feature_extraction(self, feature_extractor):
         """Test surface-specific feature extraction"""
-        extractor = FeatureExtractor()
-        
         player1_data = {
             'surface_preference': 'clay',
             'surface_stats': {
@@ -197,7 +184,7 @@ class TestFeatureEngineering:
             }
         }
         
-        features = extractor.extract_surface_features(player1_data, player2_data, 'clay')
+        features = feature_extractor.extract_surface_features(player1_data, player2_data, 'clay')
         
         assert 'surface_type' in features
         assert 'player1_surface_match' in features
@@ -206,50 +193,43 @@ class TestFeatureEngineering:
         assert features['surface_type'] == 1  # clay encoding
         assert features['player1_surface_match'] == 1.0  # prefers clay
         assert features['player2_surface_match'] == 0.0  # prefers hard
-        assert features['surface_win_rate_diff'] == 0.2  # 0.8 - 0.6
+        assert features['surface_win_rate_diff'] == pytest.approx(0.2)  # 0.8 - 0.6
 
 
 class TestMLModels:
     """Test machine learning prediction models"""
     
-    def test_outcome_predictor_creation(self):
+    def test_outcome_predictor_creation(self, outcome_predictor):
         """Test creating outcome predictor"""
-        predictor = OutcomePredictor()
-        assert not predictor.is_trained
-        assert predictor.config.model_type == "random_forest"
+        assert not outcome_predictor.is_trained
+        assert outcome_predictor.config.model_type == "random_forest"
         
-    def test_outcome_prediction_fallback(self):
+    def test_outcome_prediction_fallback(self, outcome_predictor):
         """Test outcome prediction without training (fallback)"""
-        predictor = OutcomePredictor()
-        
         # Create dummy features
         features = [0.5] * 20
         
-        result = predictor.predict(features)
+        result = outcome_predictor.predict(features)
         
         assert result.prediction in [0, 1]
         assert 0.0 <= result.confidence <= 1.0
         assert result.model_type.value == "outcome"
         
-    def test_score_predictor_fallback(self):
+    def test_score_predictor_fallback(self, score_predictor):
         """Test score prediction without training"""
-        predictor = ScorePredictor()
-        
         features = [0.5] * 20
-        result = predictor.predict(features)
+        result = score_predictor.predict(features)
         
         assert isinstance(result.prediction, dict)
         assert 'winner_sets' in result.prediction
         assert 'duration_minutes' in result.prediction
         
-    def test_upset_detector_fallback(self):
+    def test_upset_detector_fallback(self, upset_detector):
         """Test upset detection without training"""
-        detector = UpsetDetector()
-        
         features = [0.5] * 20
         ranking_diff = 30  # Lower ranked player facing higher ranked
         
-        result = detector.predict(features, ranking_diff)
+        result = upset_detector.predict(features, ranking_diff)
         
         assert 0.0 <= result.prediction <= 1.0
         assert result.model_type.value == "upset"
@@ -258,18 +238,15 @@ class TestMLModels:
 class TestPredictionEnsemble:
     """Test AI prediction ensemble"""
     
-    def test_ensemble_creation(self):
+    def test_ensemble_creation(self, prediction_ensemble):
         """Test creating prediction ensemble"""
-        ensemble = PredictionEnsemble()
-        assert not ensemble.is_trained
-        assert ensemble.outcome_predictor is not None
-        assert ensemble.score_predictor is not None
-        assert ensemble.upset_detector is not None
+        assert not prediction_ensemble.is_trained
+        assert prediction_ensemble.outcome_predictor is not None
+        assert prediction_ensemble.score_predictor is not None
+        assert prediction_ensemble.upset_detector is not None
         
-    def test_ensemble_prediction_fallback(self):
+    def test_ensemble_prediction_fallback(self, prediction_ensemble):
         """Test ensemble prediction without training"""
-        ensemble = PredictionEnsemble()
-        
         # Create test player data
         player1_data = {
             'name': 'Player 1',
@@ -288,7 +265,7 @@ class TestPredictionEnsemble:
             'tournament_tier': 'ATP250'
         }
         
-        prediction = ensemble.predict_match(player1_data, player2_data, match_context)
+        prediction = prediction_ensemble.predict_match(player1_data, player2_data, match_context)
         
         assert prediction.winner_prediction in [0, 1]
         assert 0.0 <= prediction.win_probability <= 1.0
@@ -346,17 +323,20 @@ class TestEnhancedMatchEngine:
         
         engine.setup_match(player1, player2)
         
+        valid_winners = {1, 2}
+        valid_outcomes = {
+            PointOutcome.ACE,
+            PointOutcome.DOUBLE_FAULT,
+            PointOutcome.WINNER,
+            PointOutcome.UNFORCED_ERROR,
+            PointOutcome.REGULAR_PLAY
+        }
+        
         # Simulate a few points
         for _ in range(10):
             winner, outcome = engine.simulate_point()
-            assert winner in [1, 2]
-            assert outcome in [
-                engine.PointOutcome.ACE,
-                engine.PointOutcome.DOUBLE_FAULT,
-                engine.PointOutcome.WINNER,
-                engine.PointOutcome.UNFORCED_ERROR,
-                engine.PointOutcome.REGULAR_PLAY
-            ]
+            assert winner in valid_winners
+            assert outcome in valid_outcomes
             
     def test_match_simulation(self):
         """Test complete match simulation"""
@@ -400,14 +380,11 @@ class TestEnhancedMatchEngine:
 class TestIntegration:
     """Integration tests for Phase 2 components"""
     
-    def test_full_ai_enhanced_simulation(self):
+    def test_full_ai_enhanced_simulation(self, prediction_ensemble):
         """Test complete AI-enhanced match simulation"""
-        # Create prediction ensemble
-        ensemble = PredictionEnsemble()
-        
         # Create enhanced match engine with AI
         engine = EnhancedMatchEngine(
-            prediction_ensemble=ensemble,
+            prediction_ensemble=prediction_ensemble,
             surface="hard",
             tournament_tier="Masters1000",
             seed=42
@@ -459,50 +436,3 @@ class TestIntegration:
             assert 'winner_correct' in accuracy
             assert isinstance(accuracy['winner_correct'], bool)
 
-
-def run_phase2_tests():
-    """Run all Phase 2 tests"""
-    print("Running Phase 2 Enhanced Models Tests...")
-    
-    # Run tests
-    test_classes = [
-        TestEnhancedPlayerModels,
-        TestFeatureEngineering,
-        TestMLModels,
-        TestPredictionEnsemble,
-        TestEnhancedMatchEngine,
-        TestIntegration
-    ]
-    
-    total_tests = 0
-    passed_tests = 0
-    
-    for test_class in test_classes:
-        print(f"\n--- Testing {test_class.__name__} ---")
-        test_instance = test_class()
-        
-        # Get all test methods
-        test_methods = [method for method in dir(test_instance) if method.startswith('test_')]
-        
-        for test_method in test_methods:
-            total_tests += 1
-            try:
-                method = getattr(test_instance, test_method)
-                method()
-                print(f"✓ {test_method}")
-                passed_tests += 1
-            except Exception as e:
-                print(f"✗ {test_method}: {str(e)}")
-    
-    print(f"\n--- Test Summary ---")
-    print(f"Total tests: {total_tests}")
-    print(f"Passed: {passed_tests}")
-    print(f"Failed: {total_tests - passed_tests}")
-    print(f"Success rate: {passed_tests/total_tests*100:.1f}%")
-    
-    return passed_tests == total_tests
-
-
-if __name__ == "__main__":
-    success = run_phase2_tests()
-    exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""
+Player Statistics Model Tests
+
+Tests for PlayerStats scoring helpers and serialization round-trips.
+"""
+
+import numpy as np
+import pytest
+
+from tennis_api.models.player_stats import (
+    HeadToHeadTable, PlayerStats, PlayerStatsTable, ServeStatistics, SurfaceStats,
+    batch_form_factors, batch_surface_multipliers
+)
+
+
+def _make_players():
+    hot = PlayerStats(name="Hot Player")
+    hot.update_recent_form(["W", "W", "W", "L", "W"])
+    cold = PlayerStats(name="Cold Player")
+    cold.update_recent_form(["L", "L", "W", "L"])
+    fresh = PlayerStats(name="Fresh Player")
+    fresh.add_surface_stats("Clay", SurfaceStats(surface="clay", wins=15, losses=5))
+    return [hot, cold, fresh]
+
+
+def test_batch_form_factors_match_scalar():
+    """Batched form factors agree with calculate_form_factor"""
+    players = _make_players()
+    factors = batch_form_factors(players)
+
+    assert factors == pytest.approx([p.calculate_form_factor() for p in players])
+    assert len(batch_form_factors([])) == 0
+
+
+def test_batch_surface_multipliers_match_scalar():
+    """Batched surface multipliers agree with get_surface_multiplier"""
+    players = _make_players()
+    multipliers = batch_surface_multipliers(players, "Clay")
+
+    assert multipliers == pytest.approx([p.get_surface_multiplier("Clay") for p in players])
+
+
+def test_json_round_trip():
+    """PlayerStats survives a to_json/from_json round-trip"""
+    player = _make_players()[2]
+    player.add_head_to_head("Hot Player", 3, 1)
+    restored = PlayerStats.from_json(player.to_json())
+
+    assert restored.name == "Fresh Player"
+    assert restored.last_updated == player.last_updated
+    assert restored.surface_stats["clay"].wins == 15
+    assert restored.get_head_to_head_factor("Hot Player") == player.get_head_to_head_factor("Hot Player")
+
+
+def test_batch_h2h_factors_match_scalar():
+    """Batched head-to-head factors agree with get_head_to_head_factor"""
+    player = PlayerStats(name="Test Player")
+    player.add_head_to_head("Rival", 4, 1)
+    player.add_head_to_head("Nemesis", 0, 6)
+    player.add_head_to_head("Stranger", 0, 0)
+    opponents = ["Rival", "Nemesis", "Stranger", "Unknown"]
+
+    factors = player.batch_h2h_factors(opponents)
+
+    assert factors == pytest.approx([player.get_head_to_head_factor(o) for o in opponents])
+    assert len(player.batch_h2h_factors([])) == 0
+
+
+def test_from_json_tolerates_irregular_fields():
+    """Payloads that don't match the typed schema still load"""
+    restored = PlayerStats.from_json('{"name": "Loose Player", "age": null, "extra": 1}')
+
+    assert restored.name == "Loose Player"
+    assert restored.age is None
+
+
+def test_surface_win_percentage_tracks_record():
+    """Memoized surface win percentage updates when the record changes"""
+    stats = SurfaceStats(surface="grass", wins=3, losses=1)
+    assert stats.calculated_win_percentage == 0.75
+
+    stats.losses = 3
+    assert stats.calculated_win_percentage == 0.5
+
+    stats.wins = 0
+    stats.losses = 0
+    assert stats.calculated_win_percentage == 0.5
+
+
+def test_player_stats_table_columns():
+    """Table columns hold one row per player in input order"""
+    players = _make_players()
+    players[1].serve_stats = ServeStatistics(first_serve_percentage=0.72)
+    table = PlayerStatsTable.from_players(players)
+
+    assert len(table) == 3
+    assert list(table.names) == ["Hot Player", "Cold Player", "Fresh Player"]
+    assert table.first_serve_pct.dtype == np.float16
+    assert table.first_serve_pct == pytest.approx([0.6, 0.72, 0.6], abs=1e-3)
+    assert table.recent_form_factor == pytest.approx([p.recent_form_factor for p in players], abs=1e-3)
+    assert table.aces_per_match.dtype == np.float32
+    assert len(PlayerStatsTable.from_players([])) == 0
+
+
+def test_head_to_head_table_behaves_like_dict():
+    """Compact head-to-head storage keeps dict-of-tuples semantics"""
+    records = {f"Opponent {i}": (i, 20 - i) for i in range(20)}
+    table = HeadToHeadTable(records)
+
+    assert dict(table) == records
+    assert table["Opponent 7"] == (7, 13)
+
+    del table["Opponent 3"]
+    assert "Opponent 3" not in table
+    assert table["Opponent 19"] == (19, 1)
+    assert len(table) == 19
+
+    player = PlayerStats(name="Test Player", head_to_head={"Rival": (2, 1)})
+    assert isinstance(player.head_to_head, HeadToHeadTable)
+    assert player.to_dict()["head_to_head"] == {"Rival": [2, 1]}
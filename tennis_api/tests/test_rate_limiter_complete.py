@@ -218,15 +218,69 @@ def test_rate_limiter_state_persistence():
     stats2 = limiter2.get_usage_stats('rapidapi_tennis_live')
     print(f"Stats after loading: {stats2}")
     
+    # Clean up (state files live under the limiter's cache directory)
+    limiter2.state_file.unlink(missing_ok=True)
+    
     # Check that usage was preserved
     assert stats2['current_usage']['minute'] >= 2, "Usage should be preserved after loading"
     
-    # Clean up
-    Path(state_file).unlink(missing_ok=True)
-    
     print("✅ State persistence works correctly\n")
 
 
+def test_rate_limiter_reset():
+    """Test that reset clears every API's usage and history but keeps limits"""
+    print("=== Testing Rate Limiter Reset ===")
+    
+    limiter = RateLimiter(state_file="test_reset_rate_limiter_state.json")
+    try:
+        limiter.acquire('rapidapi_tennis_live', 'normal')
+        limiter.acquire('rapidapi_tennis_rankings', 'normal')
+        limiter.reset()
+        
+        for api_name in ('rapidapi_tennis_live', 'rapidapi_tennis_rankings'):
+            stats = limiter.get_usage_stats(api_name)
+            assert all(stats['current_usage'][period] == 0 for period in ('minute', 'hour', 'day', 'month'))
+            assert all(not history for history in limiter.request_history[api_name].values())
+        assert limiter.limits['rapidapi_tennis_live']['requests_per_minute'] == 10
+        
+        # The cleared state is what gets persisted
+        assert RateLimiter(state_file="test_reset_rate_limiter_state.json") \
+            .get_usage_stats('rapidapi_tennis_live')['current_usage']['minute'] == 0
+    finally:
+        limiter.state_file.unlink(missing_ok=True)
+    
+    print("✅ Rate limiter reset works correctly\n")
+
+
+def test_rate_limiter_skipped_save_rewritten():
+    """A save skipped while another is writing is written once that one finishes"""
+    print("=== Testing Skipped State Saves ===")
+    
+    state_file = "test_skipped_save_rate_limiter_state.json"
+    limiter = RateLimiter(state_file=state_file)
+    write_state = limiter._write_state
+    writes = []
+    
+    def write_during_request():
+        writes.append(1)
+        if len(writes) == 1:
+            # A request lands mid-write; its save finds the lock busy
+            limiter.acquire('rapidapi_tennis_live', 'normal')
+            limiter._save_state(wait=False)
+        write_state()
+    
+    limiter._write_state = write_during_request
+    try:
+        limiter._save_state()
+        assert len(writes) == 2, "The skipped save should trigger a second write"
+        assert RateLimiter(state_file=state_file) \
+            .get_usage_stats('rapidapi_tennis_live')['current_usage']['minute'] == 1
+    finally:
+        limiter.state_file.unlink(missing_ok=True)
+    
+    print("✅ Skipped saves are written afterwards\n")
+
+
 def test_rate_limiter_usage_stats():
     """Test usage statistics functionality"""
     print("=== Testing Usage Statistics ===")
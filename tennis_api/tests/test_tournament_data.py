@@ -0,0 +1,162 @@
+"""
+Tournament Data Model Tests
+
+Tests for TournamentDraw match lookups and serialization round-trips.
+"""
+
+from tennis_api.models.tournament_data import TournamentDraw, Match
+
+
+def _make_draw() -> TournamentDraw:
+    draw = TournamentDraw(
+        tournament_id="test_id",
+        tournament_name="Test Open",
+        year=2024,
+        surface="hard",
+        category="ATP 250",
+        draw_size=32,
+    )
+    draw.add_match(Match("m1", "First Round", "Player A", "Player B"))
+    draw.add_match(Match("m2", "First Round", "Player C", "Player D"))
+    draw.add_match(Match("m3", "Second Round", "Player A", "Player C"))
+    return draw
+
+
+def test_match_lookup_by_id():
+    """Matches are found by id after add_match"""
+    draw = _make_draw()
+    assert draw.get_match_by_id("m3").player2 == "Player C"
+    assert draw.get_match_by_id("missing") is None
+
+
+def test_player_matches_lookup():
+    """Player match lookup returns every match the player appears in"""
+    draw = _make_draw()
+    assert [m.match_id for m in draw.get_player_matches("Player A")] == ["m1", "m3"]
+    assert [m.match_id for m in draw.get_player_matches("Player D")] == ["m2"]
+    assert draw.get_player_matches("Nobody") == []
+
+
+def test_lookups_on_restored_draw():
+    """Lookups work on a draw restored from its dictionary form"""
+    draw = _make_draw()
+    draw.update_match_result("m1", "Player A", "6-4, 6-2", [[6, 4], [6, 2]])
+    restored = TournamentDraw.from_dict(draw.to_dict())
+
+    assert restored.get_match_by_id("m1").winner == "Player A"
+    assert [m.match_id for m in restored.get_player_matches("Player C")] == ["m2", "m3"]
+
+
+def test_lookups_follow_direct_round_edits():
+    """Lookups see matches appended, removed or replaced through rounds directly"""
+    draw = _make_draw()
+    assert draw.get_match_by_id("m4") is None
+
+    draw.rounds["Second Round"].append(Match("m4", "Second Round", "Player B", "Player D"))
+    assert draw.get_match_by_id("m4").player1 == "Player B"
+    assert [m.match_id for m in draw.get_player_matches("Player D")] == ["m2", "m4"]
+
+    del draw.rounds["First Round"]
+    assert draw.get_match_by_id("m1") is None
+    assert [m.match_id for m in draw.get_player_matches("Player A")] == ["m3"]
+
+    draw.rounds = {"Final": [Match("m9", "Final", "Player E", "Player F")]}
+    assert draw.get_match_by_id("m3") is None
+    assert draw.get_player_matches("Player E")[0].match_id == "m9"
+
+    draw.add_match(Match("m10", "Final", "Player E", "Player G"))
+    assert [m.match_id for m in draw.get_player_matches("Player E")] == ["m9", "m10"]
+
+
+def test_lookups_follow_in_place_match_edits():
+    """Lookups see a match replaced inside a round or re-keyed in place"""
+    draw = _make_draw()
+    assert draw.get_match_by_id("m1").player1 == "Player A"
+
+    draw.rounds["First Round"][0] = Match("m5", "First Round", "Player E", "Player B")
+    assert draw.get_match_by_id("m1") is None
+    assert draw.get_match_by_id("m5").player1 == "Player E"
+    assert [m.match_id for m in draw.get_player_matches("Player A")] == ["m3"]
+
+    draw.rounds["Second Round"][0].match_id = "m6"
+    assert draw.get_match_by_id("m3") is None
+    assert draw.get_match_by_id("m6").player2 == "Player C"
+
+
+def test_json_round_trip():
+    """TournamentDraw survives a to_json/from_json round-trip"""
+    draw = _make_draw()
+    draw.add_seeded_player(1, "Player A")
+    restored = TournamentDraw.from_json(draw.to_json())
+
+    assert restored.get_seed("Player A") == 1
+    assert restored.last_updated == draw.last_updated
+    assert [m.match_id for m in restored.get_round_matches("First Round")] == ["m1", "m2"]
+
+
+def test_player_names_interned():
+    """Equal player names across matches share one string object"""
+    draw = _make_draw()
+    name = "".join(["Player", " E"])
+    draw.add_match(Match("m4", "Second Round", name, "Player B"))
+    draw.add_match(Match("m5", "Quarterfinals", "".join(["Player", " E"]), "Player C"))
+
+    assert draw.get_match_by_id("m4").player1 is draw.get_match_by_id("m5").player1
+
+
+def test_round_names():
+    """Standard draws use the fixed round order, others fall back to recorded rounds"""
+    draw = _make_draw()
+    assert draw.round_names == ["First Round", "Second Round", "Quarterfinals", "Semifinals", "Final"]
+
+    draw.draw_size = 16
+    assert draw.round_names == ["First Round", "Second Round"]
+
+
+def test_get_all_players_cached():
+    """All players are collected once and reused on later calls"""
+    draw = _make_draw()
+    players = draw.get_all_players()
+
+    assert players == ["Player A", "Player B", "Player C", "Player D"]
+    assert draw.get_all_players() is players
+
+
+def test_surface_factor():
+    """Surface factor lookup ignores case and defaults to neutral"""
+    draw = TournamentDraw("t1", "Clay Open", 2024, "Clay", "ATP 250")
+    assert draw.get_tournament_surface_factor() == 0.9
+
+    indoor = TournamentDraw("t2", "Indoor Open", 2024, "Wood", "ATP 250")
+    assert indoor.get_tournament_surface_factor() == 1.0
+
+
+def test_surface_factor_follows_surface_changes():
+    """Reassigning surface changes the factor"""
+    draw = TournamentDraw("t1", "Test Open", 2024, "hard", "ATP 250")
+    assert draw.get_tournament_surface_factor() == 1.0
+    draw.surface = "clay"
+    assert draw.get_tournament_surface_factor() == 0.9
+
+
+def test_rounds_deserialized_on_access():
+    """Restored draws build a round's matches only when that round is read"""
+    data = _make_draw().to_dict()
+    data['rounds']['Second Round'] = [{'not': 'a valid match'}]
+    restored = TournamentDraw.from_dict(data)
+
+    # Reading the first round must not touch the malformed second round
+    assert [m.match_id for m in restored.get_round_matches("First Round")] == ["m1", "m2"]
+    assert "Second Round" in restored.rounds
+    assert list(restored.rounds) == ["First Round", "Second Round"]
+
+
+def test_restored_draw_matches_original():
+    """A lazily restored draw compares equal to the draw it was saved from"""
+    draw = _make_draw()
+    restored = TournamentDraw.from_dict(draw.to_dict())
+
+    assert restored == draw
+    restored.add_match(Match("m4", "Quarterfinals", "Player A", "Player E"))
+    assert restored.get_match_by_id("m4").player2 == "Player E"
+    assert len(restored.get_player_matches("Player A")) == 3